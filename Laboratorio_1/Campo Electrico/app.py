@@ -12,55 +12,60 @@ e) Gráfica de líneas de campo y equipotenciales en 2D, con marcadores de equil
 
 Uso:
     python app.py --arr two_pos --out plots/lab1
+    python app.py --arr two_pos --out plots/lab1 --workers-graficos 4 --calidad borrador
 """
 
-import numpy as np
 import argparse
-from incisos_common import (
+from campo_electrico import (
     generate_charges,
     compute_1d_along_x,
-    plot_1d,
-    compute_and_plot_2d,
-    E_en_x_factory,
-    _simple_fsolve,
-    fsolve,
+    equilibrios_en_x,
+    desviacion_precision,
 )
+from campo_electrico.graficos import calcular_2d, trabajos_1d, trabajos_2d
+from campo_electrico.render import renderizar
 
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Laboratorio 1: campo y potencial de 3 cargas')
     parser.add_argument('--arr', choices=['two_pos', 'two_neg'], default='two_pos')
     parser.add_argument('--out', type=str, default='plots/lab1')
+    parser.add_argument('--workers', type=int, default=1, help='procesos para evaluar la malla 2D en paralelo')
+    parser.add_argument('--no-cache', action='store_true', help='recalcular la malla 2D sin usar el cache de disco')
+    parser.add_argument('--seed', type=int, default=None, help='semilla para la permutación de magnitudes')
+    parser.add_argument('--workers-graficos', type=int, default=1,
+                        help='procesos para dibujar las 4 figuras (sin pyplot, en paralelo)')
+    parser.add_argument('--calidad', choices=['final', 'borrador'], default='final', help='calidad de las figuras')
+    parser.add_argument('--precision', choices=['float64', 'float32'], default='float64',
+                        help='float32: mitad de memoria, suma sobre cargas acumulada en float64')
     args = parser.parse_args()
 
-    cargas = generate_charges(arrangement=args.arr)
+    cargas = generate_charges(arrangement=args.arr, seed=args.seed)
 
     print('Cargas (q [C], x [m], y [m]):')
     for q, xq, yq in cargas:
         print(f'  {q:.3e} , {xq:.3f} , {yq:.3f}')
 
-    x_vals, E_total, V_total, E_individual, V_individual = compute_1d_along_x(cargas)
+    x_vals, E_total, V_total, E_individual, V_individual = compute_1d_along_x(cargas, precision=args.precision)
 
-    # buscar puntos de equilibrio sobre eje x (varios guesses)
-    E_en_x = E_en_x_factory(cargas)
-    puntos_eq = []
-    guesses = list(np.linspace(-2.5, 2.5, 13))
-    for guess in guesses:
-        try:
-            if fsolve is not None:
-                root = float(fsolve(E_en_x, guess)[0])
-            else:
-                root = float(_simple_fsolve(E_en_x, guess)[0])
-            if -3 < root < 3 and not any(np.isclose(root, r, atol=1e-3) for r in puntos_eq):
-                puntos_eq.append(root)
-        except Exception:
-            pass
-    puntos_eq = sorted(puntos_eq)
+    # buscar puntos de equilibrio sobre eje x (cambios de signo de E_total, refinados con Newton)
+    puntos_eq = equilibrios_en_x(cargas, x_vals, E_total)
     print('Puntos de equilibrio sobre eje x:', puntos_eq)
 
-    # graficar 1D y 2D con marcadores de equilibrio
-    plot_1d(x_vals, E_total, V_total, E_individual, V_individual, out_prefix=args.out, puntos_eq=puntos_eq)
-    compute_and_plot_2d(cargas, out_prefix=args.out, puntos_eq=puntos_eq)
+    # graficar 1D y 2D con marcadores de equilibrio: las 4 figuras se dibujan juntas
+    d = calcular_2d(cargas, workers=args.workers, cache=not args.no_cache, precision=args.precision)
+    criticos = d['criticos']
+    if args.precision != 'float64':
+        err_1d = desviacion_precision(x_vals, 0.0, cargas, Ex=E_total, V=V_total)
+        err_2d = desviacion_precision(d['x'][None, :], d['y'][:, None], cargas, d['Ex'], d['Ey'], d['V'])
+        print(f"Desviación {args.precision} vs float64 (relativa al rms): perfil V max={err_1d['V_max']:.2e}, "
+              f"E max={err_1d['E_max']:.2e}; malla V max={err_2d['V_max']:.2e}, E max={err_2d['E_max']:.2e}")
+    print('Puntos críticos de E en el plano (x, y, tipo):', criticos)
+    renderizar(trabajos_1d(x_vals, E_total, V_total, E_individual, V_individual, out_prefix=args.out,
+                           puntos_eq=puntos_eq)
+               + trabajos_2d(cargas, d['x'], d['y'], d['V'], d['lineas'], criticos, out_prefix=args.out,
+                             puntos_eq=puntos_eq),
+               workers=args.workers_graficos, calidad=args.calidad)
 
     # Indico cuáles incisos están resueltos
     print('\nResumen de incisos:')
@@ -0,0 +1,133 @@
+"""Compara todas (o algunas) configuraciones de las 3 cargas en una sola corrida.
+
+Las 12 configuraciones (6 permutaciones de magnitudes x 2 arreglos de signos)
+comparten las posiciones, así que los factores geométricos se calculan una vez y
+todas las configuraciones se evalúan juntas como un eje extra
+(`compute_1d_along_x_lote`, `campo_potencial_lote`).
+
+Genera:
+  <out>_E_vs_x.png, <out>_V_vs_x.png : perfiles sobre el eje x de cada configuración,
+  <out>_equipotentials.png           : un panel de equipotenciales por configuración,
+  <out>_equilibrios.csv              : tabla de puntos de equilibrio por configuración.
+
+Uso:
+    python comparar_configuraciones.py                      # las 12
+    python comparar_configuraciones.py --config two_pos:3,1,2 --config two_neg:1,2,3
+"""
+
+import argparse
+import csv
+import os
+
+import numpy as np
+
+from campo_electrico import (
+    POSICIONES,
+    todas_las_configuraciones,
+    parse_configuracion,
+    compute_1d_along_x_lote,
+    campo_potencial_lote,
+    equilibrios_en_x,
+)
+from campo_electrico.render import renderizar
+
+
+def equilibrios_por_configuracion(Qs, x_vals, E_total):
+    posiciones = [(xq, 0.0) for xq in POSICIONES]
+    return [equilibrios_en_x(np.column_stack([q, posiciones]), x_vals, E) for q, E in zip(Qs, E_total)]
+
+
+def dibujar_perfil(fig, calidad, nombre, ylabel, etiquetas, x_vals, datos, equilibrios):
+    fig.set_size_inches(9, 5)
+    ax = fig.add_subplot()
+    for etiqueta, curva, eq in zip(etiquetas, datos, equilibrios):
+        linea, = ax.plot(x_vals, curva, label=etiqueta)
+        if nombre == 'E' and eq:
+            ax.scatter(eq, [0.0] * len(eq), marker='x', color=linea.get_color(), s=60)
+    for xq in POSICIONES:
+        ax.axvline(xq, color='gray', linestyle=':', alpha=0.6)
+    if nombre == 'E':
+        ax.axhline(0, color='gray', linestyle=':')
+        lim = np.nanpercentile(np.abs(datos), 95)
+        ax.set_ylim(-lim, lim)
+    ax.legend(fontsize=7, ncol=2)
+    ax.set_xlabel('x [m]')
+    ax.set_ylabel(ylabel)
+    ax.set_title(f'{nombre}(x) sobre el eje x para cada configuración')
+    ax.grid()
+
+
+def dibujar_equipotenciales(fig, calidad, etiquetas, Qs, x, y, V, equilibrios):
+    C = len(etiquetas)
+    ncols = min(C, 4)
+    nrows = -(-C // ncols)
+    paso = calidad['paso_malla']
+    fig.set_size_inches(4 * ncols, 3.5 * nrows)
+    axes = fig.subplots(nrows, ncols, squeeze=False)
+    for ax in axes.flat[C:]:
+        ax.axis('off')
+    for ax, etiqueta, q, Vc, eq in zip(axes.flat, etiquetas, Qs, V, equilibrios):
+        ax.contour(x[::paso], y[::paso], Vc[::paso, ::paso], levels=30, cmap='coolwarm')
+        ax.scatter(POSICIONES, [0.0] * len(POSICIONES), c=['red' if qi > 0 else 'blue' for qi in q], s=40)
+        if eq:
+            ax.scatter(eq, [0.0] * len(eq), c='green', marker='x', s=60)
+        ax.set_title(etiqueta, fontsize=9)
+        ax.set_aspect('equal')
+    fig.suptitle('Superficies equipotenciales por configuración (magnitudes en µC)')
+
+
+def trabajos(etiquetas, Qs, x_vals, E_total, V_total, x, y, V, equilibrios, out_prefix):
+    """Trabajos de `render.renderizar` para los perfiles E(x), V(x) y el panel de equipotenciales."""
+    perfiles = [(dibujar_perfil, f"{out_prefix}_{nombre}_vs_x.png",
+                 dict(nombre=nombre, ylabel=ylabel, etiquetas=etiquetas, x_vals=x_vals, datos=datos,
+                      equilibrios=equilibrios))
+                for nombre, datos, ylabel in (('E', E_total, 'E_x [N/C]'), ('V', V_total, 'V [Volt]'))]
+    return perfiles + [(dibujar_equipotenciales, f"{out_prefix}_equipotentials.png",
+                        dict(etiquetas=etiquetas, Qs=Qs, x=x, y=y, V=V, equilibrios=equilibrios))]
+
+
+def guardar_tabla(etiquetas, Qs, equilibrios, path):
+    with open(path, 'w', newline='') as f:
+        w = csv.writer(f)
+        w.writerow(['configuracion'] + [f'q{i+1}_C' for i in range(Qs.shape[1])] + ['equilibrios_x_m'])
+        for etiqueta, q, eq in zip(etiquetas, Qs, equilibrios):
+            w.writerow([etiqueta] + [f'{qi:.3e}' for qi in q] + [';'.join(f'{r:.6f}' for r in eq)])
+
+
+def main(configs=None, out='plots/configuraciones', n=200, x_min=-3, x_max=3, y_min=-3, y_max=3, workers_graficos=1,
+         calidad='final'):
+    if configs:
+        etiquetas = list(configs)
+        Qs = np.array([parse_configuracion(c) for c in configs])
+    else:
+        etiquetas, Qs = todas_las_configuraciones()
+    os.makedirs(os.path.dirname(out), exist_ok=True)
+
+    x_vals, E_total, V_total, _, _ = compute_1d_along_x_lote(Qs, x_min=x_min, x_max=x_max)
+    equilibrios = equilibrios_por_configuracion(Qs, x_vals, E_total)
+
+    x = np.linspace(x_min, x_max, n)
+    y = np.linspace(y_min, y_max, n)
+    X, Y = np.meshgrid(x, y)
+    _, _, V = campo_potencial_lote(X, Y, [(xq, 0.0) for xq in POSICIONES], Qs, con_campo=False)
+
+    print('Puntos de equilibrio sobre el eje x por configuración:')
+    for etiqueta, eq in zip(etiquetas, equilibrios):
+        print(f"  {etiqueta:16s} -> {', '.join(f'{r:.4f}' for r in eq) or '(ninguno)'}")
+
+    renderizar(trabajos(etiquetas, Qs, x_vals, E_total, V_total, x, y, V, equilibrios, out),
+               workers=workers_graficos, calidad=calidad)
+    guardar_tabla(etiquetas, Qs, equilibrios, f"{out}_equilibrios.csv")
+    print(f'Figuras y tabla guardadas con prefijo: {out}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compara todas las configuraciones de 3 cargas en un solo cálculo')
+    parser.add_argument('--config', action='append', default=None,
+                        help="configuración 'arreglo:m1,m2,m3' (µC por posición); repetible. Por defecto las 12")
+    parser.add_argument('--out', default='plots/configuraciones')
+    parser.add_argument('--n', type=int, default=200, help='resolución de la malla 2D (n x n)')
+    parser.add_argument('--workers-graficos', type=int, default=1, help='procesos para dibujar las figuras')
+    parser.add_argument('--calidad', choices=['final', 'borrador'], default='final', help='calidad de las figuras')
+    args = parser.parse_args()
+    main(configs=args.config, out=args.out, n=args.n, workers_graficos=args.workers_graficos, calidad=args.calidad)
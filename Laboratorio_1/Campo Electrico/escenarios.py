@@ -0,0 +1,207 @@
+"""Escenarios declarativos (JSON/TOML) y corrida en lote de barridos de parámetros.
+
+Un escenario describe cargas, malla, perfil 1D y salidas:
+
+    {
+      "nombre": "base",
+      "cargas": {"arreglo": "two_pos", "semilla": 0},
+      "malla": {"x_min": -3, "x_max": 3, "y_min": -3, "y_max": 3, "n": 200, "backend": "directo"},
+      "perfil": {"x_min": -3, "x_max": 3, "n": 400},
+      "salidas": {"figuras": false, "prefijo": "plots/escenarios", "calidad": "final"}
+    }
+
+Las cargas pueden venir de `generate_charges` ("arreglo" + "semilla"), de un
+archivo ("archivo": .npy/.csv) o de una lista explícita ("lista": [[q, x, y], ...]).
+Un archivo puede tener un escenario, una lista en "escenarios", y un "barrido"
+que expande el producto cartesiano de valores, por ejemplo
+{"barrido": {"cargas.semilla": [0, 1, 2], "cargas.arreglo": ["two_pos", "two_neg"]}}.
+
+Uso:
+    python escenarios.py barrido.json --workers 8 --resumen plots/resumen.csv
+"""
+
+import argparse
+import copy
+import csv
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from campo_electrico import (
+    ConjuntoCargas,
+    generate_charges,
+    compute_1d_along_x,
+    evaluar_malla,
+    equilibrios_en_x,
+)
+
+DEFAULTS = {
+    'nombre': 'escenario',
+    'cargas': {'arreglo': 'two_pos', 'semilla': 0},
+    'malla': {'x_min': -3.0, 'x_max': 3.0, 'y_min': -3.0, 'y_max': 3.0, 'n': 200, 'backend': 'directo',
+              'theta': 0.5},
+    'perfil': {'x_min': -3.0, 'x_max': 3.0, 'n': 400},
+    'salidas': {'figuras': False, 'prefijo': 'plots/escenarios', 'calidad': 'final'},
+}
+
+COLUMNAS = ['nombre', 'n_cargas', 'equilibrios_x', 'puntos_criticos', 'E_max_malla', 'V_min_malla', 'V_max_malla',
+            't_perfil_s', 't_malla_s', 't_total_s', 'error']
+
+
+def _mezclar(base, extra):
+    out = copy.deepcopy(base)
+    for clave, valor in extra.items():
+        if isinstance(valor, dict) and isinstance(out.get(clave), dict):
+            out[clave] = _mezclar(out[clave], valor)
+        else:
+            out[clave] = valor
+    return out
+
+
+def _asignar(spec, ruta, valor):
+    *padres, hoja = ruta.split('.')
+    d = spec
+    for p in padres:
+        d = d.setdefault(p, {})
+    d[hoja] = valor
+
+
+def leer_spec(path):
+    """Lee un archivo .json o .toml y devuelve la lista de escenarios completos (con DEFAULTS)."""
+    if path.lower().endswith('.toml'):
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise ImportError(f'{path}: leer .toml en Python < 3.11 necesita `tomli` '
+                                  '(pip install tomli, o pip install -e .[toml]); si no, usar .json') from None
+        with open(path, 'rb') as f:
+            datos = tomllib.load(f)
+    else:
+        with open(path) as f:
+            datos = json.load(f)
+
+    base = {k: v for k, v in datos.items() if k not in ('escenarios', 'barrido')}
+    escenarios = [_mezclar(base, e) for e in datos.get('escenarios', [{}])]
+
+    barrido = datos.get('barrido', {})
+    if barrido:
+        rutas = list(barrido)
+        expandidos = []
+        for e in escenarios:
+            for valores in itertools.product(*(barrido[r] for r in rutas)):
+                nuevo = copy.deepcopy(e)
+                for r, v in zip(rutas, valores):
+                    _asignar(nuevo, r, v)
+                sufijo = ','.join(f'{r.split(".")[-1]}={v}' for r, v in zip(rutas, valores))
+                nuevo['nombre'] = f"{e.get('nombre', DEFAULTS['nombre'])}[{sufijo}]"
+                expandidos.append(nuevo)
+        escenarios = expandidos
+
+    # rutas de archivos de cargas relativas al archivo de escenarios
+    carpeta = os.path.dirname(os.path.abspath(path))
+    completos = []
+    for e in escenarios:
+        e = _mezclar(DEFAULTS, e)
+        archivo = e['cargas'].get('archivo')
+        if archivo and not os.path.isabs(archivo):
+            e['cargas']['archivo'] = os.path.join(carpeta, archivo)
+        completos.append(e)
+    return completos
+
+
+def construir_cargas(spec_cargas):
+    if 'archivo' in spec_cargas:
+        return ConjuntoCargas.cargar(spec_cargas['archivo'])
+    if 'lista' in spec_cargas:
+        return ConjuntoCargas.desde_tuplas(spec_cargas['lista'])
+    return generate_charges(arrangement=spec_cargas.get('arreglo', 'two_pos'), seed=spec_cargas.get('semilla'))
+
+
+def correr_escenario(spec):
+    """Corre un escenario completo y devuelve una fila del resumen (dict con COLUMNAS)."""
+    from campo_electrico.puntos_criticos import puntos_criticos
+
+    fila = {c: '' for c in COLUMNAS}
+    fila['nombre'] = spec['nombre']
+    t0 = time.perf_counter()
+    try:
+        cargas = construir_cargas(spec['cargas'])
+        fila['n_cargas'] = len(cargas)
+
+        p = spec['perfil']
+        t = time.perf_counter()
+        x_vals, E_total, V_total, E_individual, V_individual = compute_1d_along_x(
+            cargas, x_min=p['x_min'], x_max=p['x_max'], n=p['n'])
+        puntos_eq = equilibrios_en_x(cargas, x_vals, E_total)
+        fila['t_perfil_s'] = round(time.perf_counter() - t, 4)
+
+        m = spec['malla']
+        t = time.perf_counter()
+        x = np.linspace(m['x_min'], m['x_max'], m['n'])
+        y = np.linspace(m['y_min'], m['y_max'], m['n'])
+        Ex, Ey, V = evaluar_malla(x, y, cargas, backend=m['backend'], theta=m['theta'])
+        criticos = puntos_criticos(cargas, x, y, Ex, Ey)
+        fila['t_malla_s'] = round(time.perf_counter() - t, 4)
+
+        fila['equilibrios_x'] = ';'.join(f'{r:.6g}' for r in puntos_eq)
+        fila['puntos_criticos'] = ';'.join(f'({xc:.4g},{yc:.4g},{tipo})' for xc, yc, tipo in criticos)
+        fila['E_max_malla'] = float(np.nanmax(np.hypot(Ex, Ey)))
+        fila['V_min_malla'] = float(np.nanmin(V))
+        fila['V_max_malla'] = float(np.nanmax(V))
+
+        s = spec['salidas']
+        if s.get('figuras'):
+            # las figuras 2D reusan la malla ya calculada; matplotlib se importa sólo si hay figuras
+            from campo_electrico.graficos import trabajos_1d, trabajos_2d
+            from campo_electrico.lineas_campo import trazar_lineas
+            from campo_electrico.render import renderizar
+
+            prefijo = os.path.join(s['prefijo'], spec['nombre'].replace('/', '_'))
+            lineas = trazar_lineas(cargas, m['x_min'], m['x_max'], m['y_min'], m['y_max'])
+            renderizar(trabajos_1d(x_vals, E_total, V_total, E_individual, V_individual, out_prefix=prefijo,
+                                   puntos_eq=puntos_eq)
+                       + trabajos_2d(cargas, x, y, V, lineas, criticos, out_prefix=prefijo, puntos_eq=puntos_eq),
+                       calidad=s.get('calidad', 'final'))
+    except Exception as exc:
+        fila['error'] = f'{type(exc).__name__}: {exc}'
+    fila['t_total_s'] = round(time.perf_counter() - t0, 4)
+    return fila
+
+
+def correr_lote(escenarios, workers=1):
+    """Corre los escenarios (en paralelo si workers > 1) y devuelve las filas en el mismo orden."""
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(correr_escenario, escenarios))
+    return [correr_escenario(e) for e in escenarios]
+
+
+def guardar_resumen(filas, path):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', newline='') as f:
+        w = csv.DictWriter(f, fieldnames=COLUMNAS)
+        w.writeheader()
+        w.writerows(filas)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Corre escenarios de cargas (JSON/TOML) en lote')
+    parser.add_argument('specs', nargs='+', help='archivos .json/.toml de escenarios')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--resumen', default='plots/escenarios/resumen.csv')
+    args = parser.parse_args()
+
+    escenarios = [e for path in args.specs for e in leer_spec(path)]
+    print(f'{len(escenarios)} escenarios, {args.workers} procesos')
+    t0 = time.perf_counter()
+    filas = correr_lote(escenarios, workers=args.workers)
+    guardar_resumen(filas, args.resumen)
+    errores = sum(1 for f in filas if f['error'])
+    print(f'Resumen guardado en {args.resumen} ({time.perf_counter() - t0:.1f} s, {errores} con error)')
@@ -0,0 +1,243 @@
+"""Explorador interactivo de cargas: arrastrar cargas o cambiar q y ver V, E y V(x) en vivo.
+
+Para que cada cuadro tarde milisegundos y no segundos como `compute_and_plot_2d`:
+  - la malla se actualiza por superposición (`superposicion.MallaSuperposicion`):
+    mover una carga cuesta O(malla), no O(malla × cargas),
+  - mientras se arrastra (o se mueve el slider) se muestra una malla gruesa
+    (1 de cada `paso_grueso` puntos) y pocas líneas de campo con paso largo; al
+    soltar, o tras `espera_ms` sin cambios, se hace la pasada fina a resolución completa,
+  - las partes que cambian (imagen de V, líneas, cargas, V(x)) son artistas
+    animados que se redibujan con blitting sobre un fondo guardado; ejes, títulos
+    y barra de color no se vuelven a dibujar.
+
+Las equipotenciales se ven como los bordes de las bandas de color de V: cada punto
+se colorea según el intervalo entre niveles en que cae, con una tabla RGBA
+precalculada (así la imagen no pasa por la normalización de matplotlib en cada cuadro).
+
+Controles: arrastrar una carga con el mouse la mueve; click sobre una carga la
+selecciona y el slider cambia su q [µC].
+
+Uso:
+    python explorador.py --arr two_pos
+    python explorador.py --aleatorias 10 --n 300
+"""
+
+import argparse
+import time
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import BoundaryNorm
+from matplotlib.widgets import Slider
+
+from campo_electrico import ConjuntoCargas, campo_potencial, generate_charges
+from campo_electrico.equipotenciales import niveles_por_defecto
+from campo_electrico.lineas_campo import trazar_lineas
+from campo_electrico.nucleo import _charge_array
+from campo_electrico.superposicion import MallaSuperposicion
+
+# parámetros de las líneas de campo: (líneas por carga, tolerancia [m], paso máximo [m], pasos máximos)
+_LINEAS_GRUESAS = (6, 1e-3, 0.3, 60)
+_LINEAS_FINAS = (16, 1e-5, None, 4000)
+
+
+class Explorador:
+    def __init__(self, cargas, x_min=-3, x_max=3, y_min=-3, y_max=3, n=300, paso_grueso=4, espera_ms=150,
+                 n_niveles=30):
+        self.Q = np.array(_charge_array(cargas), dtype=float)
+        self.limites = (x_min, x_max, y_min, y_max)
+        x = np.linspace(x_min, x_max, n)
+        y = np.linspace(y_min, y_max, n)
+        self.fina = MallaSuperposicion(x, y, self.Q, con_campo=False)
+        self.gruesa = MallaSuperposicion(x[::paso_grueso], y[::paso_grueso], self.Q, con_campo=False)
+        self.x_perfil = np.linspace(x_min, x_max, 600)
+        self.n_niveles = n_niveles
+        self.seleccionada = 0
+        self._arrastrando = None
+        self._fondo = None
+        self.t_cuadro_ms = []
+
+        self.fig = plt.figure(figsize=(13, 6))
+        self.ax = self.fig.add_axes([0.05, 0.15, 0.4, 0.78])
+        ax_barra = self.fig.add_axes([0.46, 0.15, 0.012, 0.78])
+        self.ax_perfil = self.fig.add_axes([0.65, 0.15, 0.32, 0.78])
+        ax_slider = self.fig.add_axes([0.15, 0.04, 0.7, 0.03])
+
+        self.escala = ScalarMappable(cmap='coolwarm')
+        self._fijar_niveles()
+        self.imagen = self.ax.imshow(self._rgba(self.fina.V), origin='lower', extent=self.limites,
+                                     interpolation='nearest', animated=True)
+        self.barra = self.fig.colorbar(self.escala, cax=ax_barra, label='V [Volt]')
+        self.lineas = LineCollection([], colors='k', linewidths=0.7, alpha=0.7, animated=True)
+        self.ax.add_collection(self.lineas)
+        self.puntos = self.ax.scatter(self.Q[:, 1], self.Q[:, 2], c=self._colores(), s=80, edgecolors='k',
+                                      zorder=3, animated=True)
+        self.ax.set_xlim(x_min, x_max)
+        self.ax.set_ylim(y_min, y_max)
+        self.ax.set_aspect('equal')
+        self.ax.set_xlabel('x [m]')
+        self.ax.set_ylabel('y [m]')
+        self.ax.set_title('Arrastrar cargas; click + slider cambia q')
+
+        self.perfil, = self.ax_perfil.plot(self.x_perfil, self._perfil(), animated=True)
+        self.ax_perfil.axhline(0, color='gray', linestyle=':')
+        self.ax_perfil.set_xlabel('x [m]')
+        self.ax_perfil.set_ylabel('V(x, 0) [Volt]')
+        self.ax_perfil.set_title('Potencial sobre el eje x')
+        self.ax_perfil.grid()
+        self._escalar_perfil()
+
+        self.slider = Slider(ax_slider, 'q [µC]', -5.0, 5.0, valinit=self.Q[0, 0] * 1e6)
+        self.slider.on_changed(self._al_cambiar_q)
+
+        self.temporizador = self.fig.canvas.new_timer(interval=espera_ms)
+        self.temporizador.single_shot = True
+        self.temporizador.add_callback(self._pasada_fina)
+
+        self.fig.canvas.mpl_connect('draw_event', self._al_dibujar)
+        self.fig.canvas.mpl_connect('button_press_event', self._al_presionar)
+        self.fig.canvas.mpl_connect('motion_notify_event', self._al_mover)
+        self.fig.canvas.mpl_connect('button_release_event', self._al_soltar)
+        self._actualizar_lineas(_LINEAS_FINAS)
+
+    # --- cálculo ---------------------------------------------------------------------------------
+    def _colores(self):
+        return ['red' if q > 0 else 'blue' for q in self.Q[:, 0]]
+
+    def _fijar_niveles(self):
+        self.niveles = niveles_por_defecto(self.fina.V, self.n_niveles)
+        self.escala.set_norm(BoundaryNorm(self.niveles, 256, extend='both'))
+        # un color por banda (más las dos de los extremos), en RGBA de 8 bits
+        centros = np.concatenate([[self.niveles[0]], (self.niveles[1:] + self.niveles[:-1]) / 2, [self.niveles[-1]]])
+        self._tabla = self.escala.to_rgba(centros, bytes=True)
+
+    def _rgba(self, V):
+        return self._tabla[np.searchsorted(self.niveles, V)]
+
+    def _perfil(self):
+        return campo_potencial(self.x_perfil, 0.0, self.Q, con_campo=False)[2]
+
+    def _escalar_perfil(self):
+        V = self.perfil.get_ydata()
+        lim = np.nanpercentile(np.abs(V), 95) * 1.5
+        self.ax_perfil.set_ylim(-lim, lim)
+
+    def _actualizar_lineas(self, parametros):
+        por_carga, tol, paso_max, max_pasos = parametros
+        x_min, x_max, y_min, y_max = self.limites
+        lineas = trazar_lineas(self.Q, x_min, x_max, y_min, y_max, lineas_por_carga=por_carga, tol=tol,
+                               paso_max=paso_max, max_pasos=max_pasos)
+        self.lineas.set_segments([l for l in lineas if len(l) > 1])
+
+    def _sincronizar(self, malla):
+        """Lleva la malla a las cargas actuales actualizando sólo las cargas que cambiaron."""
+        for i in np.flatnonzero(np.any(malla.Q != self.Q, axis=1)):
+            malla.actualizar(i, q=self.Q[i, 0], x=self.Q[i, 1], y=self.Q[i, 2])
+
+    # --- dibujo con blitting --------------------------------------------------------------------------
+    def _animados(self):
+        return (self.imagen, self.lineas, self.puntos, self.perfil)
+
+    def _al_dibujar(self, event):
+        self._fondo = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        self._blit()
+
+    def _blit(self):
+        canvas = self.fig.canvas
+        if self._fondo is None:
+            canvas.draw()
+            return
+        canvas.restore_region(self._fondo)
+        for artista in self._animados():
+            artista.axes.draw_artist(artista)
+        canvas.blit(self.fig.bbox)
+
+    def _cuadro_grueso(self):
+        t0 = time.perf_counter()
+        self._sincronizar(self.gruesa)
+        self.imagen.set_data(self._rgba(self.gruesa.V))
+        self._actualizar_lineas(_LINEAS_GRUESAS)
+        self.puntos.set_offsets(self.Q[:, 1:3])
+        self.puntos.set_facecolors(self._colores())
+        self.perfil.set_ydata(self._perfil())
+        self._blit()
+        self.t_cuadro_ms.append((time.perf_counter() - t0) * 1e3)
+        self.temporizador.stop()
+        self.temporizador.start()
+
+    def _pasada_fina(self):
+        self.temporizador.stop()
+        self._sincronizar(self.fina)
+        self._fijar_niveles()
+        self.imagen.set_data(self._rgba(self.fina.V))
+        self.barra.update_normal(self.escala)
+        self._actualizar_lineas(_LINEAS_FINAS)
+        self._escalar_perfil()
+        # los niveles y los límites del perfil cambian partes estáticas: redibujo completo (rehace el fondo)
+        self.fig.canvas.draw_idle()
+
+    # --- eventos ------------------------------------------------------------------------------------
+    def _carga_cercana(self, event, radio_px=12):
+        pantalla = self.ax.transData.transform(self.Q[:, 1:3])
+        d = np.hypot(pantalla[:, 0] - event.x, pantalla[:, 1] - event.y)
+        i = int(np.argmin(d))
+        return i if d[i] <= radio_px else None
+
+    def _al_presionar(self, event):
+        if event.inaxes is not self.ax or event.button != 1:
+            return
+        i = self._carga_cercana(event)
+        if i is None:
+            return
+        self._arrastrando = self.seleccionada = i
+        # cambiar el slider sin disparar _al_cambiar_q
+        self.slider.eventson = False
+        self.slider.set_val(self.Q[i, 0] * 1e6)
+        self.slider.eventson = True
+
+    def _al_mover(self, event):
+        if self._arrastrando is None or event.inaxes is not self.ax:
+            return
+        self.Q[self._arrastrando, 1:3] = event.xdata, event.ydata
+        self._cuadro_grueso()
+
+    def _al_soltar(self, event):
+        if self._arrastrando is not None:
+            self._arrastrando = None
+            self._pasada_fina()
+
+    def _al_cambiar_q(self, valor):
+        self.Q[self.seleccionada, 0] = valor * 1e-6
+        self._cuadro_grueso()
+
+    def mostrar(self):
+        plt.show()
+
+
+def main(arr='two_pos', seed=None, cargas_path=None, aleatorias=None, n=300):
+    if cargas_path:
+        cargas = ConjuntoCargas.cargar(cargas_path)
+    elif aleatorias:
+        rng = np.random.default_rng(seed)
+        cargas = ConjuntoCargas(rng.choice([-1, 1], aleatorias) * rng.uniform(1, 3, aleatorias) * 1e-6,
+                                rng.uniform(-2.5, 2.5, aleatorias), rng.uniform(-2.5, 2.5, aleatorias))
+    else:
+        cargas = generate_charges(arrangement=arr, seed=seed)
+    explorador = Explorador(cargas, n=n)
+    explorador.mostrar()
+    if explorador.t_cuadro_ms:
+        print(f'Cuadros gruesos: mediana {np.median(explorador.t_cuadro_ms):.1f} ms '
+              f'({len(explorador.t_cuadro_ms)} cuadros)')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Explorador interactivo de cargas (arrastrar / slider de q)')
+    parser.add_argument('--arr', choices=['two_pos', 'two_neg'], default='two_pos')
+    parser.add_argument('--seed', type=int, default=None, help='semilla (permutación de magnitudes o cargas aleatorias)')
+    parser.add_argument('--cargas', default=None, help='archivo .npy/.csv con columnas q, x, y')
+    parser.add_argument('--aleatorias', type=int, default=None, help='usar N cargas aleatorias')
+    parser.add_argument('--n', type=int, default=300, help='resolución de la malla fina (n x n)')
+    args = parser.parse_args()
+    main(arr=args.arr, seed=args.seed, cargas_path=args.cargas, aleatorias=args.aleatorias, n=args.n)
@@ -1,4 +1,4 @@
-from incisos_common import generate_charges
+from campo_electrico import generate_charges
 
 if __name__ == '__main__':
     cargas = generate_charges(arrangement='two_pos')
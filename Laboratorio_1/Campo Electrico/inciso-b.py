@@ -1,10 +1,11 @@
-from incisos_common import campo, potencial, generate_charges
+import numpy as np
+from campo_electrico import campo_potencial, generate_charges
 
 if __name__ == '__main__':
     cargas = generate_charges()
     pts = [(-1.0, 0.0), (0.0, 0.0), (1.0, 0.0), (0.5, 0.5)]
+    xs, ys = np.array(pts).T
+    Ex, Ey, V = campo_potencial(xs, ys, cargas)
     print('Evaluación de campo y potencial en puntos de ejemplo:')
-    for x, y in pts:
-        Ex, Ey = campo(x, y, cargas)
-        V = potencial(x, y, cargas)
-        print(f'Punto ({x:.2f}, {y:.2f}) -> Ex={Ex:.3e} N/C, Ey={Ey:.3e} N/C, V={V:.3e} V')
+    for i, (x, y) in enumerate(pts):
+        print(f'Punto ({x:.2f}, {y:.2f}) -> Ex={Ex[i]:.3e} N/C, Ey={Ey[i]:.3e} N/C, V={V[i]:.3e} V')
@@ -1,4 +1,4 @@
-from incisos_common import generate_charges, compute_1d_along_x, plot_1d
+from campo_electrico import generate_charges, compute_1d_along_x, plot_1d
 
 if __name__ == '__main__':
     cargas = generate_charges()
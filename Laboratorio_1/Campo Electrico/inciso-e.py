@@ -1,6 +1,7 @@
-from incisos_common import generate_charges, compute_and_plot_2d
+from campo_electrico import generate_charges, compute_and_plot_2d
 
 if __name__ == '__main__':
     cargas = generate_charges()
-    compute_and_plot_2d(cargas, out_prefix='plots/inciso_e')
+    criticos = compute_and_plot_2d(cargas, out_prefix='plots/inciso_e', cache=True)
+    print('Puntos críticos de E en el plano (x, y, tipo):', criticos)
     print('Inciso e: figuras guardadas con prefijo plots/inciso_e')
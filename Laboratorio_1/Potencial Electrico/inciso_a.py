@@ -1,61 +1,115 @@
 """Inciso a) - Calcular numéricamente V(x,y) generado por el conjunto de 3 cargas.
 
-Este script solo calcula la malla de potencial y la guarda en un archivo .npz
-y genera un heatmap PNG para inspección rápida.
+Este script solo calcula la malla de potencial y la guarda en `<out>_grid/`
+(ejes x, y y V.npy escrito por bloques con memmap, ver `malla_io`) y genera
+un heatmap PNG para inspección rápida.
 """
 import numpy as np
 import os
-import sys
 import argparse
-import matplotlib.pyplot as plt
 
-# make sure incisos_common (in sibling 'Campo Electrico') is importable
-THIS_DIR = os.path.dirname(__file__)
-COMMON_DIR = os.path.abspath(os.path.join(THIS_DIR, '..', 'Campo Electrico'))
-if COMMON_DIR not in sys.path:
-    sys.path.insert(0, COMMON_DIR)
+from campo_electrico import ConjuntoCargas, generate_charges, evaluar_malla, desviacion_precision
+from campo_electrico.malla_io import crear_malla, ruta_malla
+from campo_electrico.cache_mallas import malla_cacheada
+from campo_electrico.render import renderizar
 
-from incisos_common import generate_charges, potencial
 
+def compute_potential_grid(cargas, x_min=-3, x_max=3, y_min=-3, y_max=3, n=200, mem_mb=256, workers=1,
+                           backend='directo', theta=0.5, V_out=None, cache=False,
+                           simetria=True, precision='float64'):
+    """Calcula V sobre una malla n x n por bloques de a lo sumo `mem_mb` MB de temporales.
 
-def compute_potential_grid(cargas, x_min=-3, x_max=3, y_min=-3, y_max=3, n=200):
+    Con `workers > 1` los bloques de filas se reparten entre procesos y con
+    `backend='barnes_hut'` se usa el árbol (ángulo de apertura `theta`) en vez de la suma directa;
+    `backend='particle_mesh'` resuelve la malla entera por FFT.
+
+    X e Y se devuelven como vistas (sin copiar) de los ejes, para que mallas muy
+    grandes no ocupen memoria extra. `V_out` permite pasar el arreglo de salida
+    (por ejemplo el memmap de `malla_io.crear_malla`) para que cada bloque se
+    escriba directamente en él. Con `cache=True` se usa el cache de disco de `cache_mallas`.
+    Con cargas colineales y malla simétrica se evalúa media malla y se refleja
+    (`simetria=False` fuerza la evaluación completa). `precision='float32'` calcula y
+    guarda V en float32 (la suma sobre cargas se acumula igual en float64).
+    """
     x = np.linspace(x_min, x_max, n)
     y = np.linspace(y_min, y_max, n)
-    X, Y = np.meshgrid(x, y)
-    V = np.zeros_like(X)
+    X, Y = np.meshgrid(x, y, copy=False)
 
-    # calcular potencial punto a punto
-    for i in range(X.shape[0]):
-        for j in range(X.shape[1]):
-            V[i, j] = potencial(X[i, j], Y[i, j], cargas)
+    # calcular potencial por bloques, acotando la memoria
+    evaluar = malla_cacheada if cache else evaluar_malla
+    _, _, V = evaluar(x, y, cargas, con_campo=False, mem_mb=mem_mb, workers=workers,
+                      backend=backend, theta=theta, out=(None, None, V_out), simetria=simetria,
+                      precision=precision)
+    if V_out is not None and V is not V_out:
+        # vino del cache: copiar al destino pedido
+        V_out[...] = V
+        V = V_out
 
     return X, Y, V
 
 
-def save_grid(X, Y, V, out_prefix='plots/inciso_a'):
+def save_grid(X, Y, V, out_prefix='plots/inciso_a', calidad='final', pool=None):
+    """Guarda ejes y V en `<out_prefix>_grid/` y un heatmap PNG (`render.renderizar`, con `calidad` y `pool`).
+
+    Si V ya es el memmap de ese destino (creado con `crear_malla`) sólo se vuelca a disco.
+    """
     os.makedirs(os.path.dirname(out_prefix), exist_ok=True)
-    np.savez(f"{out_prefix}_grid.npz", X=X, Y=Y, V=V)
-
-    # guardar heatmap rápido
-    plt.figure(figsize=(6, 5))
-    im = plt.imshow(V, origin='lower', extent=(X.min(), X.max(), Y.min(), Y.max()), cmap='coolwarm')
-    plt.colorbar(im, label='V [Volt]')
-    plt.title('Potencial V(x,y) - heatmap')
-    plt.xlabel('x [m]')
-    plt.ylabel('y [m]')
-    plt.tight_layout()
-    plt.savefig(f"{out_prefix}_heatmap.png", dpi=150)
-    plt.close()
-
-
-def main(arr='two_pos', out='plots/inciso_a', x_min=-3, x_max=3, y_min=-3, y_max=3, n=200):
-    cargas = generate_charges(arrangement=arr)
-    print('Cargas (q [C], x [m], y [m]):')
-    for q, xq, yq in cargas:
-        print(f'  {q:.3e} , {xq:.3f} , {yq:.3f}')
-
-    X, Y, V = compute_potential_grid(cargas, x_min=x_min, x_max=x_max, y_min=y_min, y_max=y_max, n=n)
-    save_grid(X, Y, V, out_prefix=out)
+    destino = os.path.abspath(os.path.join(ruta_malla(out_prefix), 'V.npy'))
+    if isinstance(V, np.memmap) and V.filename and os.path.abspath(V.filename) == destino:
+        V.flush()
+    else:
+        crear_malla(out_prefix, X[0, :], Y[:, 0], dtype=V.dtype)[...] = V
+
+    # heatmap rápido, submuestreado en mallas muy grandes (matplotlib se importa recién al dibujar)
+    paso = max(1, -(-max(V.shape) // 2000))
+    extent = (X[0, 0], X[0, -1], Y[0, 0], Y[-1, 0])
+    renderizar([(dibujar_heatmap, f"{out_prefix}_heatmap.png", dict(V=np.array(V[::paso, ::paso]), extent=extent))],
+               calidad=calidad, pool=pool)
+
+
+def dibujar_heatmap(fig, calidad, V, extent):
+    paso = calidad['paso_malla']
+    fig.set_size_inches(6, 5)
+    ax = fig.add_subplot()
+    im = ax.imshow(V[::paso, ::paso], origin='lower', extent=extent, cmap='coolwarm')
+    fig.colorbar(im, ax=ax, label='V [Volt]')
+    ax.set_title('Potencial V(x,y) - heatmap')
+    ax.set_xlabel('x [m]')
+    ax.set_ylabel('y [m]')
+
+
+def main(arr='two_pos', out='plots/inciso_a', x_min=-3, x_max=3, y_min=-3, y_max=3, n=200, mem_mb=256, workers=1,
+         backend='directo', theta=0.5, cargas_path=None, cache=True, seed=None,
+         simetria=True, calidad='final', precision='float64'):
+    if cargas_path:
+        cargas = ConjuntoCargas.cargar(cargas_path)
+        print(f'Cargas leídas de {cargas_path}: {cargas!r}')
+    else:
+        cargas = generate_charges(arrangement=arr, seed=seed)
+        print('Cargas (q [C], x [m], y [m]):')
+        for q, xq, yq in cargas:
+            print(f'  {q:.3e} , {xq:.3f} , {yq:.3f}')
+
+    os.makedirs(os.path.dirname(out), exist_ok=True)
+    V_out = crear_malla(out, np.linspace(x_min, x_max, n), np.linspace(y_min, y_max, n), dtype=precision)
+    X, Y, V = compute_potential_grid(cargas, x_min=x_min, x_max=x_max, y_min=y_min, y_max=y_max, n=n, mem_mb=mem_mb,
+                                     workers=workers, backend=backend, theta=theta, V_out=V_out,
+                                     cache=cache, simetria=simetria, precision=precision)
+    if backend == 'barnes_hut':
+        from campo_electrico.barnes_hut import ArbolCargas
+        err = ArbolCargas(cargas, theta=theta).error_muestra(X, Y)
+        print(f"Error Barnes-Hut vs suma directa (relativo al rms, muestra de puntos): "
+              f"V max={err['V_max']:.2e} rms={err['V_rms']:.2e}")
+    elif backend == 'particle_mesh':
+        from campo_electrico.particle_mesh import autochequeo
+        for zona, err in autochequeo(X[0], Y[:, 0], cargas).items():
+            print(f"Autochequeo particle-mesh vs suma directa ({zona}): "
+                  f"V max={err['V_max']:.2e} rms={err['V_rms']:.2e}, E max={err['E_max']:.2e} rms={err['E_rms']:.2e}")
+    elif precision != 'float64':
+        err = desviacion_precision(X, Y, cargas, V=V)
+        print(f"Desviación {precision} vs float64 (relativa al rms, muestra de puntos): "
+              f"V max={err['V_max']:.2e} rms={err['V_rms']:.2e}")
+    save_grid(X, Y, V, out_prefix=out, calidad=calidad)
     print(f'Guardado grid y heatmap en prefijo: {out} (n={n})')
 
 
@@ -68,5 +122,20 @@ if __name__ == '__main__':
     parser.add_argument('--xmax', type=float, default=3.0)
     parser.add_argument('--ymin', type=float, default=-3.0)
     parser.add_argument('--ymax', type=float, default=3.0)
+    parser.add_argument('--mem-mb', type=float, default=256, help='memoria máxima (MB) para los temporales de cada bloque')
+    parser.add_argument('--workers', type=int, default=1, help='procesos para evaluar la malla en paralelo')
+    parser.add_argument('--backend', choices=['directo', 'barnes_hut', 'particle_mesh'], default='directo')
+    parser.add_argument('--theta', type=float, default=0.5, help='ángulo de apertura del backend barnes_hut')
+    parser.add_argument('--cargas', default=None, help='archivo .npy/.csv con cargas (en lugar de generarlas)')
+    parser.add_argument('--no-cache', action='store_true', help='recalcular la malla sin usar el cache de disco')
+    parser.add_argument('--sin-simetria', action='store_true',
+                        help='evaluar la malla completa aunque las cargas sean colineales')
+    parser.add_argument('--seed', type=int, default=None, help='semilla para la permutación de magnitudes')
+    parser.add_argument('--calidad', choices=['final', 'borrador'], default='final', help='calidad del heatmap')
+    parser.add_argument('--precision', choices=['float64', 'float32'], default='float64',
+                        help='float32: mitad de memoria, suma sobre cargas acumulada en float64')
     args = parser.parse_args()
-    main(arr=args.arr, out=args.out, x_min=args.xmin, x_max=args.xmax, y_min=args.ymin, y_max=args.ymax, n=args.n)
+    main(arr=args.arr, out=args.out, x_min=args.xmin, x_max=args.xmax, y_min=args.ymin, y_max=args.ymax, n=args.n,
+         mem_mb=args.mem_mb, workers=args.workers, backend=args.backend, theta=args.theta, cargas_path=args.cargas,
+         cache=not args.no_cache, seed=args.seed,
+         simetria=not args.sin_simetria, calidad=args.calidad, precision=args.precision)
@@ -1,58 +1,73 @@
-import os
-import sys
 import argparse
-import numpy as np
 
-# ensure incisos_common in sibling 'Campo Electrico' is importable
-THIS_DIR = os.path.dirname(__file__)
-COMMON_DIR = os.path.abspath(os.path.join(THIS_DIR, '..', 'Campo Electrico'))
-if COMMON_DIR not in sys.path:
-    sys.path.insert(0, COMMON_DIR)
+from campo_electrico import generate_charges, compute_1d_along_x, desviacion_precision
+from campo_electrico.render import renderizar
 
-from incisos_common import generate_charges, compute_1d_along_x, compute_and_plot_2d
 
+def dibujar_potencial_1d(fig, calidad, x_vals, V_total, V_individual):
+    fig.set_size_inches(8, 5)
+    ax = fig.add_subplot()
+    for i in range(V_individual.shape[0]):
+        ax.plot(x_vals, V_individual[i, :], '--', label=f"V(x) carga {i+1}")
+    ax.plot(x_vals, V_total, 'k', label="V(x) total")
+    ax.axhline(0, color='gray', linestyle=':')
+    ax.legend()
+    ax.set_xlabel('x [m]')
+    ax.set_ylabel('V [Volt]')
+    ax.set_title('Potencial sobre el eje x - cargas individuales y superposición')
+    ax.grid()
 
-def plot_potential_1d(x_vals, V_total, V_individual, out_prefix='plots/potencial'):
-    os.makedirs(os.path.dirname(out_prefix), exist_ok=True)
-    import matplotlib.pyplot as plt
 
-    plt.figure(figsize=(8, 5))
-    for i in range(V_individual.shape[0]):
-        plt.plot(x_vals, V_individual[i, :], '--', label=f"V(x) carga {i+1}")
-    plt.plot(x_vals, V_total, 'k', label="V(x) total")
-    plt.axhline(0, color='gray', linestyle=':')
-    plt.legend()
-    plt.xlabel('x [m]')
-    plt.ylabel('V [Volt]')
-    plt.title('Potencial sobre el eje x - cargas individuales y superposición')
-    plt.grid()
-    plt.tight_layout()
-    plt.savefig(f"{out_prefix}_V_vs_x.png", dpi=150)
-    plt.close()
-
-
-def main(arr='two_pos', out='plots/potencial'):
+def trabajo_potencial_1d(x_vals, V_total, V_individual, out_prefix='plots/potencial'):
+    return (dibujar_potencial_1d, f"{out_prefix}_V_vs_x.png",
+            dict(x_vals=x_vals, V_total=V_total, V_individual=V_individual))
+
+
+def plot_potential_1d(x_vals, V_total, V_individual, out_prefix='plots/potencial', calidad='final', pool=None):
+    renderizar([trabajo_potencial_1d(x_vals, V_total, V_individual, out_prefix)], calidad=calidad, pool=pool)
+
+
+def main(arr='two_pos', out='plots/potencial', workers=1, cache=True, seed=None, workers_graficos=1,
+         calidad='final', precision='float64'):
     """Inciso c: genera V(x) y mapa de contorno (equipotenciales).
     Guarda dos archivos: <out>_V_vs_x.png y <out>_equipotentials.png (además el mapa de líneas de campo).
+    Las tres figuras se dibujan juntas, en `workers_graficos` procesos.
+    Con `precision='float32'` informa la desviación máxima respecto de float64.
     """
-    cargas = generate_charges(arrangement=arr)
+    from campo_electrico.graficos import calcular_2d, trabajos_2d
+
+    cargas = generate_charges(arrangement=arr, seed=seed)
     print('Cargas (q [C], x [m], y [m]):')
     for q, xq, yq in cargas:
         print(f'  {q:.3e} , {xq:.3f} , {yq:.3f}')
 
-    # a) y b) calcular V(x,y) y graficar V(x) (individual y superposición)
-    x_vals, E_total, V_total, E_individual, V_individual = compute_1d_along_x(cargas)
-    plot_potential_1d(x_vals, V_total, V_individual, out_prefix=out)
-    print(f'Guardado: {out}_V_vs_x.png')
+    # a) y b) calcular V(x,y) y V(x) (individual y superposición)
+    x_vals, E_total, V_total, E_individual, V_individual = compute_1d_along_x(cargas, precision=precision)
 
     # c) mapa de contorno / superficies equipotenciales en 2D
-    compute_and_plot_2d(cargas, out_prefix=out)
-    print(f'Guardado: {out}_equipotentials.png')
+    d = calcular_2d(cargas, workers=workers, cache=cache, precision=precision)
+    if precision != 'float64':
+        err_1d = desviacion_precision(x_vals, 0.0, cargas, Ex=E_total, V=V_total)
+        err_2d = desviacion_precision(d['x'][None, :], d['y'][:, None], cargas, d['Ex'], d['Ey'], d['V'])
+        print(f"Desviación {precision} vs float64 (relativa al rms): perfil V max={err_1d['V_max']:.2e}, "
+              f"E max={err_1d['E_max']:.2e}; malla V max={err_2d['V_max']:.2e}, E max={err_2d['E_max']:.2e}")
+    trabajos = [trabajo_potencial_1d(x_vals, V_total, V_individual, out_prefix=out)]
+    trabajos += trabajos_2d(cargas, d['x'], d['y'], d['V'], d['lineas'], d['criticos'], out_prefix=out)
+    for ruta in renderizar(trabajos, workers=workers_graficos, calidad=calidad):
+        print(f'Guardado: {ruta}')
 
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Inciso c: graficar potencial y equipotenciales')
     parser.add_argument('--arr', choices=['two_pos', 'two_neg'], default='two_pos')
     parser.add_argument('--out', default='plots/potencial')
+    parser.add_argument('--workers', type=int, default=1, help='procesos para evaluar la malla 2D en paralelo')
+    parser.add_argument('--no-cache', action='store_true', help='recalcular la malla 2D sin usar el cache de disco')
+    parser.add_argument('--seed', type=int, default=None, help='semilla para la permutación de magnitudes')
+    parser.add_argument('--workers-graficos', type=int, default=1, help='procesos para dibujar las figuras')
+    parser.add_argument('--calidad', choices=['final', 'borrador'], default='final', help='calidad de las figuras')
+    parser.add_argument('--precision', choices=['float64', 'float32'], default='float64',
+                        help='float32: mitad de memoria, suma sobre cargas acumulada en float64')
     args = parser.parse_args()
-    main(arr=args.arr, out=args.out)
+    main(arr=args.arr, out=args.out, workers=args.workers, cache=not args.no_cache, seed=args.seed,
+         workers_graficos=args.workers_graficos, calidad=args.calidad, precision=args.precision)
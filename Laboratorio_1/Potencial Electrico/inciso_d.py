@@ -1,15 +1,8 @@
-import os
-import sys
 import argparse
 import numpy as np
 
-# ensure incisos_common in sibling 'Campo Electrico' is importable
-THIS_DIR = os.path.dirname(__file__)
-COMMON_DIR = os.path.abspath(os.path.join(THIS_DIR, '..', 'Campo Electrico'))
-if COMMON_DIR not in sys.path:
-    sys.path.insert(0, COMMON_DIR)
-
-from incisos_common import generate_charges, campo, potencial
+from campo_electrico import generate_charges, campo, potencial, evaluar_malla
+from campo_electrico.render import renderizar
 
 
 def gradV_numeric(x, y, cargas, h=1e-6):
@@ -46,21 +39,129 @@ def compare_directions(cargas, points, h=1e-6):
     return results
 
 
-def main(arr='two_pos', out='plots/potencial', sample_points=None):
-    cargas = generate_charges(arrangement=arr)
+def _derivada(f, h, eje, orden=2):
+    """Derivada de f a lo largo de `eje` con paso uniforme h.
+
+    orden=2: `np.gradient` (centrada en el interior, unilateral de orden 2 en los bordes).
+    orden=4: estencil centrado de 5 puntos (-f[i+2] + 8 f[i+1] - 8 f[i-1] + f[i-2]) / 12h en el
+    interior; en los dos puntos de cada borde queda el resultado de `np.gradient`.
+    """
+    d = np.gradient(f, h, axis=eje, edge_order=2)
+    if orden == 4 and f.shape[eje] >= 5:
+        f = np.moveaxis(f, eje, 0)
+        dm = np.moveaxis(d, eje, 0)
+        dm[2:-2] = (-f[4:] + 8 * f[3:-1] - 8 * f[1:-3] + f[:-4]) / (12 * h)
+    return d
+
+
+def mapa_consistencia(cargas, x, y, V, Ex, Ey, orden=2, radio=0.2):
+    """Compara -∇V (diferencias finitas sobre la malla V) con E analítico en toda la malla.
+
+    x, y: ejes 1D uniformes; V, Ex, Ey: mallas (len(y), len(x)) ya calculadas, así que
+    el chequeo no necesita evaluaciones extra del potencial.
+    Devuelve (angulo_deg, error_magnitud, excluido, estadisticas): el ángulo entre -∇V y E,
+    el error relativo ||∇V| - |E|| / |E|, la máscara de los puntos a menos de `radio` de
+    alguna carga (donde V es singular) y un dict con mediana / p95 / máximo de ambos
+    errores fuera de esos discos.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    V = np.asarray(V)
+    Gx = -_derivada(V, x[1] - x[0], 1, orden)
+    Gy = -_derivada(V, y[1] - y[0], 0, orden)
+    Ex = np.asarray(Ex)
+    Ey = np.asarray(Ey)
+
+    # ángulo con atan2(|cruz|, punto): preciso también para ángulos chicos
+    angulo = np.degrees(np.arctan2(np.abs(Gx * Ey - Gy * Ex), Gx * Ex + Gy * Ey))
+    magE = np.hypot(Ex, Ey)
+    error_mag = np.abs(np.hypot(Gx, Gy) - magE) / np.where(magE > 0, magE, np.nan)
+
+    X, Y = np.meshgrid(x, y, copy=False)
+    excluido = np.zeros(V.shape, dtype=bool)
+    for _, xq, yq in cargas:
+        excluido |= (X - xq) ** 2 + (Y - yq) ** 2 < radio ** 2
+
+    estadisticas = {}
+    for nombre, err in (('angulo_deg', angulo), ('error_magnitud', error_mag)):
+        valores = err[~excluido & np.isfinite(err)]
+        estadisticas[nombre] = {'mediana': float(np.median(valores)), 'p95': float(np.percentile(valores, 95)),
+                                'max': float(np.max(valores))}
+    return angulo, error_mag, excluido, estadisticas
+
+
+def dibujar_mapa_consistencia(fig, calidad, x, y, angulo, error_mag, excluido, cargas, orden=2):
+    paso = calidad['paso_malla']
+    fig.set_size_inches(13, 5.5)
+    axes = fig.subplots(1, 2)
+    extent = (x[0], x[-1], y[0], y[-1])
+    for ax, err, titulo, etiqueta in ((axes[0], angulo, 'Ángulo entre -∇V y E', 'log10(ángulo [°])'),
+                                      (axes[1], error_mag, 'Error relativo de |∇V| respecto de |E|',
+                                       'log10(error relativo)')):
+        mapa = np.where(excluido, np.nan, err)[::paso, ::paso]
+        img = ax.imshow(np.log10(mapa + 1e-16), origin='lower', extent=extent, cmap='viridis')
+        fig.colorbar(img, ax=ax, label=etiqueta)
+        for q, xq, yq in cargas:
+            ax.scatter(xq, yq, c='red' if q > 0 else 'blue', s=40)
+        ax.set_title(f'{titulo} (orden {orden})')
+        ax.set_xlabel('x [m]')
+        ax.set_ylabel('y [m]')
+
+
+def plot_mapa_consistencia(x, y, angulo, error_mag, excluido, cargas, out_prefix='plots/potencial', orden=2,
+                           calidad='final', pool=None):
+    renderizar([(dibujar_mapa_consistencia, f"{out_prefix}_gradV_vs_E.png",
+                 dict(x=x, y=y, angulo=angulo, error_mag=error_mag, excluido=excluido, cargas=cargas, orden=orden))],
+               calidad=calidad, pool=pool)
+
+
+def chequeo_malla(cargas, out='plots/potencial', x_min=-3, x_max=3, y_min=-3, y_max=3, n=200, orden=2, radio=0.2,
+                  cache=True, calidad='final'):
+    """Chequeo -∇V vs E en toda la malla de las equipotenciales.
+
+    Con `cache=True` usa la misma entrada del cache de disco que `compute_and_plot_2d`
+    (misma malla y cargas), así que si `inciso_c.py` ya corrió no se evalúa ningún kernel.
+    """
+    x = np.linspace(x_min, x_max, n)
+    y = np.linspace(y_min, y_max, n)
+    if cache:
+        from campo_electrico.cache_mallas import malla_cacheada
+        Ex, Ey, V = malla_cacheada(x, y, cargas)
+    else:
+        Ex, Ey, V = evaluar_malla(x, y, cargas)
+    angulo, error_mag, excluido, est = mapa_consistencia(cargas, x, y, V, Ex, Ey, orden=orden, radio=radio)
+    plot_mapa_consistencia(x, y, angulo, error_mag, excluido, cargas, out_prefix=out, orden=orden, calidad=calidad)
+
+    print(f'\nChequeo en toda la malla {n}x{n} (diferencias finitas de orden {orden}, '
+          f'excluyendo discos de radio {radio} m alrededor de las cargas):')
+    print(f"  ángulo entre -∇V y E: mediana {est['angulo_deg']['mediana']:.2e}°, "
+          f"p95 {est['angulo_deg']['p95']:.2e}°, máx {est['angulo_deg']['max']:.2e}°")
+    print(f"  error relativo de magnitud: mediana {est['error_magnitud']['mediana']:.2e}, "
+          f"p95 {est['error_magnitud']['p95']:.2e}, máx {est['error_magnitud']['max']:.2e}")
+    print(f'  Mapas guardados en {out}_gradV_vs_E.png')
+    return est
+
+
+def main(arr='two_pos', out='plots/potencial', sample_points=None, seed=None, modo='ambos', orden=2, radio=0.2,
+         cache=True, calidad='final'):
+    cargas = generate_charges(arrangement=arr, seed=seed)
     print('Cargas (q [C], x [m], y [m]):')
     for q, xq, yq in cargas:
         print(f'  {q:.3e} , {xq:.3f} , {yq:.3f}')
 
-    if sample_points is None:
-        # elegir algunos puntos de muestra alejados de las cargas
-        sample_points = [(-2.0, 0.5), (-0.5, 0.2), (0.8, -0.3), (1.5, 0.4)]
+    if modo in ('puntos', 'ambos'):
+        if sample_points is None:
+            # elegir algunos puntos de muestra alejados de las cargas
+            sample_points = [(-2.0, 0.5), (-0.5, 0.2), (0.8, -0.3), (1.5, 0.4)]
+
+        res = compare_directions(cargas, sample_points)
+        print('\nChequeo numérico: comparación entre -∇V (numérico) y E (analítico)')
+        for (x, y), angle, magE, magG in res:
+            ang_str = f"{angle:.3f}°" if not np.isnan(angle) else 'nan'
+            print(f"Punto ({x:.3f}, {y:.3f}): ángulo entre -∇V y E = {ang_str}, |E|={magE:.3e}, | -∇V |={magG:.3e}")
 
-    res = compare_directions(cargas, sample_points)
-    print('\nChequeo numérico: comparación entre -∇V (numérico) y E (analítico)')
-    for (x, y), angle, magE, magG in res:
-        ang_str = f"{angle:.3f}°" if not np.isnan(angle) else 'nan'
-        print(f"Punto ({x:.3f}, {y:.3f}): ángulo entre -∇V y E = {ang_str}, |E|={magE:.3e}, | -∇V |={magG:.3e}")
+    if modo in ('malla', 'ambos'):
+        chequeo_malla(cargas, out=out, orden=orden, radio=radio, cache=cache, calidad=calidad)
 
     print('\nDiscusión:')
     print(' - Teóricamente E = -∇V. El chequeo numérico calcula -∇V por diferencias finitas y compara su dirección con E.')
@@ -72,5 +173,13 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Inciso d: discusión y chequeo numérico entre -∇V y E')
     parser.add_argument('--arr', choices=['two_pos', 'two_neg'], default='two_pos')
     parser.add_argument('--out', default='plots/potencial')
+    parser.add_argument('--seed', type=int, default=None, help='semilla para la permutación de magnitudes')
+    parser.add_argument('--modo', choices=['puntos', 'malla', 'ambos'], default='ambos',
+                        help='chequeo en puntos de muestra, en toda la malla 2D, o ambos')
+    parser.add_argument('--orden', type=int, choices=[2, 4], default=2, help='orden de las diferencias finitas')
+    parser.add_argument('--radio', type=float, default=0.2, help='radio [m] excluido alrededor de cada carga')
+    parser.add_argument('--no-cache', action='store_true', help='recalcular la malla 2D sin usar el cache de disco')
+    parser.add_argument('--calidad', choices=['final', 'borrador'], default='final', help='calidad de la figura')
     args = parser.parse_args()
-    main(arr=args.arr, out=args.out)
+    main(arr=args.arr, out=args.out, seed=args.seed, modo=args.modo, orden=args.orden, radio=args.radio,
+         cache=not args.no_cache, calidad=args.calidad)
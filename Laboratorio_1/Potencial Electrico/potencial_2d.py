@@ -0,0 +1,183 @@
+"""Corre los incisos a-d del potencial en un solo proceso, calculando cada cosa una vez.
+
+Cada inciso por separado vuelve a generar las cargas, el perfil 1D y la malla 2D.
+Acá se arma un pipeline de etapas (`campo_electrico.pipeline`) por configuración:
+
+    cargas ─┬─ perfil 1D ── equilibrios ──────────────┐
+            ├─ malla 2D ─┬─ puntos críticos ── figuras 2D (líneas de campo, equipotenciales)
+            │            ├─ malla en disco + heatmap (inciso a)
+            │            └─ chequeo -∇V vs E ── mapa del chequeo (inciso d)
+            ├─ líneas de campo
+            └─ chequeo en puntos de muestra (inciso d)
+
+y las etapas independientes corren a la vez. Con `--workers-graficos N` las figuras
+se dibujan en un pool de N procesos compartido por todas las etapas (`render`); si
+no, se dibujan de a una en este proceso, en paralelo con los cálculos. Correr todos
+los incisos cuesta más o menos lo que el más caro en vez de la suma.
+
+Salidas, con prefijo `--out` (más `_<arreglo>` si se pide más de uno):
+    <out>_V_vs_x.png, <out>_field_lines.png, <out>_equipotentials.png,
+    <out>_heatmap.png, <out>_grid/, <out>_gradV_vs_E.png
+
+Uso:
+    python potencial_2d.py --arr two_pos --out plots/potencial
+    python potencial_2d.py --arr two_pos two_neg --seed 0 --workers-graficos 4 --calidad borrador
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from campo_electrico import generate_charges, compute_1d_along_x, equilibrios_en_x, evaluar_malla, desviacion_precision
+from campo_electrico.graficos import plot_lineas_campo, plot_equipotenciales
+from campo_electrico.lineas_campo import trazar_lineas
+from campo_electrico.pipeline import Pipeline
+from campo_electrico.puntos_criticos import puntos_criticos
+
+from inciso_a import save_grid
+from inciso_c import plot_potential_1d
+from inciso_d import compare_directions, mapa_consistencia, plot_mapa_consistencia
+
+PUNTOS_MUESTRA = [(-2.0, 0.5), (-0.5, 0.2), (0.8, -0.3), (1.5, 0.4)]
+
+
+def etapas_configuracion(p, arr, out, seed=None, limites=(-3, 3, -3, 3), n=200, workers=1, cache=True, orden=2,
+                         radio=0.2, calidad='final', pool=None, precision='float64'):
+    """Agrega al pipeline `p` las etapas de una configuración, con nombres `<arr>/<etapa>`.
+
+    Las figuras se envían a `pool` (procesos) si se pasa; si no, se dibujan en el grupo
+    'figuras' del pipeline, de a una. Con `precision='float32'` se agrega la etapa
+    'desviacion' (perfil y malla contra float64 en una muestra de puntos).
+    """
+    x_min, x_max, y_min, y_max = limites
+    figuras = None if pool is not None else 'figuras'
+
+    def nombre(etapa):
+        return f'{arr}/{etapa}'
+
+    def malla(cargas):
+        x = np.linspace(x_min, x_max, n)
+        y = np.linspace(y_min, y_max, n)
+        if cache:
+            from campo_electrico.cache_mallas import malla_cacheada
+            Ex, Ey, V = malla_cacheada(x, y, cargas, workers=workers, precision=precision)
+        else:
+            Ex, Ey, V = evaluar_malla(x, y, cargas, workers=workers, precision=precision)
+        return x, y, Ex, Ey, V
+
+    def criticos(cargas, m):
+        x, y, Ex, Ey, _ = m
+        return puntos_criticos(cargas, x, y, Ex, Ey)
+
+    def consistencia(cargas, m):
+        x, y, Ex, Ey, V = m
+        return mapa_consistencia(cargas, x, y, V, Ex, Ey, orden=orden, radio=radio)
+
+    def fig_consistencia(cargas, m, c):
+        angulo, error_mag, excluido, _ = c
+        plot_mapa_consistencia(m[0], m[1], angulo, error_mag, excluido, cargas, out_prefix=out, orden=orden,
+                               calidad=calidad, pool=pool)
+
+    def grilla(m):
+        x, y, _, _, V = m
+        X, Y = np.meshgrid(x, y, copy=False)
+        save_grid(X, Y, V, out_prefix=out, calidad=calidad, pool=pool)
+
+    p.etapa(nombre('cargas'), lambda: generate_charges(arrangement=arr, seed=seed))
+    p.etapa(nombre('perfil_1d'), lambda cargas: compute_1d_along_x(cargas, precision=precision), [nombre('cargas')])
+    p.etapa(nombre('equilibrios'), lambda cargas, perfil: equilibrios_en_x(cargas, perfil[0], perfil[1]),
+            [nombre('cargas'), nombre('perfil_1d')])
+    p.etapa(nombre('malla_2d'), malla, [nombre('cargas')])
+    p.etapa(nombre('criticos'), criticos, [nombre('cargas'), nombre('malla_2d')])
+    p.etapa(nombre('lineas'), lambda cargas: trazar_lineas(cargas, x_min, x_max, y_min, y_max), [nombre('cargas')])
+    p.etapa(nombre('chequeo_puntos'), lambda cargas: compare_directions(cargas, PUNTOS_MUESTRA), [nombre('cargas')])
+    p.etapa(nombre('chequeo_malla'), consistencia, [nombre('cargas'), nombre('malla_2d')])
+    if precision != 'float64':
+        p.etapa(nombre('desviacion'),
+                lambda cargas, perfil, m: (desviacion_precision(perfil[0], 0.0, cargas, Ex=perfil[1], V=perfil[2]),
+                                           desviacion_precision(m[0][None, :], m[1][:, None], cargas, *m[2:])),
+                [nombre('cargas'), nombre('perfil_1d'), nombre('malla_2d')])
+
+    p.etapa(nombre('fig_V_vs_x'),
+            lambda perfil: plot_potential_1d(perfil[0], perfil[2], perfil[4], out_prefix=out, calidad=calidad,
+                                             pool=pool),
+            [nombre('perfil_1d')], grupo=figuras)
+    p.etapa(nombre('fig_lineas'),
+            lambda cargas, lineas, crit, eq: plot_lineas_campo(cargas, lineas, crit, limites=limites,
+                                                               out_prefix=out, puntos_eq=eq, calidad=calidad,
+                                                               pool=pool),
+            [nombre('cargas'), nombre('lineas'), nombre('criticos'), nombre('equilibrios')], grupo=figuras)
+    p.etapa(nombre('fig_equipotenciales'),
+            lambda cargas, m, crit, eq: plot_equipotenciales(m[0], m[1], m[4], cargas, crit, out_prefix=out,
+                                                             puntos_eq=eq, calidad=calidad, pool=pool),
+            [nombre('cargas'), nombre('malla_2d'), nombre('criticos'), nombre('equilibrios')], grupo=figuras)
+    p.etapa(nombre('fig_heatmap'), grilla, [nombre('malla_2d')], grupo=figuras)
+    p.etapa(nombre('fig_gradV'), fig_consistencia,
+            [nombre('cargas'), nombre('malla_2d'), nombre('chequeo_malla')], grupo=figuras)
+
+
+def informe(arr, out, r):
+    cargas = r[f'{arr}/cargas']
+    print(f'\n=== {arr} ({out}) ===')
+    print('Cargas (q [C], x [m], y [m]):')
+    for q, xq, yq in cargas:
+        print(f'  {q:.3e} , {xq:.3f} , {yq:.3f}')
+    print('Puntos de equilibrio sobre eje x:', r[f'{arr}/equilibrios'])
+    print('Puntos críticos de E en el plano (x, y, tipo):', r[f'{arr}/criticos'])
+
+    print('Chequeo -∇V vs E en puntos de muestra:')
+    for (x, y), angle, magE, magG in r[f'{arr}/chequeo_puntos']:
+        ang_str = f"{angle:.3f}°" if not np.isnan(angle) else 'nan'
+        print(f"  ({x:.3f}, {y:.3f}): ángulo = {ang_str}, |E|={magE:.3e}, | -∇V |={magG:.3e}")
+    est = r[f'{arr}/chequeo_malla'][3]
+    print(f"Chequeo en toda la malla: ángulo mediana {est['angulo_deg']['mediana']:.2e}° "
+          f"(máx {est['angulo_deg']['max']:.2e}°), error de magnitud mediana "
+          f"{est['error_magnitud']['mediana']:.2e} (máx {est['error_magnitud']['max']:.2e})")
+    if f'{arr}/desviacion' in r:
+        err_1d, err_2d = r[f'{arr}/desviacion']
+        print(f"Desviación vs float64 (relativa al rms): perfil V max={err_1d['V_max']:.2e}, "
+              f"E max={err_1d['E_max']:.2e}; malla V max={err_2d['V_max']:.2e}, E max={err_2d['E_max']:.2e}")
+
+
+def main(arreglos=('two_pos',), out='plots/potencial', seed=None, n=200, workers=1, hilos=4, cache=True, orden=2,
+         radio=0.2, workers_graficos=1, calidad='final', precision='float64'):
+    pool = ProcessPoolExecutor(max_workers=workers_graficos) if workers_graficos > 1 else None
+    p = Pipeline(workers=hilos)
+    prefijos = {}
+    for arr in arreglos:
+        prefijos[arr] = out if len(arreglos) == 1 else f'{out}_{arr}'
+        etapas_configuracion(p, arr, prefijos[arr], seed=seed, n=n, workers=workers, cache=cache, orden=orden,
+                             radio=radio, calidad=calidad, pool=pool, precision=precision)
+    try:
+        r = p.correr()
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    for arr in arreglos:
+        informe(arr, prefijos[arr], r)
+    print('\nTiempos por etapa:')
+    print(p.resumen())
+    return r
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Incisos a-d del potencial en un solo pipeline')
+    parser.add_argument('--arr', nargs='+', choices=['two_pos', 'two_neg'], default=['two_pos'])
+    parser.add_argument('--out', default='plots/potencial')
+    parser.add_argument('--seed', type=int, default=None, help='semilla para la permutación de magnitudes')
+    parser.add_argument('--n', type=int, default=200, help='resolución de la malla 2D (n x n)')
+    parser.add_argument('--workers', type=int, default=1, help='procesos para evaluar cada malla 2D')
+    parser.add_argument('--hilos', type=int, default=4, help='etapas del pipeline que corren a la vez')
+    parser.add_argument('--orden', type=int, choices=[2, 4], default=2, help='orden de las diferencias finitas (inciso d)')
+    parser.add_argument('--radio', type=float, default=0.2, help='radio [m] excluido alrededor de cada carga (inciso d)')
+    parser.add_argument('--no-cache', action='store_true', help='recalcular la malla 2D sin usar el cache de disco')
+    parser.add_argument('--workers-graficos', type=int, default=1, help='procesos para dibujar las figuras')
+    parser.add_argument('--calidad', choices=['final', 'borrador'], default='final', help='calidad de las figuras')
+    parser.add_argument('--precision', choices=['float64', 'float32'], default='float64',
+                        help='float32: mitad de memoria, suma sobre cargas acumulada en float64')
+    args = parser.parse_args()
+    main(arreglos=args.arr, out=args.out, seed=args.seed, n=args.n, workers=args.workers, hilos=args.hilos,
+         cache=not args.no_cache, orden=args.orden, radio=args.radio, workers_graficos=args.workers_graficos,
+         calidad=args.calidad, precision=args.precision)
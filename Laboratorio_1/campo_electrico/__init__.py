@@ -0,0 +1,106 @@
+"""Campo y potencial eléctrico de cargas puntuales (Laboratorio 1).
+
+El núcleo (`nucleo`, `conjunto_cargas`) sólo importa NumPy. Lo demás se carga
+recién cuando se usa: los gráficos (`graficos`, que trae matplotlib), los
+evaluadores alternativos (`barnes_hut`, `particle_mesh`), el cache de mallas, etc.
+
+    from campo_electrico import generate_charges, evaluar_malla, compute_and_plot_2d
+
+Instalación desde la raíz del repositorio: `pip install -e .`
+"""
+
+from .conjunto_cargas import ConjuntoCargas
+from .nucleo import (
+    k,
+    VERSION_KERNEL,
+    PRECISIONES,
+    POSICIONES,
+    MAGNITUDES,
+    SIGNOS,
+    generate_charges,
+    todas_las_configuraciones,
+    parse_configuracion,
+    campo,
+    potencial,
+    campo_potencial,
+    campo_array,
+    potencial_array,
+    campo_potencial_lote,
+    evaluar_malla,
+    desviacion_precision,
+    compute_1d_along_x,
+    compute_1d_along_x_lote,
+    equilibrios_en_x,
+    E_en_x_factory,
+)
+
+# nombre -> submódulo que lo define; se importa en el primer acceso
+_PEREZOSOS = {
+    'plot_1d': 'graficos',
+    'compute_and_plot_2d': 'graficos',
+    'plot_lineas_campo': 'graficos',
+    'plot_equipotenciales': 'graficos',
+    'renderizar': 'render',
+    'ArbolCargas': 'barnes_hut',
+    'malla_cacheada': 'cache_mallas',
+    'crear_malla': 'malla_io',
+    'abrir_malla': 'malla_io',
+    'leer_region': 'malla_io',
+    'trazar_lineas': 'lineas_campo',
+    'MallaSuperposicion': 'superposicion',
+    'MallaAdaptativa': 'malla_adaptativa',
+    'Pipeline': 'pipeline',
+}
+
+__all__ = [
+    'ConjuntoCargas',
+    'k',
+    'VERSION_KERNEL',
+    'PRECISIONES',
+    'POSICIONES',
+    'MAGNITUDES',
+    'SIGNOS',
+    'generate_charges',
+    'todas_las_configuraciones',
+    'parse_configuracion',
+    'campo',
+    'potencial',
+    'campo_potencial',
+    'campo_array',
+    'potencial_array',
+    'campo_potencial_lote',
+    'evaluar_malla',
+    'desviacion_precision',
+    'compute_1d_along_x',
+    'compute_1d_along_x_lote',
+    'equilibrios_en_x',
+    'E_en_x_factory',
+    # perezosos (`_PEREZOSOS`)
+    'plot_1d',
+    'compute_and_plot_2d',
+    'plot_lineas_campo',
+    'plot_equipotenciales',
+    'renderizar',
+    'ArbolCargas',
+    'malla_cacheada',
+    'crear_malla',
+    'abrir_malla',
+    'leer_region',
+    'trazar_lineas',
+    'MallaSuperposicion',
+    'MallaAdaptativa',
+    'Pipeline',
+]
+
+
+def __getattr__(nombre):
+    if nombre in _PEREZOSOS:
+        import importlib
+        valor = getattr(importlib.import_module(f'.{_PEREZOSOS[nombre]}', __name__), nombre)
+        globals()[nombre] = valor
+        return valor
+    raise AttributeError(f'module {__name__!r} has no attribute {nombre!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,211 @@
+"""Evaluador tipo árbol (Barnes–Hut) para nubes grandes de cargas en el plano.
+
+Con miles de cargas la suma directa de `campo_potencial` cuesta
+O(puntos × cargas). Aquí las cargas se ordenan en un quadtree; para cada punto,
+las celdas que se ven "chicas" (ancho / distancia < theta) se reemplazan por su
+desarrollo multipolar (monopolo + dipolo + cuadrupolo respecto del centro de la
+celda) y sólo las hojas cercanas se suman en forma directa. El recorrido se hace
+para todos los puntos a la vez, nivel por nivel, con operaciones de NumPy.
+
+Uso típico (backend de `evaluar_malla`):
+    arbol = ArbolCargas(cargas, theta=0.5)
+    Ex, Ey, V = arbol.campo_potencial(X, Y)
+    print(arbol.error_muestra(X, Y))
+"""
+
+import numpy as np
+
+from .nucleo import k, _charge_array, campo_potencial
+
+
+class ArbolCargas:
+    """Quadtree de cargas con multipolos hasta cuadrupolo en cada celda.
+
+    theta: ángulo de apertura (más chico = más preciso y más lento; 0 = suma directa).
+    hoja: máximo de cargas por hoja.
+    """
+
+    def __init__(self, cargas, theta=0.5, hoja=16, max_prof=40):
+        Q = _charge_array(cargas)
+        if Q.shape[1] == 4 and np.any(Q[:, 3] != 0.0):
+            raise ValueError('ArbolCargas sólo admite cargas en el plano de evaluación (z = 0)')
+        self.Q = Q[:, :3]
+        self.theta = float(theta)
+        self.hoja = int(hoja)
+        self._construir(max_prof)
+        self._multipolos()
+
+    @property
+    def pares_por_punto(self):
+        """Estimación de interacciones por punto, para dimensionar bloques de malla."""
+        return min(len(self.Q), 64 * self.hoja)
+
+    def _construir(self, max_prof):
+        q, xq, yq = self.Q.T
+        n = len(q)
+        if n:
+            x0, x1, y0, y1 = xq.min(), xq.max(), yq.min(), yq.max()
+        else:
+            x0 = x1 = y0 = y1 = 0.0
+        h = max(x1 - x0, y1 - y0, 1e-12) / 2 * (1 + 1e-9)
+
+        cx, cy, mitad, inicio, fin, hijos = [], [], [], [], [], []
+        orden = np.empty(n, dtype=np.intp)
+        pos = 0
+
+        def nodo(idx, x_c, y_c, h_c, prof):
+            nonlocal pos
+            i = len(cx)
+            cx.append(x_c)
+            cy.append(y_c)
+            mitad.append(h_c)
+            inicio.append(pos)
+            fin.append(pos)
+            hijos.append([-1, -1, -1, -1])
+            if len(idx) <= self.hoja or prof >= max_prof:
+                orden[pos:pos + len(idx)] = idx
+                pos += len(idx)
+            else:
+                # cuadrante 0..3 = (derecha) + 2 * (arriba); las hojas quedan contiguas en `orden`
+                cuad = (xq[idx] >= x_c) + 2 * (yq[idx] >= y_c)
+                for c in range(4):
+                    sub = idx[cuad == c]
+                    if len(sub):
+                        sx = 1 if c & 1 else -1
+                        sy = 1 if c & 2 else -1
+                        hijos[i][c] = nodo(sub, x_c + sx * h_c / 2, y_c + sy * h_c / 2, h_c / 2, prof + 1)
+            fin[i] = pos
+            return i
+
+        nodo(np.arange(n), (x0 + x1) / 2, (y0 + y1) / 2, h, 0)
+        self.cx = np.array(cx)
+        self.cy = np.array(cy)
+        self.ancho = 2 * np.array(mitad)
+        self.inicio = np.array(inicio, dtype=np.intp)
+        self.fin = np.array(fin, dtype=np.intp)
+        self.hijos = np.array(hijos, dtype=np.intp)
+        self.es_hoja = np.all(self.hijos < 0, axis=1)
+        # cargas reordenadas para que cada celda sea un rango contiguo
+        self.qs, self.xs, self.ys = self.Q[orden].T.copy()
+
+    def _multipolos(self):
+        """Monopolo, dipolo y cuadrupolo (sin traza) de cada celda respecto de su centro."""
+        m = len(self.cx)
+        largos = self.fin - self.inicio
+        celda = np.repeat(np.arange(m), largos)
+        carga = np.arange(largos.sum()) - np.repeat(np.cumsum(largos) - largos, largos) + np.repeat(self.inicio, largos)
+        q = self.qs[carga]
+        dx = self.xs[carga] - self.cx[celda]
+        dy = self.ys[carga] - self.cy[celda]
+
+        def suma(w):
+            return np.bincount(celda, weights=w, minlength=m)
+
+        self.M = suma(q)
+        self.px = suma(q * dx)
+        self.py = suma(q * dy)
+        sxx = suma(q * dx * dx)
+        syy = suma(q * dy * dy)
+        self.Qxx = 2 * sxx - syy
+        self.Qyy = 2 * syy - sxx
+        self.Qxy = 3 * suma(q * dx * dy)
+
+    def campo_potencial(self, x, y, con_campo=True, con_potencial=True):
+        """Mismo contrato que `nucleo.campo_potencial`, con las cargas del árbol."""
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+        shape = x.shape
+        px = x.ravel()
+        py = y.ravel()
+        P = px.size
+        Ex = np.zeros(P)
+        Ey = np.zeros(P)
+        V = np.zeros(P)
+
+        def acumular(destino, pts, w):
+            destino += np.bincount(pts, weights=w, minlength=P)
+
+        pt = np.arange(P)
+        nd = np.zeros(P, dtype=np.intp)
+        if len(self.Q) == 0:
+            pt = pt[:0]
+            nd = nd[:0]
+        theta2 = self.theta**2
+        while pt.size:
+            Rx = px[pt] - self.cx[nd]
+            Ry = py[pt] - self.cy[nd]
+            R2 = Rx * Rx + Ry * Ry
+            lejos = self.ancho[nd]**2 < theta2 * R2
+            directo = ~lejos & self.es_hoja[nd]
+            abrir = ~lejos & ~self.es_hoja[nd]
+
+            if lejos.any():
+                self._sumar_multipolo(pt[lejos], nd[lejos], Rx[lejos], Ry[lejos], R2[lejos],
+                                      con_campo, con_potencial, acumular, Ex, Ey, V)
+            if directo.any():
+                self._sumar_directo(px, py, pt[directo], nd[directo], con_campo, con_potencial, acumular, Ex, Ey, V)
+
+            hijos = self.hijos[nd[abrir]]
+            validos = hijos >= 0
+            pt = np.repeat(pt[abrir], 4).reshape(-1, 4)[validos]
+            nd = hijos[validos]
+
+        Ex = Ex.reshape(shape) if con_campo else None
+        Ey = Ey.reshape(shape) if con_campo else None
+        V = V.reshape(shape) if con_potencial else None
+        return Ex, Ey, V
+
+    def _sumar_multipolo(self, pt, nd, Rx, Ry, R2, con_campo, con_potencial, acumular, Ex, Ey, V):
+        inv_r2 = 1.0 / R2
+        inv_r = np.sqrt(inv_r2)
+        M, px, py = self.M[nd], self.px[nd], self.py[nd]
+        Qxx, Qxy, Qyy = self.Qxx[nd], self.Qxy[nd], self.Qyy[nd]
+        pR = px * Rx + py * Ry
+        RQR = Qxx * Rx * Rx + 2 * Qxy * Rx * Ry + Qyy * Ry * Ry
+        inv_r3 = inv_r * inv_r2
+        inv_r5 = inv_r3 * inv_r2
+        if con_potencial:
+            acumular(V, pt, k * (M * inv_r + pR * inv_r3 + 0.5 * RQR * inv_r5))
+        if con_campo:
+            radial = M * inv_r3 + 3 * pR * inv_r5 + 2.5 * RQR * inv_r5 * inv_r2
+            acumular(Ex, pt, k * (radial * Rx - px * inv_r3 - (Qxx * Rx + Qxy * Ry) * inv_r5))
+            acumular(Ey, pt, k * (radial * Ry - py * inv_r3 - (Qxy * Rx + Qyy * Ry) * inv_r5))
+
+    def _sumar_directo(self, px, py, pt, nd, con_campo, con_potencial, acumular, Ex, Ey, V):
+        largos = self.fin[nd] - self.inicio[nd]
+        pts = np.repeat(pt, largos)
+        carga = np.arange(largos.sum()) - np.repeat(np.cumsum(largos) - largos, largos) + np.repeat(self.inicio[nd], largos)
+        dx = px[pts] - self.xs[carga]
+        dy = py[pts] - self.ys[carga]
+        r = np.hypot(dx, dy)
+        inv_r = np.divide(1.0, r, out=np.zeros_like(r), where=r != 0.0)
+        kq = k * self.qs[carga]
+        if con_potencial:
+            acumular(V, pts, kq * inv_r)
+        if con_campo:
+            coef = kq * inv_r**3
+            acumular(Ex, pts, coef * dx)
+            acumular(Ey, pts, coef * dy)
+
+    def error_muestra(self, x, y, n=1000, seed=0):
+        """Compara con la suma directa en `n` puntos elegidos al azar entre (x, y).
+
+        Los errores se normalizan por el valor cuadrático medio de la solución directa
+        en la muestra (así no explotan donde V o |E| pasan por cero).
+        Devuelve un dict con 'V_max', 'V_rms', 'E_max', 'E_rms'.
+        """
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+        x = x.ravel()
+        y = y.ravel()
+        rng = np.random.default_rng(seed)
+        idx = rng.choice(x.size, size=min(n, x.size), replace=False)
+        Ex_a, Ey_a, V_a = self.campo_potencial(x[idx], y[idx])
+        Ex_d, Ey_d, V_d = campo_potencial(x[idx], y[idx], self.Q)
+
+        err_V = np.abs(V_a - V_d) / np.sqrt(np.mean(V_d**2))
+        err_E = np.hypot(Ex_a - Ex_d, Ey_a - Ey_d) / np.sqrt(np.mean(Ex_d**2 + Ey_d**2))
+        return {
+            'V_max': float(err_V.max()),
+            'V_rms': float(np.sqrt(np.mean(err_V**2))),
+            'E_max': float(err_E.max()),
+            'E_rms': float(np.sqrt(np.mean(err_E**2))),
+        }
@@ -0,0 +1,323 @@
+"""Benchmarks de los kernels del laboratorio, con comparación contra una corrida de referencia.
+
+Mide, para cada combinación de lado de malla y número de cargas:
+  'campo'       — `evaluar_malla` sólo con E (lado² puntos),
+  'potencial'   — `evaluar_malla` sólo con V (lado² puntos),
+  'perfil_1d'   — `compute_1d_along_x` con `lado` puntos sobre el eje x,
+  'equilibrios' — `equilibrios_en_x` sobre un perfil de `lado` puntos (ya calculado),
+  'figuras_2d'  — `compute_and_plot_2d` completo (malla lado², líneas de campo, puntos
+                  críticos y las dos figuras), en un directorio temporal.
+
+Con 3 cargas se usa el arreglo del laboratorio (`generate_charges`); con más, una nube
+al azar (semilla fija) en el cuadrado [-2.5, 2.5]². De cada caso se guarda el mejor
+tiempo por llamada de `repeticiones` muestras, el rendimiento en puntos·cargas/s y el pico de
+memoria (`tracemalloc`, que ve las reservas de NumPy; no cuenta los procesos hijos
+con `workers > 1`). El pico se mide en una corrida previa que no se cronometra.
+
+Los casos demasiado grandes no se corren y quedan en el JSON como omitidos: los que
+superan `max_pares` puntos·cargas, los que necesitarían más de `mem_max_mb` según una
+estimación gruesa, y 'figuras_2d' con más de 100 cargas (trazar las líneas de campo
+cuesta O(cargas²)).
+
+`comparar` contrasta una corrida con otra guardada (la referencia, de la misma máquina)
+y marca como regresión los casos cuyo rendimiento cae más de `umbral` o cuyo pico de
+memoria crece más de `umbral_memoria` (ignorando casos de menos de 5 ms y cambios de
+memoria de menos de 1 MB); desde la línea de comandos, eso termina con código de salida 1.
+
+Uso:
+    python -m campo_electrico.benchmark --suite rapida --salida bench/base.json
+    python -m campo_electrico.benchmark --suite rapida --salida bench/actual.json --comparar bench/base.json
+    python -m campo_electrico.benchmark --kernels campo potencial --lados 1000 4000 --cargas 3 1000 100000
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+
+from .conjunto_cargas import ConjuntoCargas
+from .nucleo import VERSION_KERNEL, compute_1d_along_x, equilibrios_en_x, evaluar_malla, generate_charges
+
+# `max_pares` acota el trabajo de cada caso; con ~3e7 puntos·cargas/s (un núcleo) la
+# suite rápida tarda unos minutos y la completa varias horas
+SUITES = {
+    'rapida': {'lados': (100, 500, 1000), 'cargas': (3, 100, 1000), 'max_pares': 1e8},
+    'completa': {'lados': (100, 500, 1000, 2000, 4000), 'cargas': (3, 100, 1000, 10_000, 100_000), 'max_pares': 2e10},
+}
+
+MAX_CARGAS_FIGURAS = 100
+
+# límites de la malla y del perfil, los mismos que usan los scripts
+_LIMITES = (-3.0, 3.0)
+
+
+def cargas_benchmark(n_cargas, seed=0):
+    """Las 3 cargas del laboratorio o una nube de `n_cargas` al azar, reproducible con `seed`."""
+    if n_cargas == 3:
+        return generate_charges('two_pos', seed=seed)
+    rng = np.random.default_rng(seed)
+    return ConjuntoCargas(rng.choice([-1, 1], n_cargas) * rng.uniform(1, 3, n_cargas) * 1e-6,
+                          rng.uniform(-2.5, 2.5, n_cargas), rng.uniform(-2.5, 2.5, n_cargas))
+
+
+def _caso_malla(con_campo, con_potencial):
+    def preparar(lado, cargas, opciones):
+        x = np.linspace(*_LIMITES, lado)
+        return lambda: evaluar_malla(x, x, cargas, con_campo=con_campo, con_potencial=con_potencial,
+                                     workers=opciones['workers'], precision=opciones['precision'])
+    return preparar
+
+
+def _caso_perfil(lado, cargas, opciones):
+    return lambda: compute_1d_along_x(cargas, *_LIMITES, n=lado, precision=opciones['precision'])
+
+
+def _caso_equilibrios(lado, cargas, opciones):
+    x_vals, E_total, _, _, _ = compute_1d_along_x(cargas, *_LIMITES, n=lado)
+    return lambda: equilibrios_en_x(cargas, x_vals, E_total)
+
+
+def _caso_figuras(lado, cargas, opciones):
+    from .graficos import compute_and_plot_2d
+
+    carpeta = opciones['carpeta']
+    return lambda: compute_and_plot_2d(cargas, *_LIMITES, *_LIMITES, n=lado, out_prefix=os.path.join(carpeta, 'bench'),
+                                       workers=opciones['workers'], calidad=opciones['calidad'],
+                                       precision=opciones['precision'])
+
+
+# kernel -> (preparar(lado, cargas, opciones) -> función sin argumentos,
+#            puntos(lado),
+#            estimación gruesa de la memoria [MB](lado, n_cargas, bytes por número))
+KERNELS = {
+    'campo': (_caso_malla(True, False), lambda lado: lado * lado,
+              lambda lado, nq, b: 2 * lado * lado * b / 2**20 + 256),
+    'potencial': (_caso_malla(False, True), lambda lado: lado * lado,
+                  lambda lado, nq, b: lado * lado * b / 2**20 + 256),
+    'perfil_1d': (_caso_perfil, lambda lado: lado,
+                  lambda lado, nq, b: 6 * lado * nq * b / 2**20),
+    'equilibrios': (_caso_equilibrios, lambda lado: lado,
+                    lambda lado, nq, b: 6 * lado * nq * 8 / 2**20),
+    'figuras_2d': (_caso_figuras, lambda lado: lado * lado,
+                   lambda lado, nq, b: 3 * lado * lado * b / 2**20 + 256),
+}
+
+
+def _medir(funcion, repeticiones, presupuesto_s, muestra_min_s=0.1):
+    """Pico de memoria [MB] de una corrida con tracemalloc y tiempos [s] por llamada.
+
+    Como `timeit`, los casos rápidos se llaman varias veces seguidas por muestra (hasta
+    durar `muestra_min_s`) para que el ruido del reloj no domine. Se toman `repeticiones`
+    muestras, o menos si ya se gastaron `presupuesto_s` segundos (al menos una).
+    """
+    tracemalloc.start()
+    try:
+        funcion()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    t0 = time.perf_counter()
+    funcion()
+    veces = max(1, min(1000, int(muestra_min_s / max(time.perf_counter() - t0, 1e-9))))
+    tiempos = []
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        for _ in range(veces):
+            funcion()
+        tiempos.append((time.perf_counter() - t0) / veces)
+        if sum(tiempos) * veces >= presupuesto_s:
+            break
+    return pico / 2**20, tiempos
+
+
+def _motivo_omision(kernel, lado, n_cargas, max_pares, mem_max_mb, itemsize):
+    _, puntos, memoria = KERNELS[kernel]
+    if kernel == 'figuras_2d' and n_cargas > MAX_CARGAS_FIGURAS:
+        return f'más de {MAX_CARGAS_FIGURAS} cargas (líneas de campo O(cargas²))'
+    if puntos(lado) * n_cargas > max_pares:
+        return f'más de {max_pares:.0e} puntos·cargas'
+    if memoria(lado, n_cargas, itemsize) > mem_max_mb:
+        return f'más de {mem_max_mb:.0f} MB estimados'
+    return None
+
+
+def clave_caso(caso):
+    return f"{caso['kernel']}/{caso['lado']}/{caso['cargas']}/{caso['precision']}"
+
+
+def correr(kernels=tuple(KERNELS), lados=SUITES['rapida']['lados'], cargas=SUITES['rapida']['cargas'],
+           repeticiones=5, presupuesto_s=30.0, max_pares=SUITES['rapida']['max_pares'], mem_max_mb=4096,
+           workers=1, precision='float64', calidad='final', seed=0, progreso=print):
+    """Corre los casos kernel × lado × cargas y devuelve el resultado como dict (listo para JSON).
+
+    `progreso` recibe una línea de texto por caso (None para no informar).
+    """
+    for kernel in kernels:
+        if kernel not in KERNELS:
+            raise ValueError(f'kernel desconocido {kernel!r}; opciones: {sorted(KERNELS)}')
+    itemsize = np.dtype(precision).itemsize
+    resultado = {
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+        'entorno': {'python': platform.python_version(), 'numpy': np.__version__, 'plataforma': platform.platform(),
+                    'procesador': platform.processor() or platform.machine(), 'cpus': os.cpu_count(),
+                    'version_kernel': VERSION_KERNEL},
+        'opciones': {'repeticiones': repeticiones, 'workers': workers, 'precision': precision, 'calidad': calidad,
+                     'seed': seed},
+        'casos': [],
+    }
+    with tempfile.TemporaryDirectory() as carpeta:
+        opciones = {'workers': workers, 'precision': precision, 'calidad': calidad, 'carpeta': carpeta}
+        for n_cargas in cargas:
+            conjunto = cargas_benchmark(n_cargas, seed=seed)
+            for kernel in kernels:
+                preparar, puntos, _ = KERNELS[kernel]
+                for lado in lados:
+                    caso = {'kernel': kernel, 'lado': lado, 'cargas': n_cargas, 'precision': precision,
+                            'puntos': puntos(lado), 'pares': puntos(lado) * n_cargas}
+                    motivo = _motivo_omision(kernel, lado, n_cargas, max_pares, mem_max_mb, itemsize)
+                    if motivo:
+                        caso['omitido'] = motivo
+                    else:
+                        pico_mb, tiempos = _medir(preparar(lado, conjunto, opciones), repeticiones, presupuesto_s)
+                        caso.update(tiempo_s=min(tiempos), tiempos_s=tiempos,
+                                    pares_por_s=caso['pares'] / min(tiempos), pico_mb=pico_mb)
+                    resultado['casos'].append(caso)
+                    if progreso:
+                        progreso(_linea(caso))
+    return resultado
+
+
+def _linea(caso):
+    nombre = f"{caso['kernel']:<12} lado {caso['lado']:>5}  cargas {caso['cargas']:>6}"
+    if 'omitido' in caso:
+        return f'{nombre}  omitido: {caso["omitido"]}'
+    return (f"{nombre}  {caso['tiempo_s']:>9.4f} s  {caso['pares_por_s']:>9.3e} pts·cargas/s  "
+            f"pico {caso['pico_mb']:>8.1f} MB")
+
+
+def guardar(path, resultado):
+    carpeta = os.path.dirname(path)
+    if carpeta:
+        os.makedirs(carpeta, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(resultado, f, indent=2, ensure_ascii=False)
+
+
+def cargar(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def comparar(actual, referencia, umbral=0.25, umbral_memoria=0.15, min_tiempo_s=0.005, min_memoria_mb=1.0):
+    """Compara dos resultados de `correr` caso por caso (los que están medidos en ambos).
+
+    Devuelve (filas, regresiones): una fila por caso en común con la razón de rendimiento
+    (actual / referencia, < 1 es más lento) y de pico de memoria, y la lista de claves
+    de los casos donde el rendimiento cayó más de `umbral` o la memoria creció más de
+    `umbral_memoria` (fracciones, 0.25 = 25 %). El rendimiento de una misma máquina
+    varía de una corrida a otra (más con casos cortos), por eso el umbral por defecto es holgado.
+
+    Para que el ruido de casos chicos no cuente como regresión hay pisos absolutos: una
+    caída de rendimiento sólo cuenta si el caso tarda al menos `min_tiempo_s` (en alguna de
+    las dos corridas) y un aumento de memoria sólo si el pico crece más de `min_memoria_mb`.
+    """
+    base = {clave_caso(c): c for c in referencia['casos'] if 'omitido' not in c}
+    filas, regresiones = [], []
+    for caso in actual['casos']:
+        clave = clave_caso(caso)
+        if 'omitido' in caso or clave not in base:
+            continue
+        ref = base[clave]
+        rendimiento = caso['pares_por_s'] / ref['pares_por_s']
+        memoria = caso['pico_mb'] / ref['pico_mb'] if ref['pico_mb'] > 0 else 1.0
+        lento = rendimiento < 1 - umbral and max(caso['tiempo_s'], ref['tiempo_s']) >= min_tiempo_s
+        pesado = memoria > 1 + umbral_memoria and caso['pico_mb'] - ref['pico_mb'] > min_memoria_mb
+        regresion = lento or pesado
+        filas.append((clave, rendimiento, memoria, regresion))
+        if regresion:
+            regresiones.append(clave)
+    return filas, regresiones
+
+
+def main(kernels=tuple(KERNELS), suite='rapida', lados=None, cargas=None, repeticiones=5, presupuesto_s=30.0,
+         max_pares=None, mem_max_mb=4096, workers=1, precision='float64', calidad='final', seed=0, salida=None,
+         referencia=None, umbral=0.25, umbral_memoria=0.15, min_tiempo_s=0.005, min_memoria_mb=1.0):
+    """Corre la suite, guarda el JSON en `salida` y, si hay `referencia`, compara.
+
+    `lados`, `cargas` y `max_pares` en None toman los valores de la suite.
+    Devuelve el código de salida: 1 si hubo regresiones respecto de la referencia, 0 si no.
+    """
+    resultado = correr(kernels, lados or SUITES[suite]['lados'], cargas or SUITES[suite]['cargas'],
+                       repeticiones=repeticiones, presupuesto_s=presupuesto_s,
+                       max_pares=max_pares or SUITES[suite]['max_pares'],
+                       mem_max_mb=mem_max_mb, workers=workers, precision=precision, calidad=calidad, seed=seed)
+    if salida:
+        guardar(salida, resultado)
+        print(f'Guardado: {salida}')
+    if not referencia:
+        return 0
+
+    base = cargar(referencia)
+    for campo in ('numpy', 'cpus', 'procesador', 'version_kernel'):
+        if base['entorno'].get(campo) != resultado['entorno'][campo]:
+            print(f"Aviso: la referencia tiene otro {campo} ({base['entorno'].get(campo)} vs "
+                  f"{resultado['entorno'][campo]}); los tiempos pueden no ser comparables")
+    filas, regresiones = comparar(resultado, base, umbral=umbral, umbral_memoria=umbral_memoria,
+                                  min_tiempo_s=min_tiempo_s, min_memoria_mb=min_memoria_mb)
+    print(f'\nComparación con {referencia} (rendimiento y memoria, actual / referencia):')
+    for clave, rendimiento, memoria, regresion in filas:
+        print(f"  {clave:<36} rendimiento {rendimiento:6.2f}  memoria {memoria:6.2f}"
+              f"{'  <- REGRESIÓN' if regresion else ''}")
+    if not filas:
+        print('  (no hay casos en común)')
+    if regresiones:
+        print(f'{len(regresiones)} regresiones (umbral {umbral:.0%} en rendimiento, '
+              f'{umbral_memoria:.0%} en memoria)')
+        return 1
+    print('Sin regresiones')
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmarks de los kernels del laboratorio')
+    parser.add_argument('--suite', choices=sorted(SUITES), default='rapida',
+                        help='rapida: lados 100-1000, hasta 1000 cargas y 1e8 puntos·cargas por caso; '
+                             'completa: lados 100-4000, hasta 1e5 cargas y 2e10 puntos·cargas')
+    parser.add_argument('--kernels', nargs='+', choices=list(KERNELS), default=list(KERNELS))
+    parser.add_argument('--lados', type=int, nargs='+', default=None,
+                        help='lados de malla (reemplazan los de la suite)')
+    parser.add_argument('--cargas', type=int, nargs='+', default=None,
+                        help='números de cargas (reemplazan los de la suite)')
+    parser.add_argument('--repeticiones', type=int, default=5,
+                        help='muestras cronometradas por caso (se toma la mejor)')
+    parser.add_argument('--presupuesto', type=float, default=30.0,
+                        help='segundos por caso a partir de los cuales no se repite más')
+    parser.add_argument('--max-pares', type=float, default=None,
+                        help='omitir casos con más puntos·cargas (por defecto, el de la suite)')
+    parser.add_argument('--mem-max-mb', type=float, default=4096, help='omitir casos que necesitarían más memoria')
+    parser.add_argument('--workers', type=int, default=1, help='procesos para las mallas 2D')
+    parser.add_argument('--precision', choices=['float64', 'float32'], default='float64')
+    parser.add_argument('--calidad', choices=['final', 'borrador'], default='final', help='calidad de las figuras')
+    parser.add_argument('--seed', type=int, default=0, help='semilla de las nubes de cargas')
+    parser.add_argument('--salida', default=None, help='archivo JSON donde guardar los resultados')
+    parser.add_argument('--comparar', default=None, help='JSON de referencia contra el que comparar')
+    parser.add_argument('--umbral', type=float, default=0.25, help='caída de rendimiento tolerada (0.25 = 25 %%)')
+    parser.add_argument('--umbral-memoria', type=float, default=0.15, help='aumento de memoria tolerado')
+    parser.add_argument('--min-tiempo-ms', type=float, default=5.0,
+                        help='casos más cortos no cuentan como regresión de rendimiento')
+    parser.add_argument('--min-memoria-mb', type=float, default=1.0,
+                        help='aumentos de memoria menores no cuentan como regresión')
+    args = parser.parse_args()
+    sys.exit(main(kernels=args.kernels, suite=args.suite, lados=args.lados, cargas=args.cargas,
+                  repeticiones=args.repeticiones, presupuesto_s=args.presupuesto, max_pares=args.max_pares,
+                  mem_max_mb=args.mem_max_mb, workers=args.workers, precision=args.precision, calidad=args.calidad,
+                  seed=args.seed, salida=args.salida, referencia=args.comparar, umbral=args.umbral,
+                  umbral_memoria=args.umbral_memoria, min_tiempo_s=args.min_tiempo_ms / 1000,
+                  min_memoria_mb=args.min_memoria_mb))
@@ -0,0 +1,181 @@
+"""Cache en disco de mallas de campo/potencial, direccionado por contenido.
+
+Cada entrada se guarda en `<dir>/<clave>/` (Ex.npy, Ey.npy, V.npy, meta.json),
+donde la clave es un hash de las cargas, los ejes, las salidas pedidas, la precisión, el
+backend y `VERSION_KERNEL`. Así:
+  - la misma configuración se lee del disco (con mmap) en lugar de recalcularse,
+  - al cambiar los kernels (subir VERSION_KERNEL) las entradas viejas dejan de
+    coincidir y se borran en la siguiente escritura,
+  - si el total supera la cuota, se borran las entradas usadas hace más tiempo (LRU),
+  - las carpetas temporales `.tmp-*` de escrituras interrumpidas (un proceso que murió antes
+    del rename) cuentan para la cuota y se borran cuando pasan `EDAD_TMP_S` sin cambios.
+
+El directorio y la cuota se configuran con las variables de entorno
+LAB1_CACHE_DIR (por defecto ~/.cache/lab1_mallas) y LAB1_CACHE_MB (por defecto 2048).
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from .nucleo import VERSION_KERNEL, _charge_array, evaluar_malla
+
+_SALIDAS = ('Ex', 'Ey', 'V')
+_PREFIJO_TMP = '.tmp-'
+
+# antigüedad (s) a partir de la cual una carpeta temporal se da por abandonada
+EDAD_TMP_S = 3600.0
+
+
+def dir_cache():
+    return os.environ.get('LAB1_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'lab1_mallas'))
+
+
+def cuota_mb():
+    return float(os.environ.get('LAB1_CACHE_MB', 2048))
+
+
+def clave(x, y, cargas, con_campo=True, con_potencial=True, backend='directo', theta=0.5, precision='float64'):
+    """Hash hexadecimal que identifica una malla calculada."""
+    h = hashlib.sha256()
+    Q = np.ascontiguousarray(_charge_array(cargas), dtype=float)
+    for a in (Q, np.asarray(x, dtype=float), np.asarray(y, dtype=float)):
+        h.update(str(a.shape).encode())
+        h.update(np.ascontiguousarray(a).tobytes())
+    params = {'campo': con_campo, 'potencial': con_potencial, 'backend': backend,
+              'theta': theta if backend == 'barnes_hut' else None, 'version': VERSION_KERNEL}
+    if precision != 'float64':
+        # sólo se agrega si no es la precisión por defecto, así las claves float64 no cambian
+        params['precision'] = precision
+    h.update(json.dumps(params, sort_keys=True).encode())
+    return h.hexdigest()[:32]
+
+
+def _tamano(carpeta):
+    return sum(os.path.getsize(os.path.join(carpeta, f)) for f in os.listdir(carpeta))
+
+
+def _tamano_tmp(carpeta):
+    """(tamaño, última modificación) de una carpeta temporal; otro proceso puede estar
+    escribiéndola o renombrándola mientras se recorre."""
+    tam, mtime = 0, 0.0
+    try:
+        mtime = os.path.getmtime(carpeta)
+        for f in os.listdir(carpeta):
+            st = os.stat(os.path.join(carpeta, f))
+            tam += st.st_size
+            mtime = max(mtime, st.st_mtime)
+    except OSError:
+        pass
+    return tam, mtime
+
+
+def _version(carpeta):
+    try:
+        with open(os.path.join(carpeta, 'meta.json')) as f:
+            return json.load(f).get('version')
+    except (OSError, ValueError):
+        return None
+
+
+def limpiar(reservar_mb=0.0):
+    """Borra entradas de otra versión de kernel, carpetas temporales abandonadas y, por LRU,
+    las entradas que excedan la cuota (las temporales en curso también cuentan)."""
+    base = dir_cache()
+    if not os.path.isdir(base):
+        return
+    entradas = []
+    en_curso = 0
+    ahora = time.time()
+    for nombre in os.listdir(base):
+        carpeta = os.path.join(base, nombre)
+        if not os.path.isdir(carpeta):
+            continue
+        if nombre.startswith(_PREFIJO_TMP):
+            tam, mtime = _tamano_tmp(carpeta)
+            if ahora - mtime > EDAD_TMP_S:
+                shutil.rmtree(carpeta, ignore_errors=True)
+            else:
+                en_curso += tam
+            continue
+        if nombre.startswith('.'):
+            continue
+        if _version(carpeta) != VERSION_KERNEL:
+            shutil.rmtree(carpeta, ignore_errors=True)
+            continue
+        entradas.append((os.path.getmtime(carpeta), _tamano(carpeta), carpeta))
+    limite = (cuota_mb() - reservar_mb) * 2**20
+    total = en_curso + sum(t for _, t, _ in entradas)
+    for _, tam, carpeta in sorted(entradas):
+        if total <= limite:
+            break
+        shutil.rmtree(carpeta, ignore_errors=True)
+        total -= tam
+
+
+def leer(key):
+    """Devuelve (Ex, Ey, V) en modo mmap si la entrada existe (None para salidas no guardadas), o None."""
+    carpeta = os.path.join(dir_cache(), key)
+    if not os.path.isdir(carpeta) or _version(carpeta) != VERSION_KERNEL:
+        return None
+    # tocar la carpeta marca la entrada como usada recientemente (LRU)
+    os.utime(carpeta)
+    salida = []
+    for nombre in _SALIDAS:
+        path = os.path.join(carpeta, f'{nombre}.npy')
+        salida.append(np.load(path, mmap_mode='r') if os.path.exists(path) else None)
+    return tuple(salida)
+
+
+def escribir(key, Ex, Ey, V):
+    """Guarda una entrada de forma atómica (carpeta temporal + rename) respetando la cuota.
+
+    Si la entrada ya existe (la escribió otro proceso mientras se calculaba) se deja la que está.
+    """
+    base = dir_cache()
+    os.makedirs(base, exist_ok=True)
+    arrays = dict(zip(_SALIDAS, (Ex, Ey, V)))
+    nbytes = sum(a.nbytes for a in arrays.values() if a is not None)
+    if nbytes > cuota_mb() * 2**20:
+        return
+    limpiar(reservar_mb=nbytes / 2**20)
+    tmp = tempfile.mkdtemp(prefix=_PREFIJO_TMP, dir=base)
+    try:
+        for nombre, a in arrays.items():
+            if a is not None:
+                np.save(os.path.join(tmp, f'{nombre}.npy'), a)
+        with open(os.path.join(tmp, 'meta.json'), 'w') as f:
+            json.dump({'version': VERSION_KERNEL, 'shape': list(np.shape(V if V is not None else Ex))}, f)
+        destino = os.path.join(base, key)
+        try:
+            os.replace(tmp, destino)
+        except OSError:
+            # otro proceso ya guardó la misma clave (no se borra: puede estar leyéndola)
+            if not os.path.isdir(destino):
+                raise
+    finally:
+        if os.path.isdir(tmp):
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+def malla_cacheada(x, y, cargas, con_campo=True, con_potencial=True, backend='directo', theta=0.5,
+                   precision='float64', **kwargs):
+    """Como `evaluar_malla`, pero lee/guarda el resultado en el cache de disco.
+
+    Los argumentos extra (mem_mb, workers) se pasan a `evaluar_malla` en caso de fallo
+    del cache; no forman parte de la clave porque no cambian el resultado. La
+    precisión sí (una malla float32 ocupa la mitad en disco).
+    """
+    key = clave(x, y, cargas, con_campo, con_potencial, backend, theta, precision)
+    guardado = leer(key)
+    if guardado is not None:
+        return guardado
+    Ex, Ey, V = evaluar_malla(x, y, cargas, con_campo=con_campo, con_potencial=con_potencial,
+                              backend=backend, theta=theta, precision=precision, **kwargs)
+    escribir(key, Ex, Ey, V)
+    return Ex, Ey, V
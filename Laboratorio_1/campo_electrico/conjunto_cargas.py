@@ -0,0 +1,117 @@
+"""Conjunto de cargas puntuales guardado en arreglos contiguos de NumPy.
+
+`ConjuntoCargas` reemplaza a la lista de tuplas (q, x, y) cuando hay muchas
+cargas: los datos viven en un único arreglo (N, 3) (o (N, 4) si hay z) que los
+kernels vectorizados usan directamente, sin recorrer tuplas en Python. Para no
+romper los scripts existentes se puede iterar e indexar como la lista de antes.
+"""
+
+import os
+
+import numpy as np
+
+_COLUMNAS = ('q', 'x', 'y', 'z')
+
+
+class ConjuntoCargas:
+    """Cargas puntuales q [C] en (x, y[, z]) [m].
+
+    `datos` es un arreglo C-contiguo de forma (N, 3) con columnas q, x, y, o
+    (N, 4) si se da z (altura de la carga respecto del plano z = 0 donde se evalúa).
+    Iterar devuelve tuplas (q, x, y) como la lista de `generate_charges`.
+    """
+
+    def __init__(self, q, x, y, z=None):
+        cols = [q, x, y] if z is None else [q, x, y, z]
+        cols = np.broadcast_arrays(*[np.asarray(c, dtype=float).ravel() for c in cols])
+        self.datos = np.ascontiguousarray(np.stack(cols, axis=1))
+
+    @classmethod
+    def desde_arreglo(cls, datos):
+        """Construye el conjunto a partir de un arreglo (N, 3) o (N, 4), o uno estructurado con campos q, x, y[, z]."""
+        datos = np.asarray(datos)
+        if datos.dtype.names:
+            z = datos['z'] if 'z' in datos.dtype.names else None
+            return cls(datos['q'], datos['x'], datos['y'], z)
+        datos = np.asarray(datos, dtype=float)
+        if datos.ndim == 1:
+            datos = datos.reshape(-1, 3)
+        if datos.ndim != 2 or datos.shape[1] not in (3, 4):
+            raise ValueError(f'se esperaba un arreglo (N, 3) o (N, 4), no {datos.shape}')
+        return cls(*datos.T)
+
+    @classmethod
+    def desde_tuplas(cls, cargas):
+        """Convierte una lista de tuplas (q, x, y) (o un ConjuntoCargas) en ConjuntoCargas."""
+        if isinstance(cargas, cls):
+            return cargas
+        return cls.desde_arreglo(np.asarray(list(cargas), dtype=float).reshape(-1, 3))
+
+    @classmethod
+    def cargar(cls, path):
+        """Lee cargas desde .npy o .csv.
+
+        El .npy puede ser un arreglo (N, 3)/(N, 4) o estructurado con campos q, x, y[, z].
+        El .csv tiene columnas q, x, y[, z] separadas por comas, con encabezado opcional
+        (si lo tiene, las columnas se toman por nombre).
+        """
+        ext = os.path.splitext(path)[1].lower()
+        if ext == '.npy':
+            return cls.desde_arreglo(np.load(path, mmap_mode='r'))
+        if ext == '.csv':
+            with open(path) as f:
+                primera = f.readline()
+            try:
+                [float(c) for c in primera.split(',')]
+            except ValueError:
+                nombres = [c.strip().lower() for c in primera.split(',')]
+                datos = np.loadtxt(path, delimiter=',', skiprows=1, ndmin=2)
+                cols = {n: datos[:, i] for i, n in enumerate(nombres) if n in _COLUMNAS}
+                return cls(cols['q'], cols['x'], cols['y'], cols.get('z'))
+            return cls.desde_arreglo(np.loadtxt(path, delimiter=',', ndmin=2))
+        raise ValueError(f'formato de cargas no soportado: {path}')
+
+    def guardar(self, path):
+        """Guarda el conjunto como .npy (arreglo N x 3/4) o .csv con encabezado."""
+        if path.lower().endswith('.csv'):
+            np.savetxt(path, self.datos, delimiter=',', header=','.join(_COLUMNAS[:self.datos.shape[1]]),
+                       comments='')
+        else:
+            np.save(path, self.datos)
+
+    @property
+    def q(self):
+        return self.datos[:, 0]
+
+    @property
+    def x(self):
+        return self.datos[:, 1]
+
+    @property
+    def y(self):
+        return self.datos[:, 2]
+
+    @property
+    def z(self):
+        return self.datos[:, 3] if self.datos.shape[1] == 4 else None
+
+    def __len__(self):
+        return self.datos.shape[0]
+
+    def __iter__(self):
+        for q, x, y in self.datos[:, :3].tolist():
+            yield q, x, y
+
+    def __getitem__(self, idx):
+        if isinstance(idx, (int, np.integer)):
+            q, x, y = self.datos[idx, :3].tolist()
+            return q, x, y
+        return ConjuntoCargas.desde_arreglo(self.datos[idx])
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None or np.dtype(dtype) == self.datos.dtype:
+            return self.datos.copy() if copy else self.datos
+        return self.datos.astype(dtype)
+
+    def __repr__(self):
+        return f'ConjuntoCargas(N={len(self)}, q_total={self.q.sum():.3e} C)'
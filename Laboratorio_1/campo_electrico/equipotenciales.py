@@ -0,0 +1,219 @@
+"""Extracción de equipotenciales (marching squares) sin matplotlib y exportación binaria.
+
+`plt.contour` necesita una figura y no devuelve geometría reutilizable. Aquí las
+curvas de nivel se sacan directamente del arreglo V:
+  - cada celda de la malla se clasifica según qué esquinas superan el nivel y el
+    cruce sobre cada arista se interpola linealmente (las sillas se resuelven con
+    el promedio de las 4 esquinas),
+  - cada cruce se identifica por la arista global donde cae, así los segmentos de
+    celdas vecinas (y de bloques de filas distintos) se encadenan en polilíneas,
+  - V se recorre por bloques de filas, de modo que sirve un memmap de
+    `malla_io.abrir_malla` sin cargar la malla entera.
+
+El resultado es una lista de tuplas (nivel, [polilíneas (m, 2)]), que se guarda en
+un archivo binario compacto (`guardar_equipotenciales`) que otras herramientas
+pueden leer sin la malla (`leer_equipotenciales`).
+
+Uso:
+    python -m campo_electrico.equipotenciales plots/potencial --niveles 30
+"""
+
+import argparse
+import struct
+
+import numpy as np
+
+_MAGIA = b'EQP1'
+_CABECERA = struct.Struct('<4sIIQ')
+
+# Aristas de una celda: 0 abajo (v00-v10), 1 derecha (v10-v11), 2 arriba (v01-v11), 3 izquierda (v00-v01).
+# Caso = b0 + 2*b1 + 4*b2 + 8*b3 con b = (esquina >= nivel) en el orden v00, v10, v11, v01.
+_CASOS = {
+    1: [(3, 0)], 2: [(0, 1)], 3: [(3, 1)], 4: [(1, 2)], 6: [(0, 2)], 7: [(2, 3)],
+    8: [(2, 3)], 9: [(0, 2)], 11: [(1, 2)], 12: [(3, 1)], 13: [(0, 1)], 14: [(3, 0)],
+}
+# sillas: (segmentos si el centro está por encima, segmentos si está por debajo)
+_SILLAS = {
+    5: ([(0, 1), (2, 3)], [(3, 0), (1, 2)]),
+    10: ([(3, 0), (1, 2)], [(0, 1), (2, 3)]),
+}
+
+
+def niveles_por_defecto(V, n=30):
+    """n niveles equiespaciados entre los percentiles 1 y 99 de V (evita que las singularidades
+    junto a las cargas se lleven todos los niveles). Con mallas grandes usa una submuestra."""
+    paso = max(1, int(np.sqrt(V.size / 1e6)))
+    muestra = np.asarray(V[::paso, ::paso])
+    muestra = muestra[np.isfinite(muestra)]
+    lo, hi = np.percentile(muestra, [1, 99])
+    return np.linspace(lo, hi, n)
+
+
+def _segmentos_bloque(x, y, V, i0, nivel):
+    """Segmentos del bloque de filas V (filas i0.. de la malla global) como pares de ids de arista,
+    más los ids y coordenadas de los cruces usados."""
+    nx = x.size
+    n_horiz = y.size * (nx - 1)
+    v00, v10 = V[:-1, :-1], V[:-1, 1:]
+    v01, v11 = V[1:, :-1], V[1:, 1:]
+    caso = ((v00 >= nivel) * 1 + (v10 >= nivel) * 2 + (v11 >= nivel) * 4 + (v01 >= nivel) * 8)
+    valida = np.isfinite(v00) & np.isfinite(v10) & np.isfinite(v01) & np.isfinite(v11)
+    caso[~valida] = 0
+
+    def id_arista(ii, jj, arista):
+        # ii, jj: fila/columna de la celda en la malla global
+        return np.select(
+            [arista == 0, arista == 1, arista == 2],
+            [ii * (nx - 1) + jj, n_horiz + ii * nx + jj + 1, (ii + 1) * (nx - 1) + jj],
+            n_horiz + ii * nx + jj,
+        )
+
+    pares = []
+    for c in range(1, 15):
+        ii, jj = np.nonzero(caso == c)
+        if ii.size == 0:
+            continue
+        if c in _SILLAS:
+            centro = (v00[ii, jj] + v10[ii, jj] + v01[ii, jj] + v11[ii, jj]) / 4 >= nivel
+            grupos = [(centro, _SILLAS[c][0]), (~centro, _SILLAS[c][1])]
+        else:
+            grupos = [(np.ones(ii.size, dtype=bool), _CASOS[c])]
+        for sel, segs in grupos:
+            for a, b in segs:
+                gi = ii[sel] + i0
+                pares.append(np.column_stack([id_arista(gi, jj[sel], np.full(gi.size, a)),
+                                              id_arista(gi, jj[sel], np.full(gi.size, b))]))
+    if not pares:
+        return np.empty((0, 2), dtype=np.int64), np.empty(0, dtype=np.int64), np.empty((0, 2))
+
+    pares = np.concatenate(pares).astype(np.int64)
+    ids = np.unique(pares)
+    coords = np.empty((ids.size, 2))
+    horiz = ids < n_horiz
+    # aristas horizontales: entre (i, j) y (i, j+1)
+    i, j = np.divmod(ids[horiz], nx - 1)
+    va, vb = V[i - i0, j], V[i - i0, j + 1]
+    t = (nivel - va) / (vb - va)
+    coords[horiz] = np.column_stack([x[j] + t * (x[j + 1] - x[j]), y[i]])
+    # aristas verticales: entre (i, j) y (i+1, j)
+    i, j = np.divmod(ids[~horiz] - n_horiz, nx)
+    va, vb = V[i - i0, j], V[i - i0 + 1, j]
+    t = (nivel - va) / (vb - va)
+    coords[~horiz] = np.column_stack([x[j], y[i] + t * (y[i + 1] - y[i])])
+    return pares, ids, coords
+
+
+def _encadenar(pares, ids, coords):
+    """Une segmentos que comparten arista en polilíneas (abiertas primero, luego las cerradas)."""
+    if pares.shape[0] == 0:
+        return []
+    nodo = np.searchsorted(ids, pares)          # (S, 2) índices compactos
+    # cada arista la comparten a lo sumo 2 celdas, así que cada nodo tiene 1 o 2 vecinos
+    extremo = np.concatenate([nodo[:, 0], nodo[:, 1]])
+    otro = np.concatenate([nodo[:, 1], nodo[:, 0]])
+    orden = np.argsort(extremo, kind='stable')
+    extremo, otro = extremo[orden], otro[orden]
+    grado = np.bincount(extremo, minlength=ids.size)
+    primero = np.concatenate([[0], np.cumsum(grado)[:-1]])
+    vecinos = np.full((ids.size, 2), -1, dtype=np.int64)
+    vecinos[extremo, np.arange(extremo.size) - primero[extremo]] = otro
+    visitado = np.zeros(ids.size, dtype=bool)
+    lineas = []
+    inicios = list(np.flatnonzero(grado == 1)) + list(np.flatnonzero(grado == 2))
+    for inicio in inicios:
+        if visitado[inicio]:
+            continue
+        camino = [inicio]
+        visitado[inicio] = True
+        previo, actual = -1, inicio
+        while True:
+            sig = vecinos[actual, 0] if vecinos[actual, 0] != previo else vecinos[actual, 1]
+            if sig < 0:
+                break
+            if visitado[sig]:
+                if sig == inicio:
+                    camino.append(inicio)    # curva cerrada
+                break
+            camino.append(sig)
+            visitado[sig] = True
+            previo, actual = actual, sig
+        lineas.append(coords[camino])
+    return lineas
+
+
+def extraer(x, y, V, niveles=30, filas_por_bloque=512):
+    """Equipotenciales de V (len(y), len(x)) como lista de tuplas (nivel, [polilíneas (m, 2)]).
+
+    niveles: cantidad (usa `niveles_por_defecto`) o lista de valores. V puede ser un memmap:
+    se lee por bloques de `filas_por_bloque` filas (con una fila de solapamiento), una
+    sola vez: cada bloque se procesa para todos los niveles antes de pasar al siguiente.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if np.isscalar(niveles):
+        niveles = niveles_por_defecto(V, int(niveles))
+    partes_por_nivel = [[] for _ in niveles]
+    for i0 in range(0, y.size - 1, filas_por_bloque):
+        bloque = np.asarray(V[i0:min(i0 + filas_por_bloque + 1, y.size)], dtype=float)
+        for partes, nivel in zip(partes_por_nivel, niveles):
+            partes.append(_segmentos_bloque(x, y, bloque, i0, nivel))
+    resultado = []
+    for nivel, partes in zip(niveles, partes_por_nivel):
+        pares = np.concatenate([p[0] for p in partes])
+        ids, unicos = np.unique(np.concatenate([p[1] for p in partes]), return_index=True)
+        coords = np.concatenate([p[2] for p in partes])[unicos]
+        resultado.append((float(nivel), _encadenar(pares, ids, coords)))
+    return resultado
+
+
+def guardar_equipotenciales(path, resultado):
+    """Archivo binario: cabecera (magia, n_niveles, n_lineas, n_puntos), niveles float64,
+    líneas por nivel uint32, largo de cada línea uint32 y los puntos (x, y) en float32."""
+    niveles = np.array([n for n, _ in resultado], dtype='<f8')
+    por_nivel = np.array([len(ls) for _, ls in resultado], dtype='<u4')
+    lineas = [l for _, ls in resultado for l in ls]
+    largos = np.array([len(l) for l in lineas], dtype='<u4')
+    puntos = np.concatenate(lineas).astype('<f4') if lineas else np.empty((0, 2), dtype='<f4')
+    with open(path, 'wb') as f:
+        f.write(_CABECERA.pack(_MAGIA, niveles.size, largos.size, puntos.shape[0]))
+        for a in (niveles, por_nivel, largos, puntos):
+            f.write(a.tobytes())
+
+
+def leer_equipotenciales(path):
+    """Lee un archivo de `guardar_equipotenciales` y devuelve la lista de (nivel, [polilíneas])."""
+    with open(path, 'rb') as f:
+        datos = f.read()
+    magia, n_niv, n_lin, n_pts = _CABECERA.unpack_from(datos)
+    if magia != _MAGIA:
+        raise ValueError(f'{path} no es un archivo de equipotenciales')
+    pos = _CABECERA.size
+    niveles = np.frombuffer(datos, '<f8', n_niv, pos)
+    pos += niveles.nbytes
+    por_nivel = np.frombuffer(datos, '<u4', n_niv, pos)
+    pos += por_nivel.nbytes
+    largos = np.frombuffer(datos, '<u4', n_lin, pos)
+    pos += largos.nbytes
+    puntos = np.frombuffer(datos, '<f4', 2 * n_pts, pos).reshape(-1, 2)
+    cortes = np.cumsum(np.concatenate([[0], largos]))
+    lineas = [puntos[a:b] for a, b in zip(cortes[:-1], cortes[1:])]
+    limites = np.cumsum(np.concatenate([[0], por_nivel]))
+    return [(float(n), lineas[a:b]) for n, a, b in zip(niveles, limites[:-1], limites[1:])]
+
+
+if __name__ == '__main__':
+    from .malla_io import abrir_malla
+
+    parser = argparse.ArgumentParser(description='Extrae equipotenciales de una malla guardada (V.npy)')
+    parser.add_argument('prefijo', help='prefijo de la malla (la carpeta <prefijo>_grid de inciso_a.py)')
+    parser.add_argument('--niveles', type=int, default=30)
+    parser.add_argument('--filas', type=int, default=512, help='filas por bloque al recorrer la malla')
+    parser.add_argument('--salida', default=None, help='archivo de salida (por defecto <prefijo>_equipotenciales.eqp)')
+    args = parser.parse_args()
+
+    x, y, V = abrir_malla(args.prefijo)
+    resultado = extraer(x, y, V, niveles=args.niveles, filas_por_bloque=args.filas)
+    salida = args.salida or f'{args.prefijo}_equipotenciales.eqp'
+    guardar_equipotenciales(salida, resultado)
+    n_lineas = sum(len(ls) for _, ls in resultado)
+    print(f'{len(resultado)} niveles, {n_lineas} polilíneas -> {salida}')
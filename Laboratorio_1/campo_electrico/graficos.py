@@ -0,0 +1,210 @@
+"""Gráficos de los incisos: perfiles sobre el eje x, líneas de campo y equipotenciales.
+
+Las figuras se dibujan con la API orientada a objetos de matplotlib a través de
+`render.renderizar` (sin pyplot), así varias se pueden dibujar a la vez en procesos
+separados (`workers_graficos`) y con calidad 'final' o 'borrador' (`calidad`).
+Cada figura tiene su función `dibujar_*(fig, calidad, **datos)`; `trabajos_1d` y
+`trabajos_2d` arman los trabajos para juntarlos en una sola llamada a `renderizar`.
+
+Es el único módulo del paquete (junto con `render`) que importa matplotlib;
+`campo_electrico` lo carga recién cuando se pide una de estas funciones.
+"""
+
+import numpy as np
+from matplotlib.collections import LineCollection
+
+from .nucleo import campo_potencial, evaluar_malla
+from .render import renderizar
+
+
+def dibujar_E_vs_x(fig, calidad, x_vals, E_total, E_individual, puntos_eq=None):
+    fig.set_size_inches(8, 5)
+    ax = fig.add_subplot()
+    for i in range(E_individual.shape[0]):
+        ax.plot(x_vals, E_individual[i, :], '--', label=f"E(x) carga {i+1}")
+    ax.plot(x_vals, E_total, 'k', label="E(x) total")
+    ax.axhline(0, color="gray", linestyle=":")
+    if puntos_eq:
+        xs = list(puntos_eq)
+        ys = [0.0] * len(xs)
+        ax.scatter(xs, ys, c='green', marker='x', s=80, label='Equilibrio')
+    ax.legend()
+    ax.set_xlabel("x [m]")
+    ax.set_ylabel("E_x [N/C]")
+    ax.set_title("Campo eléctrico sobre el eje x (contribuciones y total)")
+    ax.grid()
+
+
+def dibujar_V_vs_x(fig, calidad, x_vals, V_total, V_individual, puntos_eq=None):
+    fig.set_size_inches(8, 5)
+    ax = fig.add_subplot()
+    for i in range(V_individual.shape[0]):
+        ax.plot(x_vals, V_individual[i, :], '--', label=f"V(x) carga {i+1}")
+    ax.plot(x_vals, V_total, 'k', label="V(x) total")
+    if puntos_eq:
+        for rx in puntos_eq:
+            ax.axvline(rx, color='green', linestyle=':', alpha=0.7)
+    ax.legend()
+    ax.set_xlabel("x [m]")
+    ax.set_ylabel("V [Volt]")
+    ax.set_title("Potencial sobre el eje x")
+    ax.grid()
+
+
+def dibujar_lineas_campo(fig, calidad, cargas, lineas, criticos=(), limites=(-3, 3, -3, 3), puntos_eq=None):
+    """Líneas de campo ya trazadas (`lineas_campo.trazar_lineas`), coloreadas por log|E| (puede no haber ninguna)."""
+    x_min, x_max, y_min, y_max = limites
+    fig.set_size_inches(8, 6)
+    ax = fig.add_subplot()
+    tramos = [np.stack([l[:-1], l[1:]], axis=1) for l in lineas if len(l) > 1]
+    trazo = None
+    if tramos:
+        segmentos = np.concatenate(tramos)
+        medios = segmentos.mean(axis=1)
+        Ex_s, Ey_s, _ = campo_potencial(medios[:, 0], medios[:, 1], cargas, con_potencial=False)
+        trazo = LineCollection(segmentos, cmap="inferno", linewidths=1.0)
+        trazo.set_array(np.log(np.hypot(Ex_s, Ey_s) + 1e-12))
+        ax.add_collection(trazo)
+    ax.set_xlim(x_min, x_max)
+    ax.set_ylim(y_min, y_max)
+    for q, xq, yq in cargas:
+        ax.scatter(xq, yq, c='red' if q > 0 else 'blue', s=100)
+        ax.text(xq, yq + 0.08, f"{q:.1e} C", ha='center')
+    if puntos_eq:
+        for rx in puntos_eq:
+            ax.scatter(rx, 0.0, c='green', marker='x', s=100)
+    _marcar_criticos(ax, criticos)
+    ax.set_title("Líneas de campo eléctrico")
+    ax.set_xlabel("x [m]")
+    ax.set_ylabel("y [m]")
+    if trazo is not None:
+        fig.colorbar(trazo, ax=ax, label="log|E|")
+    ax.grid()
+
+
+def dibujar_equipotenciales(fig, calidad, x, y, V, cargas, criticos=(), puntos_eq=None):
+    """Curvas de nivel de la malla V (ejes 1D x, y)."""
+    paso = calidad['paso_malla']
+    X, Y = np.meshgrid(x[::paso], y[::paso], copy=False)
+    fig.set_size_inches(8, 6)
+    ax = fig.add_subplot()
+    cont = ax.contour(X, Y, V[::paso, ::paso], levels=30, cmap="coolwarm")
+    if calidad['etiquetas_contorno']:
+        ax.clabel(cont, inline=True, fontsize=8)
+    for q, xq, yq in cargas:
+        ax.scatter(xq, yq, c='red' if q > 0 else 'blue', s=100)
+    if puntos_eq:
+        for rx in puntos_eq:
+            ax.scatter(rx, 0.0, c='green', marker='x', s=100)
+    _marcar_criticos(ax, criticos)
+    ax.set_title("Superficies equipotenciales")
+    ax.set_xlabel("x [m]")
+    ax.set_ylabel("y [m]")
+    ax.grid()
+
+
+def trabajos_1d(x_vals, E_total, V_total, E_individual, V_individual, out_prefix='plots/inciso_c', puntos_eq=None):
+    """Trabajos de `render.renderizar` para `<out_prefix>_E_vs_x.png` y `<out_prefix>_V_vs_x.png`."""
+    return [
+        (dibujar_E_vs_x, f"{out_prefix}_E_vs_x.png",
+         dict(x_vals=x_vals, E_total=E_total, E_individual=E_individual, puntos_eq=puntos_eq)),
+        (dibujar_V_vs_x, f"{out_prefix}_V_vs_x.png",
+         dict(x_vals=x_vals, V_total=V_total, V_individual=V_individual, puntos_eq=puntos_eq)),
+    ]
+
+
+def trabajos_2d(cargas, x, y, V, lineas, criticos=(), out_prefix='plots/inciso_e', puntos_eq=None):
+    """Trabajos para `<out_prefix>_field_lines.png` y `<out_prefix>_equipotentials.png`.
+
+    x, y: ejes 1D de la malla V; los límites de la figura de líneas de campo son los de la malla.
+    """
+    limites = (x[0], x[-1], y[0], y[-1])
+    return [
+        (dibujar_lineas_campo, f"{out_prefix}_field_lines.png",
+         dict(cargas=cargas, lineas=lineas, criticos=criticos, limites=limites, puntos_eq=puntos_eq)),
+        (dibujar_equipotenciales, f"{out_prefix}_equipotentials.png",
+         dict(x=x, y=y, V=V, cargas=cargas, criticos=criticos, puntos_eq=puntos_eq)),
+    ]
+
+
+def plot_1d(x_vals, E_total, V_total, E_individual, V_individual, out_prefix='plots/inciso_c', puntos_eq=None,
+            workers_graficos=1, calidad='final'):
+    renderizar(trabajos_1d(x_vals, E_total, V_total, E_individual, V_individual, out_prefix=out_prefix,
+                           puntos_eq=puntos_eq), workers=workers_graficos, calidad=calidad)
+
+
+def calcular_2d(cargas, x_min=-3, x_max=3, y_min=-3, y_max=3, n=200, workers=1, backend='directo', theta=0.5,
+                cache=False, simetria=True, precision='float64'):
+    """Lo que necesitan las figuras 2D: malla (Ex, Ey, V), líneas de campo y puntos críticos.
+
+    Con `precision='float32'` la malla se calcula y guarda en float32 (ver `nucleo.campo_potencial`).
+    Devuelve un dict con x, y, Ex, Ey, V, lineas y criticos.
+    """
+    from .puntos_criticos import puntos_criticos
+    from .lineas_campo import trazar_lineas
+
+    x = np.linspace(x_min, x_max, n)
+    y = np.linspace(y_min, y_max, n)
+    if cache:
+        from .cache_mallas import malla_cacheada
+        Ex, Ey, V = malla_cacheada(x, y, cargas, workers=workers, backend=backend, theta=theta, simetria=simetria,
+                                   precision=precision)
+    else:
+        Ex, Ey, V = evaluar_malla(x, y, cargas, workers=workers, backend=backend, theta=theta, simetria=simetria,
+                                  precision=precision)
+    criticos = puntos_criticos(cargas, x, y, Ex, Ey)
+    lineas = trazar_lineas(cargas, x_min=x_min, x_max=x_max, y_min=y_min, y_max=y_max)
+    return dict(x=x, y=y, Ex=Ex, Ey=Ey, V=V, lineas=lineas, criticos=criticos)
+
+
+def compute_and_plot_2d(cargas, x_min=-3, x_max=3, y_min=-3, y_max=3, n=200, out_prefix='plots/inciso_e', puntos_eq=None,
+                        workers=1, backend='directo', theta=0.5, cache=False, simetria=True, workers_graficos=1,
+                        calidad='final', precision='float64'):
+    """Grafica líneas de campo y equipotenciales en 2D.
+
+    Las líneas de campo se integran sobre el campo analítico con
+    `lineas_campo.trazar_lineas` (arrancan en las cargas), no se interpolan de la malla.
+
+    Con `cache=True` la malla (Ex, Ey, V) se lee/guarda en el cache de disco de `cache_mallas`.
+    `workers` son los procesos para la malla; `workers_graficos` los que dibujan las dos figuras.
+    `precision='float32'` calcula y guarda la malla en float32.
+
+    Además busca los puntos críticos (E = 0) en todo el plano con
+    `puntos_criticos.puntos_criticos`, los marca en ambas figuras y los devuelve
+    como lista de tuplas (x, y, tipo).
+    """
+    d = calcular_2d(cargas, x_min, x_max, y_min, y_max, n, workers=workers, backend=backend, theta=theta,
+                    cache=cache, simetria=simetria, precision=precision)
+    renderizar(trabajos_2d(cargas, d['x'], d['y'], d['V'], d['lineas'], d['criticos'], out_prefix=out_prefix,
+                           puntos_eq=puntos_eq), workers=workers_graficos, calidad=calidad)
+    return d['criticos']
+
+
+def plot_lineas_campo(cargas, lineas, criticos=(), limites=(-3, 3, -3, 3), out_prefix='plots/inciso_e',
+                      puntos_eq=None, calidad='final', pool=None):
+    """Dibuja las líneas de campo ya trazadas en `<out_prefix>_field_lines.png`."""
+    renderizar([(dibujar_lineas_campo, f"{out_prefix}_field_lines.png",
+                 dict(cargas=cargas, lineas=lineas, criticos=criticos, limites=limites, puntos_eq=puntos_eq))],
+               calidad=calidad, pool=pool)
+
+
+def plot_equipotenciales(x, y, V, cargas, criticos=(), out_prefix='plots/inciso_e', puntos_eq=None, calidad='final',
+                         pool=None):
+    """Dibuja las curvas de nivel de la malla V (ejes 1D x, y) en `<out_prefix>_equipotentials.png`."""
+    renderizar([(dibujar_equipotenciales, f"{out_prefix}_equipotentials.png",
+                 dict(x=x, y=y, V=V, cargas=cargas, criticos=criticos, puntos_eq=puntos_eq))],
+               calidad=calidad, pool=pool)
+
+
+def _marcar_criticos(ax, criticos):
+    """Marca los puntos críticos (sillas y extremos de V) en los ejes `ax`."""
+    estilos = {'silla': ('s', 'magenta'), 'mínimo': ('v', 'cyan'), 'máximo': ('^', 'orange'),
+               'degenerado': ('D', 'gray')}
+    for tipo, (marker, color) in estilos.items():
+        pts = [(xc, yc) for xc, yc, t in criticos if t == tipo]
+        if pts:
+            xs, ys = zip(*pts)
+            ax.scatter(xs, ys, marker=marker, facecolors='none', edgecolors=color, s=120, linewidths=2,
+                       label=f'Punto crítico ({tipo})')
+    if criticos:
+        ax.legend(loc='upper right', fontsize=8)
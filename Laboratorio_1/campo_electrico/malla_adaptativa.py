@@ -0,0 +1,411 @@
+"""Malla adaptativa (quadtree) para mapas de potencial: refina sólo donde hace falta.
+
+Una malla uniforme gasta casi todos sus puntos en zonas lejanas y suaves y aun
+así resuelve mal las singularidades 1/r alrededor de cada carga. Aquí se parte
+de una malla gruesa de celdas y se divide en 4 cada celda donde la interpolación
+bilineal desde sus esquinas no reproduce V en su centro y en los puntos medios de
+sus lados, hasta `max_nivel` divisiones.
+
+La tolerancia se mide en separaciones entre equipotenciales (`n_niveles` niveles entre
+los percentiles 1 y 99 de V, como `equipotenciales.niveles_por_defecto`): con
+`tol_V=0.003` (por defecto) el error de V queda por debajo de 0.3 % de la distancia entre
+curvas. Las celdas donde V está toda por encima o por debajo del rango de niveles (junto
+a las cargas) no se refinan por V, salvo las que contienen una carga; `tol_E` (por defecto
+0.05 del percentil 95 de |E|) las refina por |E| en todo el dominio.
+
+Después se balancea el árbol (2:1): dos hojas vecinas difieren a lo sumo en un nivel,
+así los nodos colgantes de una hoja son los puntos medios de sus lados, que ya se
+verificaron, y el salto de la interpolación entre hojas vecinas queda dentro de la tolerancia.
+
+Los vértices viven en una red entera fina (la del nivel máximo), así cada punto se
+evalúa una sola vez aunque lo compartan varias celdas; el centro y los puntos medios
+de una celda son esquinas de sus hijas. El resultado se exporta como hojas nativas
+(`MallaAdaptativa.hojas`), se interpola en puntos cualesquiera (`interpolar`) o se
+remuestrea a una malla uniforme (`a_raster`) para graficar. `comparar_uniforme` mide
+el error contra mallas uniformes con el mismo número de evaluaciones y de 4000².
+
+Alcance: la malla adaptativa sólo gana en el error del peor caso, que en una malla uniforme
+está junto a las cargas. Con las cargas del laboratorio y los valores por defecto (~240 mil
+evaluaciones, una malla de ~490²), contra una uniforme del mismo costo:
+  - error máximo de V 0.003 separaciones contra 0.02-0.03 (~8× menos; igualarlo con una
+    uniforme cuesta ~1400²) y de |E| 3-4× menos,
+  - p99 parecido (0.002 en V para las dos),
+  - mediana ~40× peor (5e-4 contra 1e-5): lejos de las cargas las hojas llegan justo a la
+    tolerancia, mientras que la uniforme gasta ahí la mayoría de sus puntos.
+No alcanza a una uniforme de 4000² (mediana 2e-7, p99 3e-5): con interpolación bilineal eso
+pediría `tol_V` ~3e-5 y más evaluaciones que la propia malla de 4000². Con `--tol 0.0005`
+(~910²) sólo el error máximo llega al de una uniforme de ~3600-4000².
+
+Uso:
+    python -m campo_electrico.malla_adaptativa --tol 0.003 --tol-E 0.05 --out plots/adaptativa --comparar
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+from .nucleo import _charge_array, campo_potencial, generate_charges
+
+# puntos por llamada a campo_potencial (acota la memoria de los temporales)
+_BLOQUE = 1 << 15
+
+
+def _evaluar_puntos(px, py, Q, con_campo=True):
+    V = np.empty(px.size)
+    Ex = np.empty(px.size) if con_campo else None
+    Ey = np.empty(px.size) if con_campo else None
+    for i in range(0, px.size, _BLOQUE):
+        s = slice(i, i + _BLOQUE)
+        if con_campo:
+            Ex[s], Ey[s], V[s] = campo_potencial(px[s], py[s], Q)
+        else:
+            V[s] = campo_potencial(px[s], py[s], Q, con_campo=False)[2]
+    return V, Ex, Ey
+
+
+class MallaAdaptativa:
+    """Quadtree de celdas sobre [x_min, x_max] × [y_min, y_max].
+
+    base: celdas por lado en el nivel 0; max_nivel: divisiones máximas de una celda.
+    tol_V: error de interpolación de V tolerado (centro y puntos medios de los lados de
+    cada celda), en fracciones de la separación entre los `n_niveles` equipotenciales
+    (`niveles`, calculados sobre la malla base).
+    tol_E: error de |E| tolerado respecto del percentil 95 de |E| en la malla base (None: sólo V).
+    """
+
+    def __init__(self, cargas, x_min=-3, x_max=3, y_min=-3, y_max=3, base=64, max_nivel=6, tol_V=0.003, tol_E=0.05,
+                 n_niveles=30):
+        self.Q = _charge_array(cargas)
+        self.x_min, self.y_min = float(x_min), float(y_min)
+        self.base = int(base)
+        self.max_nivel = int(max_nivel)
+        # tamaño de la red fina (nivel máximo) en unidades enteras
+        self.N = self.base << self.max_nivel
+        self.hx = (x_max - x_min) / self.N
+        self.hy = (y_max - y_min) / self.N
+        self._claves = np.empty(0, dtype=np.int64)
+        self._valores = np.empty((0, 3))
+        self._refinar(tol_V, tol_E, n_niveles)
+        self._balancear()
+
+    # --- valores en vértices de la red fina -------------------------------------------------------
+    def _clave(self, ix, iy):
+        return iy.astype(np.int64) * (self.N + 1) + ix
+
+    def _valores_en(self, ix, iy):
+        """(V, Ex, Ey) en los vértices enteros (ix, iy); evalúa sólo los que todavía no se conocen."""
+        claves = self._clave(ix, iy)
+        unicas = np.unique(claves)
+        pos = np.searchsorted(self._claves, unicas)
+        conocidas = np.zeros(unicas.size, dtype=bool)
+        if self._claves.size:
+            conocidas = self._claves[np.minimum(pos, self._claves.size - 1)] == unicas
+        nuevas, pos = unicas[~conocidas], pos[~conocidas]
+        if nuevas.size:
+            px = self.x_min + (nuevas % (self.N + 1)) * self.hx
+            py = self.y_min + (nuevas // (self.N + 1)) * self.hy
+            vals = np.column_stack(_evaluar_puntos(px, py, self.Q))
+            # `_claves` queda ordenado: las nuevas se insertan en su lugar
+            self._claves = np.insert(self._claves, pos, nuevas)
+            self._valores = np.insert(self._valores, pos, vals, axis=0)
+        return self._valores[np.searchsorted(self._claves, claves)]
+
+    @property
+    def n_evaluaciones(self):
+        return self._claves.size
+
+    # --- refinamiento -----------------------------------------------------------------------------
+    def _esquinas(self, ix, iy, lado):
+        return [self._valores_en(ix + dx, iy + dy) for dy in (0, lado) for dx in (0, lado)]
+
+    def _contiene_carga(self, ix, iy, lado):
+        cx = (self.Q[:, 1] - self.x_min) / self.hx
+        cy = (self.Q[:, 2] - self.y_min) / self.hy
+        contiene = np.zeros(ix.size, dtype=bool)
+        for xq, yq in zip(cx, cy):
+            contiene |= (ix <= xq) & (xq <= ix + lado) & (iy <= yq) & (yq <= iy + lado)
+        return contiene
+
+    def _refinar(self, tol_V, tol_E, n_niveles):
+        paso0 = 1 << self.max_nivel
+        iy, ix = np.meshgrid(np.arange(self.base) * paso0, np.arange(self.base) * paso0, indexing='ij')
+        ix, iy = ix.ravel(), iy.ravel()
+
+        todos = np.concatenate(self._esquinas(ix, iy, paso0))
+        lo, hi = np.percentile(todos[:, 0], [1, 99])
+        self.niveles = np.linspace(lo, hi, n_niveles)
+        delta = (hi - lo) / (n_niveles - 1) or 1.0
+        if tol_E is not None:
+            escala_E = np.percentile(np.hypot(todos[:, 1], todos[:, 2]), 95) or 1.0
+
+        nivel = 0
+        hojas = []
+        while ix.size:
+            if nivel == self.max_nivel:
+                hojas.append((ix, iy, np.full(ix.size, nivel)))
+                break
+            lado = paso0 >> nivel
+            h = lado // 2
+            v00, v10, v01, v11 = self._esquinas(ix, iy, lado)
+            # centro y puntos medios de los lados: valor exacto vs. interpolación bilineal
+            exactos = [self._valores_en(ix + h, iy + h), self._valores_en(ix + h, iy), self._valores_en(ix, iy + h),
+                       self._valores_en(ix + lado, iy + h), self._valores_en(ix + h, iy + lado)]
+            interp = [(v00 + v10 + v01 + v11) / 4, (v00 + v10) / 2, (v00 + v01) / 2, (v10 + v11) / 2,
+                      (v01 + v11) / 2]
+            err_V = np.max([np.abs(e[:, 0] - i[:, 0]) for e, i in zip(exactos, interp)], axis=0) / delta
+            V_celda = np.stack([v[:, 0] for v in (v00, v10, v01, v11, *exactos)])
+            relevante = (V_celda.max(axis=0) >= lo - delta) & (V_celda.min(axis=0) <= hi + delta)
+            relevante |= self._contiene_carga(ix, iy, lado)
+            dividir = relevante & (err_V > tol_V)
+            if tol_E is not None:
+                err_E = np.max([np.abs(np.hypot(e[:, 1], e[:, 2]) - np.hypot(i[:, 1], i[:, 2]))
+                                for e, i in zip(exactos, interp)], axis=0) / escala_E
+                dividir |= err_E > tol_E
+            hojas.append((ix[~dividir], iy[~dividir], np.full(int((~dividir).sum()), nivel)))
+            ix = np.concatenate([ix[dividir] + dx for dy in (0, h) for dx in (0, h)])
+            iy = np.concatenate([iy[dividir] + dy for dy in (0, h) for dx in (0, h)])
+            nivel += 1
+
+        ix, iy, niv = (np.concatenate(a) for a in zip(*hojas))
+        self._hoja_ix, self._hoja_iy, self._hoja_nivel = ix, iy, niv
+
+    def _buscar_hojas(self, fx, fy):
+        """Índice de la hoja que contiene cada punto (fx, fy) de la red fina: prueba nivel por nivel."""
+        claves_hoja = self._clave(self._hoja_ix, self._hoja_iy) * (self.max_nivel + 1) + self._hoja_nivel
+        orden = np.argsort(claves_hoja)
+        claves_hoja = claves_hoja[orden]
+        hoja = np.full(fx.size, -1, dtype=np.intp)
+        pendientes = np.arange(fx.size)
+        for nivel in range(self.max_nivel + 1):
+            lado = (1 << self.max_nivel) >> nivel
+            ix = (fx[pendientes] // lado).astype(np.int64) * lado
+            iy = (fy[pendientes] // lado).astype(np.int64) * lado
+            c = self._clave(ix, iy) * (self.max_nivel + 1) + nivel
+            pos = np.minimum(np.searchsorted(claves_hoja, c), claves_hoja.size - 1)
+            encontrada = claves_hoja[pos] == c
+            hoja[pendientes[encontrada]] = orden[pos[encontrada]]
+            pendientes = pendientes[~encontrada]
+            if not pendientes.size:
+                break
+        return hoja
+
+    def _balancear(self):
+        """Divide hojas hasta que ninguna tenga una vecina más de un nivel más fina (árbol 2:1)."""
+        while True:
+            ix, iy, niv = self._hoja_ix, self._hoja_iy, self._hoja_nivel
+            # sólo una hoja de nivel <= max_nivel - 2 puede tener vecinas 2 niveles más finas
+            cand = np.flatnonzero(niv <= self.max_nivel - 2)
+            lado = ((1 << self.max_nivel) >> niv[cand]).astype(float)
+            # 4 puntos por lado, justo afuera de la hoja, uno frente a cada cuarto del lado
+            t = (np.arange(4) + 0.5) / 4
+            a = ix[cand, None] + t * lado[:, None]
+            b = iy[cand, None] + t * lado[:, None]
+            fx = np.concatenate([a, a, ix[cand, None] - 0.5 + 0 * t, (ix[cand] + lado)[:, None] + 0.5 + 0 * t], axis=1)
+            fy = np.concatenate([iy[cand, None] - 0.5 + 0 * t, (iy[cand] + lado)[:, None] + 0.5 + 0 * t, b, b], axis=1)
+            dentro = (fx > 0) & (fx < self.N) & (fy > 0) & (fy < self.N)
+            nivel_vecina = np.full(fx.shape, -1)
+            nivel_vecina[dentro] = niv[self._buscar_hojas(fx[dentro], fy[dentro])]
+            dividir = np.zeros(niv.size, dtype=bool)
+            dividir[cand] = nivel_vecina.max(axis=1) > niv[cand] + 1
+            if not dividir.any():
+                return
+            h = ((1 << self.max_nivel) >> niv[dividir]) // 2
+            hijos_ix = np.concatenate([ix[dividir] + dx * h for dy in (0, 1) for dx in (0, 1)])
+            hijos_iy = np.concatenate([iy[dividir] + dy * h for dy in (0, 1) for dx in (0, 1)])
+            self._hoja_ix = np.concatenate([ix[~dividir], hijos_ix])
+            self._hoja_iy = np.concatenate([iy[~dividir], hijos_iy])
+            self._hoja_nivel = np.concatenate([niv[~dividir], np.tile(niv[dividir] + 1, 4)])
+
+    # --- exportación ------------------------------------------------------------------------------
+    @property
+    def hojas(self):
+        """Hojas nativas: dict de arreglos x0, y0, ancho, alto, nivel y V, Ex, Ey en las 4 esquinas
+        (columnas en orden (x0,y0), (x1,y0), (x0,y1), (x1,y1))."""
+        lado = (1 << self.max_nivel) >> self._hoja_nivel
+        esquinas = self._esquinas(self._hoja_ix, self._hoja_iy, lado)
+        return {
+            'x0': self.x_min + self._hoja_ix * self.hx,
+            'y0': self.y_min + self._hoja_iy * self.hy,
+            'ancho': lado * self.hx,
+            'alto': lado * self.hy,
+            'nivel': self._hoja_nivel,
+            'V': np.stack([e[:, 0] for e in esquinas], axis=1),
+            'Ex': np.stack([e[:, 1] for e in esquinas], axis=1),
+            'Ey': np.stack([e[:, 2] for e in esquinas], axis=1),
+        }
+
+    def guardar_hojas(self, path):
+        np.savez(path, **self.hojas)
+
+    def interpolar(self, px, py):
+        """(V, Ex, Ey) en los puntos (px, py) [m], interpolando bilinealmente dentro de la hoja de cada uno."""
+        px, py = np.broadcast_arrays(np.asarray(px, dtype=float), np.asarray(py, dtype=float))
+        fx = np.clip((px.ravel() - self.x_min) / self.hx, 0, self.N * (1 - 1e-12))
+        fy = np.clip((py.ravel() - self.y_min) / self.hy, 0, self.N * (1 - 1e-12))
+        hoja = self._buscar_hojas(fx, fy)
+        lado = (1 << self.max_nivel) >> self._hoja_nivel[hoja]
+        tx = (fx - self._hoja_ix[hoja]) / lado
+        ty = (fy - self._hoja_iy[hoja]) / lado
+        v00, v10, v01, v11 = self._esquinas(self._hoja_ix[hoja], self._hoja_iy[hoja], lado)
+        pesos = ((1 - tx) * (1 - ty), tx * (1 - ty), (1 - tx) * ty, tx * ty)
+        vals = sum(w[:, None] * v for w, v in zip(pesos, (v00, v10, v01, v11)))
+        return tuple(vals[:, i].reshape(px.shape) for i in range(3))
+
+    def a_raster(self, nx, ny=None):
+        """Remuestrea a una malla uniforme nx × ny interpolando bilinealmente dentro de cada hoja.
+
+        Devuelve (x, y, V, Ex, Ey) con V, Ex, Ey de forma (ny, nx).
+        """
+        ny = nx if ny is None else ny
+        x = np.linspace(self.x_min, self.x_min + self.N * self.hx, nx)
+        y = np.linspace(self.y_min, self.y_min + self.N * self.hy, ny)
+        V, Ex, Ey = self.interpolar(x[None, :], y[:, None])
+        return x, y, V, Ex, Ey
+
+
+def _interpolar_uniforme(px, py, Q, limites, n):
+    """(V, Ex, Ey) bilineales en (px, py) desde una malla uniforme n × n sobre `limites`; sólo evalúa
+    las esquinas de las celdas que contienen a los puntos (mismo resultado que armar la malla entera)."""
+    x_min, x_max, y_min, y_max = limites
+    hx, hy = (x_max - x_min) / (n - 1), (y_max - y_min) / (n - 1)
+    i = np.clip(((px - x_min) / hx).astype(int), 0, n - 2)
+    j = np.clip(((py - y_min) / hy).astype(int), 0, n - 2)
+    tx = ((px - x_min) / hx - i)[:, None]
+    ty = ((py - y_min) / hy - j)[:, None]
+    x0, x1 = x_min + i * hx, x_min + (i + 1) * hx
+    y0, y1 = y_min + j * hy, y_min + (j + 1) * hy
+    v00, v10, v01, v11 = (np.column_stack(_evaluar_puntos(xx, yy, Q))
+                          for xx, yy in ((x0, y0), (x1, y0), (x0, y1), (x1, y1)))
+    vals = (1 - tx) * (1 - ty) * v00 + tx * (1 - ty) * v10 + (1 - tx) * ty * v01 + tx * ty * v11
+    return vals[:, 0], vals[:, 1], vals[:, 2]
+
+
+def _estadisticas(err):
+    return {'mediana': float(np.median(err)), 'p99': float(np.percentile(err, 99)), 'max': float(err.max())}
+
+
+def comparar_uniforme(malla, n_referencia=4000, n_muestra=200_000, seed=0):
+    """Error interpolado de la malla adaptativa contra mallas uniformes con interpolación bilineal.
+
+    Se comparan, en `n_muestra` puntos al azar donde V está dentro del rango de las
+    equipotenciales (`malla.niveles`), la malla adaptativa, una uniforme con el mismo
+    número de evaluaciones y una uniforme de `n_referencia`². El error de V se expresa en
+    separaciones entre niveles y el de |E| relativo al percentil 95 de |E| en la muestra.
+    Devuelve un dict nombre -> {'evaluaciones', 'V': {'mediana', 'p99', 'max'}, 'E': {...}}.
+    """
+    rng = np.random.default_rng(seed)
+    x_max = malla.x_min + malla.N * malla.hx
+    y_max = malla.y_min + malla.N * malla.hy
+    limites = (malla.x_min, x_max, malla.y_min, y_max)
+    px = rng.uniform(malla.x_min, x_max, n_muestra)
+    py = rng.uniform(malla.y_min, y_max, n_muestra)
+    V, Ex, Ey = _evaluar_puntos(px, py, malla.Q)
+    lo, hi = malla.niveles[0], malla.niveles[-1]
+    delta = (hi - lo) / (malla.niveles.size - 1) or 1.0
+    adentro = (V >= lo) & (V <= hi)
+    px, py, V = px[adentro], py[adentro], V[adentro]
+    E = np.hypot(Ex, Ey)[adentro]
+    escala_E = np.percentile(E, 95) or 1.0
+
+    n_igual = int(np.ceil(np.sqrt(malla.n_evaluaciones)))
+    candidatos = {
+        'adaptativa': (malla.n_evaluaciones, malla.interpolar(px, py)),
+        f'uniforme {n_igual}²': (n_igual**2, _interpolar_uniforme(px, py, malla.Q, limites, n_igual)),
+        f'uniforme {n_referencia}²': (n_referencia**2, _interpolar_uniforme(px, py, malla.Q, limites, n_referencia)),
+    }
+    informe = {}
+    for nombre, (evaluaciones, (V_i, Ex_i, Ey_i)) in candidatos.items():
+        informe[nombre] = {'evaluaciones': evaluaciones,
+                           'V': _estadisticas(np.abs(V_i - V) / delta),
+                           'E': _estadisticas(np.abs(np.hypot(Ex_i, Ey_i) - E) / escala_E)}
+    return informe
+
+
+def dibujar_malla(fig, calidad, hojas, cargas, x, y, V, niveles):
+    """Hojas del quadtree y equipotenciales remuestreadas a un raster uniforme."""
+    from matplotlib.collections import PolyCollection
+
+    paso = calidad['paso_malla']
+    fig.set_size_inches(13, 6)
+    ax1, ax2 = fig.subplots(1, 2)
+    x0, y0, w, h = hojas['x0'], hojas['y0'], hojas['ancho'], hojas['alto']
+    cuadros = np.stack([np.column_stack([x0, y0]), np.column_stack([x0 + w, y0]),
+                        np.column_stack([x0 + w, y0 + h]), np.column_stack([x0, y0 + h])], axis=1)
+    ax1.add_collection(PolyCollection(cuadros, facecolors='none', edgecolors='k', linewidths=0.2))
+    ax1.set_xlim(x[0], x[-1])
+    ax1.set_ylim(y[0], y[-1])
+    ax1.set_title('Hojas del quadtree')
+    ax2.contour(x[::paso], y[::paso], V[::paso, ::paso], levels=niveles, cmap='coolwarm')
+    ax2.set_title(f'Equipotenciales (raster {x.size}² desde la malla adaptativa)')
+    for ax in (ax1, ax2):
+        for q, xq, yq in cargas:
+            ax.scatter(xq, yq, c='red' if q > 0 else 'blue', s=40)
+        ax.set_xlabel('x [m]')
+        ax.set_ylabel('y [m]')
+        ax.set_aspect('equal')
+
+
+def main(arr='two_pos', seed=None, out='plots/adaptativa', tol_V=0.003, tol_E=0.05, max_nivel=6, n_raster=1000,
+         comparar=False, calidad='final'):
+    """Arma la malla, guarda hojas y figura; con `comparar=True` imprime `comparar_uniforme` y
+    devuelve 1 si la mediana o el p99 del error de V superan `tol_V` o si el error máximo de V o
+    de |E| no es menor que el de la malla uniforme del mismo costo (si no, 0)."""
+    from .render import renderizar
+
+    cargas = generate_charges(arrangement=arr, seed=seed)
+    malla = MallaAdaptativa(cargas, tol_V=tol_V, tol_E=tol_E, max_nivel=max_nivel)
+    hojas = malla.hojas
+    print(f'{hojas["nivel"].size} hojas, {malla.n_evaluaciones} evaluaciones '
+          f'(equivale a ~{int(np.sqrt(malla.n_evaluaciones))}² puntos uniformes; red fina {malla.N}²)')
+
+    os.makedirs(os.path.dirname(out), exist_ok=True)
+    malla.guardar_hojas(f'{out}_hojas.npz')
+    x, y, V, _, _ = malla.a_raster(n_raster)
+    renderizar([(dibujar_malla, f'{out}_malla.png',
+                 dict(hojas=hojas, cargas=cargas, x=x, y=y, V=V, niveles=malla.niveles))], calidad=calidad)
+    print(f'Guardado: {out}_hojas.npz y {out}_malla.png')
+    if not comparar:
+        return 0
+
+    informe = comparar_uniforme(malla)
+    adaptativa, igual_costo = list(informe.values())[:2]
+    print('Error interpolado en puntos dentro del rango de niveles (V en separaciones entre equipotenciales,'
+          ' |E| relativo al percentil 95):')
+    for nombre, e in informe.items():
+        print(f"  {nombre:<16} {e['evaluaciones']:>10} evaluaciones")
+        for campo in ('V', 'E'):
+            print(f"    {campo}  " + '  '.join(f"{m} {e[campo][m]:.1e}" for m in ('mediana', 'p99', 'max')))
+    for campo in ('V', 'E'):
+        cociente = {m: adaptativa[campo][m] / (igual_costo[campo][m] or 1e-300) for m in ('mediana', 'p99', 'max')}
+        print(f'  {campo}: adaptativa / uniforme del mismo costo: '
+              + '  '.join(f'{m} {c:.2g}×' for m, c in cociente.items()))
+
+    fallas = [f'{m} de V {adaptativa["V"][m]:.1e} > tol {tol_V:g}' for m in ('mediana', 'p99')
+              if adaptativa['V'][m] > tol_V]
+    fallas += [f'error máximo de {campo} no menor que el de la uniforme del mismo costo' for campo in ('V', 'E')
+               if adaptativa[campo]['max'] >= igual_costo[campo]['max']]
+    for falla in fallas:
+        print(f'Falla: {falla}')
+    return 1 if fallas else 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Potencial en malla adaptativa (quadtree)')
+    parser.add_argument('--arr', choices=['two_pos', 'two_neg'], default='two_pos')
+    parser.add_argument('--seed', type=int, default=None, help='semilla para la permutación de magnitudes')
+    parser.add_argument('--out', default='plots/adaptativa')
+    parser.add_argument('--tol', type=float, default=0.003,
+                        help='error de V tolerado, en separaciones entre equipotenciales')
+    parser.add_argument('--tol-E', type=float, default=0.05,
+                        help='error de |E| tolerado, relativo al percentil 95 de |E| (negativo: sólo V)')
+    parser.add_argument('--max-nivel', type=int, default=6)
+    parser.add_argument('--n-raster', type=int, default=1000, help='resolución del raster remuestreado')
+    parser.add_argument('--comparar', action='store_true',
+                        help='comparar el error con mallas uniformes (termina con error si no mejora)')
+    parser.add_argument('--calidad', choices=['final', 'borrador'], default='final', help='calidad de la figura')
+    args = parser.parse_args()
+    tol_E = args.tol_E if args.tol_E >= 0 else None
+    sys.exit(main(arr=args.arr, seed=args.seed, out=args.out, tol_V=args.tol, tol_E=tol_E, max_nivel=args.max_nivel,
+                  n_raster=args.n_raster, comparar=args.comparar, calidad=args.calidad))
@@ -0,0 +1,56 @@
+"""Guardado y lectura de mallas 2D (por ejemplo V(x,y)) con memory-mapping.
+
+Formato: una carpeta `<prefijo>_grid/` con
+  - x.npy, y.npy : los ejes 1D (no las mallas X, Y completas),
+  - V.npy        : la matriz (len(y), len(x)) en .npy crudo.
+
+V.npy se crea con `np.lib.format.open_memmap`, así los bloques de
+`evaluar_malla` se escriben directo al disco, y se abre con mmap para leer
+sólo la sub-región pedida sin cargar todo el archivo.
+"""
+
+import os
+
+import numpy as np
+
+
+def ruta_malla(out_prefix):
+    return f"{out_prefix}_grid"
+
+
+def crear_malla(out_prefix, x, y, nombre='V', dtype=float):
+    """Escribe los ejes y devuelve un memmap (len(y), len(x)) listo para llenar por bloques."""
+    carpeta = ruta_malla(out_prefix)
+    os.makedirs(carpeta, exist_ok=True)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    np.save(os.path.join(carpeta, 'x.npy'), x)
+    np.save(os.path.join(carpeta, 'y.npy'), y)
+    return np.lib.format.open_memmap(os.path.join(carpeta, f'{nombre}.npy'), mode='w+', dtype=dtype,
+                                     shape=(y.size, x.size))
+
+
+def abrir_malla(out_prefix, nombre='V'):
+    """Devuelve (x, y, V) con V abierto en modo mmap de sólo lectura.
+
+    También acepta el formato viejo `<prefijo>_grid.npz` (X, Y, V completos), que sí se carga entero.
+    """
+    carpeta = ruta_malla(out_prefix)
+    if not os.path.isdir(carpeta) and os.path.exists(f"{carpeta}.npz"):
+        with np.load(f"{carpeta}.npz") as d:
+            return d['X'][0, :], d['Y'][:, 0], d[nombre]
+    x = np.load(os.path.join(carpeta, 'x.npy'))
+    y = np.load(os.path.join(carpeta, 'y.npy'))
+    V = np.load(os.path.join(carpeta, f'{nombre}.npy'), mmap_mode='r')
+    return x, y, V
+
+
+def leer_region(out_prefix, x_min, x_max, y_min, y_max, nombre='V'):
+    """Lee sólo la sub-región [x_min, x_max] × [y_min, y_max] de una malla guardada.
+
+    Devuelve (x, y, V) de la región; V es una copia en memoria de ese recorte.
+    """
+    x, y, V = abrir_malla(out_prefix, nombre=nombre)
+    j0, j1 = np.searchsorted(x, x_min, side='left'), np.searchsorted(x, x_max, side='right')
+    i0, i1 = np.searchsorted(y, y_min, side='left'), np.searchsorted(y, y_max, side='right')
+    return x[j0:j1], y[i0:i1], np.array(V[i0:i1, j0:j1])
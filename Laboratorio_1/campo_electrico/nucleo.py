@@ -0,0 +1,572 @@
+"""Núcleo numérico: cargas, campo y potencial de cargas puntuales.
+
+Sólo depende de NumPy (y de la biblioteca estándar): no importa matplotlib ni
+scipy, así los scripts que sólo calculan arrancan rápido. El pool de procesos
+y la memoria compartida de `evaluar_malla(workers > 1)` se importan al usarlos,
+y `fsolve` de scipy se importa recién cuando se pide (`_simple_fsolve` es el respaldo propio).
+"""
+
+import itertools
+import random
+from functools import partial
+
+import numpy as np
+
+from .conjunto_cargas import ConjuntoCargas
+
+# Constante de Coulomb
+k = 8.9875517923e9
+
+# versión de los kernels numéricos: subirla cuando cambie el resultado de
+# campo_potencial / evaluar_malla invalida las mallas guardadas en cache_mallas
+VERSION_KERNEL = 1
+
+
+# precisión de las mallas y perfiles: 'float32' calcula los términos por carga y guarda
+# los resultados en float32 (mitad de memoria), pero la suma sobre cargas se acumula en float64
+PRECISIONES = {'float64': np.float64, 'float32': np.float32}
+
+
+def _tipo(precision):
+    if precision not in PRECISIONES:
+        raise ValueError(f'precisión desconocida {precision!r}; opciones: {sorted(PRECISIONES)}')
+    return PRECISIONES[precision]
+
+
+# configuración del laboratorio: posiciones fijas sobre el eje x, magnitudes a permutar
+POSICIONES = [-1.0, 0.5, 2.0]
+MAGNITUDES = [1e-6, 2e-6, 3e-6]
+SIGNOS = {'two_pos': [1, 1, -1], 'two_neg': [-1, -1, 1]}
+
+
+def generate_charges(arrangement='two_pos', seed=None):
+    """Genera 3 cargas sobre el eje x (y=0) con magnitudes distintas.
+    Con `seed` la permutación de magnitudes es reproducible (None = al azar).
+    Devuelve un ConjuntoCargas (se recorre como la lista de tuplas (q, x, y)).
+    """
+    positions = POSICIONES
+    mags = list(MAGNITUDES)
+    random.Random(seed).shuffle(mags)
+
+    if arrangement == 'two_pos':
+        signs = SIGNOS['two_pos']
+    else:
+        signs = SIGNOS['two_neg']
+
+    cargas = [(s * m, x, 0.0) for s, m, x in zip(signs, mags, positions)]
+    return ConjuntoCargas.desde_tuplas(cargas)
+
+
+def todas_las_configuraciones(arreglos=('two_pos', 'two_neg')):
+    """Las 6 permutaciones de magnitudes para cada arreglo de signos (12 en total).
+
+    Devuelve (etiquetas, Qs) con Qs de forma (C, 3): la carga de cada posición de
+    POSICIONES en cada configuración. Las etiquetas son 'arreglo:m1,m2,m3' con las
+    magnitudes en µC en el orden de las posiciones (el formato de `parse_configuracion`).
+    """
+    etiquetas, Qs = [], []
+    for arr in arreglos:
+        for mags in itertools.permutations(MAGNITUDES):
+            etiquetas.append(f"{arr}:{','.join(f'{m * 1e6:g}' for m in mags)}")
+            Qs.append([s * m for s, m in zip(SIGNOS[arr], mags)])
+    return etiquetas, np.array(Qs)
+
+
+def parse_configuracion(etiqueta):
+    """'two_pos:3,1,2' -> cargas (C) por posición, con magnitudes en µC."""
+    arr, mags = etiqueta.split(':')
+    mags = [float(m) * 1e-6 for m in mags.split(',')]
+    if arr not in SIGNOS or len(mags) != len(POSICIONES):
+        raise ValueError(f'configuración inválida: {etiqueta!r}')
+    return np.array([s * m for s, m in zip(SIGNOS[arr], mags)])
+
+
+def campo(x, y, cargas):
+    """Devuelve (Ex, Ey) en el punto (x,y) por superposición de cargas puntuales."""
+    Ex, Ey = 0.0, 0.0
+    for q, xq, yq in cargas:
+        dx, dy = x - xq, y - yq
+        r = np.hypot(dx, dy)
+        if r != 0.0:
+            Ex += k * q * dx / r**3
+            Ey += k * q * dy / r**3
+    return Ex, Ey
+
+
+def potencial(x, y, cargas):
+    """Potencial escalar en (x,y) por superposición."""
+    V = 0.0
+    for q, xq, yq in cargas:
+        dx, dy = x - xq, y - yq
+        r = np.hypot(dx, dy)
+        if r != 0.0:
+            V += k * q / r
+    return V
+
+
+def _charge_array(cargas):
+    """Devuelve las cargas como arreglo (N, 3) de floats (q, x, y), o (N, 4) si tienen z.
+
+    Un ConjuntoCargas se usa sin copiar; una lista de tuplas (q, x, y) se convierte.
+    """
+    if isinstance(cargas, ConjuntoCargas):
+        return cargas.datos
+    Q = np.asarray(cargas, dtype=float)
+    if Q.ndim == 2 and Q.shape[1] in (3, 4):
+        return Q
+    return Q.reshape(-1, 3)
+
+
+def _dist(dx, dy, Q):
+    """Distancia punto-carga; si las cargas tienen z se suma la altura sobre el plano."""
+    if Q.shape[1] == 4:
+        return np.sqrt(dx**2 + dy**2 + np.asarray(Q[:, 3], dtype=dx.dtype)**2)
+    return np.hypot(dx, dy)
+
+
+def campo_potencial(x, y, cargas, con_campo=True, con_potencial=True, precision='float64'):
+    """Evalúa campo y potencial juntos sobre arreglos x, y de cualquier forma (broadcast).
+
+    Las distancias a cada carga se calculan una sola vez y 1/r se reutiliza
+    para V (k q / r) y para E (k q d / r^3). Con `con_campo` / `con_potencial`
+    se piden sólo las salidas necesarias; las no pedidas se devuelven como None.
+    Igual que en `campo`/`potencial`, los puntos con r == 0 no reciben la
+    contribución de esa carga.
+
+    Con `precision='float32'` las diferencias x - xq se redondean una vez a float32, los
+    términos por carga (r, 1/r, d/r^3) se calculan en float32 (la mitad de memoria y
+    ancho de banda en los temporales) y la suma sobre cargas se acumula en float64 con
+    `einsum`, así el error no crece con el número de cargas; el resultado se devuelve en float32.
+
+    Devuelve (Ex, Ey, V) con la misma forma que los puntos.
+    """
+    tipo = _tipo(precision)
+    Q = _charge_array(cargas)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if tipo is np.float64:
+        dx = x[..., None] - Q[:, 1]
+        dy = y[..., None] - Q[:, 2]
+    else:
+        # la resta se hace en float64 por tramos y se escribe en float32 (sin temporal float64 completo)
+        forma = np.broadcast_shapes(x.shape, y.shape) + (len(Q),)
+        dx = np.subtract(x[..., None], Q[:, 1], out=np.empty(forma, tipo), casting='same_kind')
+        dy = np.subtract(y[..., None], Q[:, 2], out=np.empty(forma, tipo), casting='same_kind')
+    r = _dist(dx, dy, Q)
+    inv_r = np.divide(1.0, r, out=np.zeros_like(r), where=r != 0.0)
+    kq = k * Q[:, 0]
+
+    # las sumas sobre cargas son productos matriciales contra kq (sin temporales extra);
+    # en float32, einsum con dtype=float64 convierte por tramos y acumula en float64
+    if tipo is np.float64:
+        def suma(a):
+            return a @ kq
+    else:
+        def suma(a):
+            return np.einsum('...j,j->...', a, kq, dtype=np.float64).astype(tipo)
+
+    Ex = Ey = V = None
+    if con_potencial:
+        V = suma(inv_r)
+    if con_campo:
+        inv_r3 = np.power(inv_r, 3, out=r)
+        Ex = suma(dx * inv_r3)
+        Ey = suma(dy * inv_r3)
+    return Ex, Ey, V
+
+
+def campo_array(x, y, cargas):
+    """Versión vectorizada de `campo`: devuelve (Ex, Ey) sobre arreglos x, y."""
+    Ex, Ey, _ = campo_potencial(x, y, cargas, con_potencial=False)
+    return Ex, Ey
+
+
+def potencial_array(x, y, cargas):
+    """Versión vectorizada de `potencial` sobre arreglos x, y de cualquier forma."""
+    _, _, V = campo_potencial(x, y, cargas, con_campo=False)
+    return V
+
+
+def campo_potencial_lote(x, y, posiciones, Qs, con_campo=True, con_potencial=True):
+    """Evalúa varias configuraciones de cargas que comparten posiciones en una sola pasada.
+
+    posiciones: (N, 2) con (x, y) de cada carga; Qs: (C, N) con la carga de cada
+    posición en cada configuración. Los factores geométricos (1/r, d/r^3) se
+    calculan una vez y se combinan con todas las configuraciones por un producto
+    matricial. Devuelve (Ex, Ey, V) con forma (C, *forma_de_los_puntos).
+    """
+    P = np.asarray(posiciones, dtype=float).reshape(-1, 2)
+    kQ = k * np.atleast_2d(np.asarray(Qs, dtype=float)).T
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    dx = x[..., None] - P[:, 0]
+    dy = y[..., None] - P[:, 1]
+    r = np.hypot(dx, dy)
+    inv_r = np.divide(1.0, r, out=np.zeros_like(r), where=r != 0.0)
+
+    Ex = Ey = V = None
+    if con_potencial:
+        V = np.moveaxis(inv_r @ kQ, -1, 0)
+    if con_campo:
+        inv_r3 = np.power(inv_r, 3, out=r)
+        Ex = np.moveaxis((dx * inv_r3) @ kQ, -1, 0)
+        Ey = np.moveaxis((dy * inv_r3) @ kQ, -1, 0)
+    return Ex, Ey, V
+
+
+# temporales por par (punto, carga) en campo_potencial: dx, dy, r, 1/r, coef, coef*d
+_TEMPORALES_POR_PAR = 6
+
+
+def _tile_shape(ny, nx, n_cargas, mem_mb, itemsize=8):
+    """Tamaño de bloque (filas, columnas) cuyos temporales caben en mem_mb megabytes."""
+    puntos = max(1, int(mem_mb * 2**20) // (_TEMPORALES_POR_PAR * itemsize * max(n_cargas, 1)))
+    tw = min(nx, puntos)
+    th = min(ny, max(1, puntos // tw))
+    return th, tw
+
+
+def _kernel_malla(Q, backend, theta, precision='float64'):
+    """Devuelve (kernel, pares_por_punto) para evaluar bloques de malla con el backend pedido.
+
+    El kernel se llama como kernel(X, Y, con_campo=..., con_potencial=...) y debe
+    poder serializarse para mandarlo a los procesos del pool. `precision` sólo
+    cambia el kernel directo; Barnes-Hut calcula en float64 y se guarda en la salida pedida.
+    """
+    if backend == 'directo':
+        return partial(campo_potencial, cargas=Q, precision=precision), len(Q)
+    if backend == 'barnes_hut':
+        from .barnes_hut import ArbolCargas
+        arbol = ArbolCargas(Q, theta=theta)
+        return arbol.campo_potencial, arbol.pares_por_punto
+    raise ValueError(f'backend desconocido: {backend!r}')
+
+
+def _espejo_en_y(y, Q):
+    """Fila desde la que hay que evaluar si las cargas están sobre una recta y = y0 y el eje y
+    es simétrico respecto de y0 (fila i espejo de la fila n-1-i); None si no hay simetría."""
+    if len(Q) == 0 or y.size < 2 or not np.all(Q[:, 2] == Q[0, 2]):
+        return None
+    escala = max(np.abs(y).max(), 1.0)
+    if not np.allclose(y + y[::-1], 2 * Q[0, 2], rtol=0.0, atol=1e-12 * escala):
+        return None
+    return y.size // 2
+
+
+def evaluar_malla(x, y, cargas, con_campo=True, con_potencial=True, mem_mb=256, out=None, workers=1,
+                  backend='directo', theta=0.5, simetria=True, precision='float64'):
+    """Evalúa `campo_potencial` sobre la malla x × y (ejes 1D) por bloques.
+
+    La malla se recorre en bloques cuyo tamaño se ajusta para que los temporales
+    de un bloque no superen `mem_mb` megabytes; cada bloque se escribe en la
+    salida apenas termina, así nunca se arma el arreglo n × n × N_cargas completo.
+    `out` permite pasar los arreglos (Ex, Ey, V) de salida ya reservados (por
+    ejemplo memmaps); las entradas pueden ser None para salidas no pedidas.
+    Con `workers > 1` las filas se reparten entre procesos (ver `_evaluar_malla_paralela`).
+    `backend='barnes_hut'` usa el árbol de `barnes_hut.ArbolCargas` con ángulo de
+    apertura `theta` en lugar de la suma directa (conviene con miles de cargas), y
+    `backend='particle_mesh'` resuelve toda la malla por FFT (`particle_mesh`); este
+    último necesita ejes uniformes e ignora `mem_mb` y `workers`.
+    Si las cargas son colineales sobre una recta y = y0 y el eje y es simétrico
+    respecto de y0, V es par y Ey impar en (y - y0): sólo se evalúa la mitad
+    superior y la otra se obtiene por reflexión (`simetria=False` fuerza la malla completa).
+    Con `precision='float32'` las salidas que se reservan acá son float32 y el backend
+    directo calcula en float32 acumulando en float64 (ver `campo_potencial`).
+
+    Devuelve (Ex, Ey, V) con forma (len(y), len(x)); las salidas no pedidas son None.
+    """
+    tipo = _tipo(precision)
+    Q = _charge_array(cargas)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    shape = (y.size, x.size)
+
+    if out is None:
+        out = (None, None, None)
+    Ex, Ey, V = out
+    if con_campo:
+        Ex = np.empty(shape, tipo) if Ex is None else Ex
+        Ey = np.empty(shape, tipo) if Ey is None else Ey
+    else:
+        Ex = Ey = None
+    V = (np.empty(shape, tipo) if V is None else V) if con_potencial else None
+
+    m = _espejo_en_y(y, Q) if simetria and backend != 'particle_mesh' else None
+    if m:
+        evaluar_malla(x, y[m:], Q, con_campo=con_campo, con_potencial=con_potencial, mem_mb=mem_mb,
+                      out=tuple(None if a is None else a[m:] for a in (Ex, Ey, V)), workers=workers,
+                      backend=backend, theta=theta, simetria=False, precision=precision)
+        # fila i <- fila n-1-i para i < m
+        espejo = slice(shape[0] - 1, shape[0] - 1 - m, -1)
+        if con_potencial:
+            V[:m] = V[espejo]
+        if con_campo:
+            Ex[:m] = Ex[espejo]
+            Ey[:m] = -Ey[espejo]
+        return Ex, Ey, V
+
+    if backend == 'particle_mesh':
+        from .particle_mesh import campo_potencial_malla
+        bEx, bEy, bV = campo_potencial_malla(x, y, Q, con_campo=con_campo, con_potencial=con_potencial)
+        for a, b in ((Ex, bEx), (Ey, bEy), (V, bV)):
+            if a is not None:
+                a[...] = b
+        return Ex, Ey, V
+
+    kernel, pares = _kernel_malla(Q, backend, theta, precision)
+    if workers > 1 and shape[0] > 1:
+        _evaluar_malla_paralela(x, y, kernel, pares, (Ex, Ey, V), mem_mb, workers, tipo)
+    else:
+        _evaluar_bloques(x, y, kernel, pares, (Ex, Ey, V), mem_mb, np.dtype(tipo).itemsize)
+    return Ex, Ey, V
+
+
+def _evaluar_bloques(x, y, kernel, pares, out, mem_mb, itemsize=8):
+    Ex, Ey, V = out
+    con_campo = Ex is not None
+    con_potencial = V is not None
+    th, tw = _tile_shape(y.size, x.size, pares, mem_mb, itemsize)
+    for i0 in range(0, y.size, th):
+        i1 = min(i0 + th, y.size)
+        for j0 in range(0, x.size, tw):
+            j1 = min(j0 + tw, x.size)
+            Xb, Yb = np.meshgrid(x[j0:j1], y[i0:i1])
+            bEx, bEy, bV = kernel(Xb, Yb, con_campo=con_campo, con_potencial=con_potencial)
+            if con_campo:
+                Ex[i0:i1, j0:j1] = bEx
+                Ey[i0:i1, j0:j1] = bEy
+            if con_potencial:
+                V[i0:i1, j0:j1] = bV
+
+
+# estado de cada proceso del pool: ejes, kernel y salidas en memoria compartida
+_worker_state = {}
+
+
+def _init_worker(nombres, shape, x, y, kernel, pares, mem_mb, tipo=np.float64):
+    from multiprocessing import shared_memory
+
+    segmentos = [None if nombre is None else shared_memory.SharedMemory(name=nombre) for nombre in nombres]
+    salidas = [None if seg is None else np.ndarray(shape, dtype=tipo, buffer=seg.buf) for seg in segmentos]
+    _worker_state.update(segmentos=segmentos, salidas=salidas, x=x, y=y, kernel=kernel, pares=pares,
+                         mem_mb=mem_mb, itemsize=np.dtype(tipo).itemsize)
+
+
+def _evaluar_filas(i0, i1):
+    st = _worker_state
+    vistas = tuple(None if a is None else a[i0:i1] for a in st['salidas'])
+    _evaluar_bloques(st['x'], st['y'][i0:i1], st['kernel'], st['pares'], vistas, st['mem_mb'], st['itemsize'])
+    return i0, i1
+
+
+def _evaluar_malla_paralela(x, y, kernel, pares, out, mem_mb, workers, tipo=np.float64):
+    """Reparte bloques de filas entre `workers` procesos.
+
+    Cada proceso escribe directamente en arreglos de `multiprocessing.shared_memory`,
+    así los resultados no se serializan de vuelta; al final se copian a `out`.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import shared_memory
+
+    shape = (y.size, x.size)
+    nbytes = shape[0] * shape[1] * np.dtype(tipo).itemsize
+    segmentos = [None if a is None else shared_memory.SharedMemory(create=True, size=nbytes) for a in out]
+    try:
+        nombres = [None if seg is None else seg.name for seg in segmentos]
+        # unos cuantos bloques por proceso para balancear la carga
+        n_bloques = min(shape[0], 4 * workers)
+        limites = np.linspace(0, shape[0], n_bloques + 1).astype(int)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(nombres, shape, x, y, kernel, pares, mem_mb / workers, tipo)) as pool:
+            list(pool.map(_evaluar_filas, limites[:-1], limites[1:]))
+        for a, seg in zip(out, segmentos):
+            if seg is not None:
+                a[...] = np.ndarray(shape, dtype=tipo, buffer=seg.buf)
+    finally:
+        for seg in segmentos:
+            if seg is not None:
+                seg.close()
+                seg.unlink()
+
+
+def compute_1d_along_x(cargas, x_min=-3, x_max=3, n=400, precision='float64'):
+    """Perfiles E_x(x, 0) y V(x, 0): totales y contribución de cada carga.
+
+    Con `precision='float32'` todos los arreglos devueltos (salvo x_vals) son float32;
+    los totales se acumulan en float64 (ver `campo_potencial`).
+    """
+    tipo = _tipo(precision)
+    x_vals = np.linspace(x_min, x_max, n)
+    Q = _charge_array(cargas)
+
+    E_total, _, V_total = campo_potencial(x_vals, 0.0, Q, precision=precision)
+
+    # contribuciones individuales: una fila por carga (nan sobre la carga)
+    dx = np.subtract(x_vals[None, :], Q[:, 1:2], out=np.empty((len(Q), n), tipo), casting='same_kind')
+    r = _dist(dx.T, (-Q[:, 2]).astype(tipo), Q).T
+    kq = (k * Q[:, 0:1]).astype(tipo)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        E_individual = np.where(r != 0.0, kq * dx / r**3, np.nan).astype(tipo, copy=False)
+        V_individual = np.where(r != 0.0, kq / r, np.nan).astype(tipo, copy=False)
+
+    return x_vals, E_total, V_total, E_individual, V_individual
+
+
+def desviacion_precision(x, y, cargas, Ex=None, Ey=None, V=None, n=1000, seed=0):
+    """Desviación de resultados en float32 (o cualquier precisión) respecto de float64.
+
+    x, y: coordenadas de los puntos, con broadcast contra la forma de los resultados
+    (una malla se pasa como x[None, :], y[:, None]; un perfil como x_vals, 0.0).
+    Se eligen hasta `n` puntos al azar y se recalculan con `campo_potencial` en float64.
+    Igual que en `barnes_hut.ArbolCargas.error_muestra`, los errores se normalizan por
+    el valor cuadrático medio de la referencia en la muestra (así no explotan donde V o
+    |E| pasan por cero). Con `Ey=None` se compara sólo Ex (perfiles sobre el eje x).
+    Devuelve un dict con 'V_max', 'V_rms' y/o 'E_max', 'E_rms' según las salidas que se pasen.
+    """
+    forma = np.shape(V if V is not None else Ex)
+    total = int(np.prod(forma))
+    rng = np.random.default_rng(seed)
+    idx = np.unravel_index(rng.choice(total, size=min(n, total), replace=False), forma)
+    xs = np.broadcast_to(np.asarray(x, dtype=float), forma)[idx]
+    ys = np.broadcast_to(np.asarray(y, dtype=float), forma)[idx]
+    Ex_d, Ey_d, V_d = campo_potencial(xs, ys, cargas, con_campo=Ex is not None, con_potencial=V is not None)
+
+    informe = {}
+    if V is not None:
+        err_V = np.abs(np.asarray(V[idx], dtype=float) - V_d) / np.sqrt(np.mean(V_d**2))
+        informe.update(V_max=float(err_V.max()), V_rms=float(np.sqrt(np.mean(err_V**2))))
+    if Ex is not None:
+        if Ey is None:
+            err_E = np.abs(Ex[idx] - Ex_d) / np.sqrt(np.mean(Ex_d**2))
+        else:
+            err_E = np.hypot(Ex[idx] - Ex_d, Ey[idx] - Ey_d) / np.sqrt(np.mean(Ex_d**2 + Ey_d**2))
+        informe.update(E_max=float(err_E.max()), E_rms=float(np.sqrt(np.mean(err_E**2))))
+    return informe
+
+
+def compute_1d_along_x_lote(Qs, posiciones=None, x_min=-3, x_max=3, n=400):
+    """Como `compute_1d_along_x`, pero para C configuraciones con las mismas posiciones.
+
+    Qs: (C, N). Por defecto las posiciones son POSICIONES sobre el eje x.
+    Devuelve x_vals (n,), E_total y V_total (C, n), E_individual y V_individual (C, N, n).
+    """
+    Qs = np.atleast_2d(np.asarray(Qs, dtype=float))
+    if posiciones is None:
+        posiciones = [(xq, 0.0) for xq in POSICIONES]
+    P = np.asarray(posiciones, dtype=float).reshape(-1, 2)
+    x_vals = np.linspace(x_min, x_max, n)
+
+    # factores geométricos por posición (compartidos por todas las configuraciones)
+    dx = x_vals[None, :] - P[:, 0:1]
+    r = np.hypot(dx, P[:, 1:2])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        gE = np.where(r != 0.0, k * dx / r**3, np.nan)
+        gV = np.where(r != 0.0, k / r, np.nan)
+    E_individual = Qs[:, :, None] * gE
+    V_individual = Qs[:, :, None] * gV
+    E_total = np.nansum(E_individual, axis=1)
+    V_total = np.nansum(V_individual, axis=1)
+    return x_vals, E_total, V_total, E_individual, V_individual
+
+
+def E_en_x_factory(cargas):
+    def E_en_x(x):
+        Ex, _ = campo(x, 0.0, cargas)
+        return Ex
+    return E_en_x
+
+
+def _simple_fsolve(func, x0, maxiter=200, tol=1e-6):
+    x0 = float(x0)
+    dx = 1e-3 if abs(x0) < 1.0 else 1e-2
+    x1 = x0
+    x2 = x0 + dx
+    f1 = func(x1)
+    f2 = func(x2)
+    for _ in range(maxiter):
+        if abs(f2 - f1) < 1e-14:
+            break
+        x3 = x2 - f2 * (x2 - x1) / (f2 - f1)
+        if abs(x3 - x2) < tol:
+            return np.array([x3])
+        x1, f1 = x2, f2
+        x2 = x3
+        f2 = func(x2)
+    raise RuntimeError("simple_fsolve no convergió")
+
+
+def _Ex_y_derivada_en_eje(xs, Q):
+    """Ex(x, 0) y su derivada analítica dEx/dx sobre el eje x, para un arreglo de xs."""
+    dx = xs[:, None] - Q[:, 1]
+    r = _dist(dx, -Q[:, 2], Q)
+    inv_r = np.divide(1.0, r, out=np.zeros_like(r), where=r != 0.0)
+    kq = k * Q[:, 0]
+    inv_r3 = inv_r**3
+    Ex = (dx * inv_r3) @ kq
+    # d/dx (dx / r^3) = 1/r^3 - 3 dx^2 / r^5
+    dEx = (inv_r3 - 3 * dx**2 * inv_r3 * inv_r**2) @ kq
+    return Ex, dEx
+
+
+def equilibrios_en_x(cargas, x_vals, E_total, tol=1e-12, maxiter=100):
+    """Puntos de equilibrio (Ex = 0) sobre el eje x a partir del perfil ya calculado.
+
+    Busca los cambios de signo de `E_total` (de `compute_1d_along_x`), descarta los
+    intervalos que contienen una carga sobre el eje (ahí E cambia de signo por la
+    singularidad, no por un cero) y refina todos los intervalos a la vez con Newton
+    usando dEx/dx analítica, con bisección como respaldo cuando Newton sale del intervalo.
+    Los ceros dobles (E toca 0 sin cambiar de signo) no se detectan.
+
+    Devuelve la lista ordenada de raíces.
+    """
+    Q = _charge_array(cargas)
+    x_vals = np.asarray(x_vals, dtype=float)
+    E_total = np.asarray(E_total, dtype=float)
+
+    exactos = x_vals[E_total == 0.0]
+    i = np.nonzero(np.sign(E_total[:-1]) * np.sign(E_total[1:]) < 0)[0]
+    a, b = x_vals[i], x_vals[i + 1]
+    fa = E_total[i]
+
+    en_eje = Q[:, 2] == 0.0
+    if Q.shape[1] == 4:
+        en_eje &= Q[:, 3] == 0.0
+    xq = Q[en_eje, 1]
+    singular = np.any((xq[None, :] >= a[:, None]) & (xq[None, :] <= b[:, None]), axis=1)
+    a, b, fa = a[~singular], b[~singular], fa[~singular]
+
+    x = (a + b) / 2
+    activos = np.ones(x.size, dtype=bool)
+    for _ in range(maxiter):
+        if not activos.any():
+            break
+        f, df = _Ex_y_derivada_en_eje(x[activos], Q)
+        xa, aa, ba, faa = x[activos], a[activos], b[activos], fa[activos]
+        # achicar el intervalo manteniendo el cambio de signo
+        mismo = np.sign(f) == np.sign(faa)
+        aa = np.where(mismo, xa, aa)
+        faa = np.where(mismo, f, faa)
+        ba = np.where(mismo, ba, xa)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            xn = xa - f / df
+        fuera = ~np.isfinite(xn) | (xn <= aa) | (xn >= ba)
+        xn = np.where(fuera, (aa + ba) / 2, xn)
+        listo = (f == 0.0) | (np.abs(xn - xa) <= tol * (1.0 + np.abs(xa)))
+        xn = np.where(f == 0.0, xa, xn)
+        x[activos], a[activos], b[activos], fa[activos] = xn, aa, ba, faa
+        idx = np.nonzero(activos)[0]
+        activos[idx[listo]] = False
+
+    return sorted(float(r) for r in np.concatenate([exactos, x]))
+
+
+def __getattr__(nombre):
+    # `fsolve` de scipy se importa recién cuando alguien lo pide (None si scipy no está)
+    if nombre == 'fsolve':
+        try:
+            from scipy.optimize import fsolve
+        except Exception:
+            fsolve = None
+        globals()['fsolve'] = fsolve
+        return fsolve
+    raise AttributeError(f'module {__name__!r} has no attribute {nombre!r}')
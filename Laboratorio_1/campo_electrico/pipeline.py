@@ -0,0 +1,108 @@
+"""Pipeline de etapas con dependencias, en un solo proceso.
+
+Cada etapa es una función que recibe, en orden, los resultados de las etapas de
+las que depende:
+
+    p = Pipeline(workers=4)
+    p.etapa('cargas', lambda: generate_charges('two_pos'))
+    p.etapa('perfil', compute_1d_along_x, ['cargas'])
+    p.etapa('fig_perfil', graficar, ['perfil'], grupo='pyplot')
+    p.correr()
+
+Así:
+  - cada etapa corre a lo sumo una vez, aunque varias la necesiten (los resultados
+    quedan en `p.resultados`, y un `correr` posterior no la repite),
+  - las etapas cuyas dependencias ya están listas corren a la vez en un pool de hilos
+    (NumPy y el guardado de archivos liberan el GIL en las partes pesadas),
+  - las etapas de un mismo `grupo` no se solapan entre sí; sirve para lo que comparte
+    estado global, como las figuras de pyplot, que igual se solapan con los cálculos.
+
+Como una etapa sólo puede depender de etapas ya declaradas, no hay ciclos.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class Pipeline:
+    def __init__(self, workers=4):
+        self.workers = workers
+        self._etapas = {}        # nombre -> (funcion, dependencias, grupo)
+        self.resultados = {}
+        self.tiempos = {}        # nombre -> (inicio, fin) [s] desde el comienzo de `correr`
+        self.tiempo_total = 0.0
+
+    def etapa(self, nombre, funcion, dependencias=(), grupo=None):
+        """Declara una etapa. Devuelve `nombre` para poder encadenar dependencias."""
+        if nombre in self._etapas:
+            raise ValueError(f'etapa repetida: {nombre!r}')
+        for d in dependencias:
+            if d not in self._etapas:
+                raise ValueError(f'etapa {nombre!r}: dependencia desconocida {d!r}')
+        self._etapas[nombre] = (funcion, tuple(dependencias), grupo)
+        return nombre
+
+    def _necesarias(self, objetivos):
+        """Los objetivos y todas sus dependencias, en orden de declaración."""
+        marcadas = set()
+        pila = list(objetivos)
+        while pila:
+            nombre = pila.pop()
+            if nombre not in self._etapas:
+                raise KeyError(f'etapa desconocida: {nombre!r}')
+            if nombre not in marcadas:
+                marcadas.add(nombre)
+                pila.extend(self._etapas[nombre][1])
+        return [n for n in self._etapas if n in marcadas]
+
+    def _ejecutar(self, nombre, t0):
+        funcion, dependencias, _ = self._etapas[nombre]
+        inicio = time.perf_counter() - t0
+        resultado = funcion(*(self.resultados[d] for d in dependencias))
+        self.tiempos[nombre] = (inicio, time.perf_counter() - t0)
+        return resultado
+
+    def correr(self, objetivos=None):
+        """Corre los `objetivos` (por defecto todas las etapas) y lo que necesiten.
+
+        Devuelve `self.resultados`. Si una etapa falla se esperan las que ya estaban
+        corriendo y se levanta RuntimeError con el nombre de la etapa.
+        """
+        orden = self._necesarias(self._etapas if objetivos is None else objetivos)
+        pendientes = [n for n in orden if n not in self.resultados]
+        self.tiempos = {}
+        t0 = time.perf_counter()
+        en_curso = {}
+        grupos_ocupados = set()
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while pendientes or en_curso:
+                for nombre in list(pendientes):
+                    _, dependencias, grupo = self._etapas[nombre]
+                    if len(en_curso) >= self.workers:
+                        break
+                    if grupo in grupos_ocupados or any(d not in self.resultados for d in dependencias):
+                        continue
+                    pendientes.remove(nombre)
+                    if grupo is not None:
+                        grupos_ocupados.add(grupo)
+                    en_curso[pool.submit(self._ejecutar, nombre, t0)] = nombre
+                hechos, _ = wait(en_curso, return_when=FIRST_COMPLETED)
+                for futuro in hechos:
+                    nombre = en_curso.pop(futuro)
+                    grupos_ocupados.discard(self._etapas[nombre][2])
+                    try:
+                        self.resultados[nombre] = futuro.result()
+                    except Exception as exc:
+                        raise RuntimeError(f'falló la etapa {nombre!r}: {exc}') from exc
+        self.tiempo_total = time.perf_counter() - t0
+        return self.resultados
+
+    def resumen(self):
+        """Texto con el tiempo de cada etapa y el total de la última corrida."""
+        lineas = [f"{'etapa':<28} {'inicio [s]':>10} {'duración [s]':>12}"]
+        for nombre, (inicio, fin) in sorted(self.tiempos.items(), key=lambda it: it[1][0]):
+            lineas.append(f'{nombre:<28} {inicio:>10.3f} {fin - inicio:>12.3f}')
+        suma = sum(fin - inicio for inicio, fin in self.tiempos.values())
+        lineas.append(f'Total: {self.tiempo_total:.3f} s de reloj '
+                      f'({suma:.3f} s sumando las etapas)')
+        return '\n'.join(lineas)
@@ -0,0 +1,121 @@
+"""Puntos críticos del campo en todo el plano (E = 0): equilibrios y sillas de V.
+
+`equilibrios_en_x` sólo mira el eje y = 0. Aquí se recorre la malla 2D ya
+calculada (Ex, Ey de `compute_and_plot_2d`): las celdas donde Ex y Ey cambian
+de signo entre sus cuatro esquinas son candidatas; todas se refinan a la vez con
+Newton 2x2 usando el jacobiano analítico del campo, y cada punto se clasifica con
+el hessiano de V (que es menos el jacobiano de E).
+"""
+
+import numpy as np
+
+from .nucleo import k, _charge_array, _dist
+
+
+def campo_y_jacobiano(x, y, cargas):
+    """Ex, Ey y las derivadas dEx/dx, dEx/dy (= dEy/dx), dEy/dy en los puntos (x, y)."""
+    Q = _charge_array(cargas)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    dx = x[..., None] - Q[:, 1]
+    dy = y[..., None] - Q[:, 2]
+    r = _dist(dx, dy, Q)
+    inv_r = np.divide(1.0, r, out=np.zeros_like(r), where=r != 0.0)
+    kq = k * Q[:, 0]
+    inv_r3 = inv_r**3
+    inv_r5 = inv_r3 * inv_r**2
+    Ex = (dx * inv_r3) @ kq
+    Ey = (dy * inv_r3) @ kq
+    dExdx = (inv_r3 - 3 * dx * dx * inv_r5) @ kq
+    dExdy = (-3 * dx * dy * inv_r5) @ kq
+    dEydy = (inv_r3 - 3 * dy * dy * inv_r5) @ kq
+    return Ex, Ey, dExdx, dExdy, dEydy
+
+
+def _cambia_signo(F):
+    """Celdas (ny-1, nx-1) cuyas cuatro esquinas no tienen todas el mismo signo."""
+    s = np.sign(F)
+    esquinas = (s[:-1, :-1], s[:-1, 1:], s[1:, :-1], s[1:, 1:])
+    return np.minimum.reduce(esquinas) != np.maximum.reduce(esquinas)
+
+
+def clasificar(dExdx, dExdy, dEydy):
+    """Tipo de punto crítico según el hessiano de V, H = -J(E)."""
+    det = dExdx * dEydy - dExdy**2
+    traza = -(dExdx + dEydy)
+    return np.where(det < 0, 'silla', np.where(det > 0, np.where(traza > 0, 'mínimo', 'máximo'), 'degenerado'))
+
+
+def puntos_criticos(cargas, x, y, Ex, Ey, tol=1e-10, maxiter=50):
+    """Busca E = 0 en la malla x × y (ejes 1D) a partir de Ex, Ey ya evaluados.
+
+    Se descartan las celdas que contienen una carga (ahí E cambia de signo por la
+    singularidad) y los refinamientos que se salen de su celda de partida, lo que
+    además evita contar dos veces el mismo punto.
+
+    Devuelve una lista ordenada de tuplas (x, y, tipo) con tipo en
+    'silla', 'mínimo', 'máximo' o 'degenerado'.
+    """
+    Q = _charge_array(cargas)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    candidatas = _cambia_signo(Ex) & _cambia_signo(Ey)
+
+    # celdas con una carga adentro (cargas en el plano)
+    en_plano = Q[:, 3] == 0.0 if Q.shape[1] == 4 else np.ones(len(Q), dtype=bool)
+    jq = np.searchsorted(x, Q[en_plano, 1], side='right') - 1
+    iq = np.searchsorted(y, Q[en_plano, 2], side='right') - 1
+    dentro = (jq >= 0) & (jq < x.size - 1) & (iq >= 0) & (iq < y.size - 1)
+    # se descarta su celda y, por si la carga cae justo sobre una línea de la malla, las vecinas de abajo/izquierda
+    for di in (-1, 0):
+        for dj in (-1, 0):
+            i, j = iq + di, jq + dj
+            ok = dentro & (i >= 0) & (j >= 0)
+            candidatas[i[ok], j[ok]] = False
+
+    i, j = np.nonzero(candidatas)
+    x0, x1 = x[j], x[j + 1]
+    y0, y1 = y[i], y[i + 1]
+    px = (x0 + x1) / 2
+    py = (y0 + y1) / 2
+    escala = np.hypot(x1 - x0, y1 - y0)
+
+    for _ in range(maxiter):
+        if px.size == 0:
+            break
+        fx, fy, a, b, d = campo_y_jacobiano(px, py, Q)
+        det = a * d - b * b
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sx = (d * fx - b * fy) / det
+            sy = (a * fy - b * fx) / det
+        ok = np.isfinite(sx) & np.isfinite(sy)
+        px = np.where(ok, px - sx, px)
+        py = np.where(ok, py - sy, py)
+        if np.all(~ok | (np.hypot(sx, sy) <= tol * escala)):
+            break
+
+    fx, fy, a, b, d = campo_y_jacobiano(px, py, Q)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        paso = np.hypot(d * fx - b * fy, a * fy - b * fx) / np.abs(a * d - b * b)
+    margen = 1e-9 * escala
+    propia = (px >= x0 - margen) & (px <= x1 + margen) & (py >= y0 - margen) & (py <= y1 + margen)
+    propia &= paso <= 1e-6 * escala
+    px, py, escala = px[propia], py[propia], escala[propia]
+    if px.size == 0:
+        return []
+
+    # cargas sobre el eje x: Ey = 0 en y = 0 por simetría, los puntos del eje quedan con |y| ~ 1e-45
+    if np.all(Q[:, 2] == 0.0):
+        py = np.where(np.abs(py) <= 1e-6 * escala, 0.0, py)
+
+    # puntos sobre un borde compartido aparecen en las dos celdas vecinas: se queda el primero
+    # de cada grupo a menos de 1e-6 * escala (por distancia, no redondeando a una red)
+    orden = np.lexsort((py, px))
+    px, py, escala = px[orden], py[orden], escala[orden]
+    cerca = np.hypot(px[:, None] - px, py[:, None] - py) <= 1e-6 * np.minimum(escala[:, None], escala)
+    unicos = ~np.triu(cerca, 1).any(axis=0)
+    px, py = px[unicos], py[unicos]
+
+    _, _, a, b, d = campo_y_jacobiano(px, py, Q)
+    tipos = clasificar(a, b, d)
+    return sorted((float(xc), float(yc), str(t)) for xc, yc, t in zip(px, py, tipos))
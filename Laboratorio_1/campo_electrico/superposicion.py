@@ -0,0 +1,133 @@
+"""Malla de campo/potencial que se actualiza por superposición al mover o editar una carga.
+
+Como E y V son lineales en las cargas, cambiar una sola carga no requiere
+recalcular la malla entera: alcanza con restar su contribución vieja y sumar la
+nueva, O(malla) en lugar de O(malla × cargas). `MallaSuperposicion` guarda la
+suma total y, mientras entren en `presupuesto_mb`, las contribuciones de las
+cargas usadas más recientemente (LRU); las que no entran se recalculan cuando
+hacen falta, que también es O(malla).
+
+Restar y sumar muchas veces acumula error de redondeo (sobre todo cerca de las
+cargas, donde 1/r es grande), así que cada `max_actualizaciones` se recalcula
+todo desde cero con `evaluar_malla`.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+from .conjunto_cargas import ConjuntoCargas
+from .nucleo import _charge_array, campo_potencial, evaluar_malla
+
+
+class MallaSuperposicion:
+    """Ex, Ey, V sobre la malla x × y (ejes 1D) de un conjunto de cargas editable.
+
+    Ejemplo (una carga que se desliza sobre el eje x):
+        malla = MallaSuperposicion(x, y, cargas)
+        for xq in np.linspace(-2, 2, 50):
+            malla.mover(0, x=xq)
+            ... usar malla.V, malla.Ex, malla.Ey ...
+    """
+
+    def __init__(self, x, y, cargas, con_campo=True, con_potencial=True, presupuesto_mb=512,
+                 max_actualizaciones=1000, mem_mb=256):
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self.Q = np.array(_charge_array(cargas), dtype=float)
+        self.con_campo = con_campo
+        self.con_potencial = con_potencial
+        self.presupuesto_mb = presupuesto_mb
+        self.max_actualizaciones = max_actualizaciones
+        self.mem_mb = mem_mb
+        self._contribuciones = OrderedDict()
+        self.recalcular()
+
+    @property
+    def cargas(self):
+        return ConjuntoCargas.desde_arreglo(self.Q)
+
+    def recalcular(self):
+        """Recalcula la malla completa (suma directa por bloques) y vacía las contribuciones guardadas."""
+        self.Ex, self.Ey, self.V = evaluar_malla(self.x, self.y, self.Q, con_campo=self.con_campo,
+                                                 con_potencial=self.con_potencial, mem_mb=self.mem_mb)
+        self._contribuciones.clear()
+        self._actualizaciones = 0
+
+    # --- contribuciones individuales ---------------------------------------------------------------
+    def _calcular(self, fila):
+        return campo_potencial(self.x[None, :], self.y[:, None], fila[None, :], con_campo=self.con_campo,
+                               con_potencial=self.con_potencial)
+
+    def _bytes_contribucion(self):
+        return (2 * self.con_campo + self.con_potencial) * self.x.size * self.y.size * 8
+
+    def _guardar(self, i, contribucion):
+        limite = self.presupuesto_mb * 2**20 // max(self._bytes_contribucion(), 1)
+        if limite < 1:
+            return
+        self._contribuciones[i] = contribucion
+        self._contribuciones.move_to_end(i)
+        while len(self._contribuciones) > limite:
+            self._contribuciones.popitem(last=False)
+
+    def contribucion(self, i):
+        """(Ex, Ey, V) de la carga i sola; la guarda si entra en el presupuesto de memoria."""
+        if i in self._contribuciones:
+            self._contribuciones.move_to_end(i)
+            return self._contribuciones[i]
+        c = self._calcular(self.Q[i])
+        self._guardar(i, c)
+        return c
+
+    def _sumar(self, contribucion, signo):
+        for total, parte in zip((self.Ex, self.Ey, self.V), contribucion):
+            if parte is not None:
+                if signo > 0:
+                    total += parte
+                else:
+                    total -= parte
+
+    # --- ediciones ---------------------------------------------------------------------------------
+    def _despues_de_editar(self):
+        self._actualizaciones += 1
+        if self._actualizaciones >= self.max_actualizaciones:
+            self.recalcular()
+
+    def actualizar(self, i, q=None, x=None, y=None):
+        """Cambia la magnitud y/o la posición de la carga i (los argumentos None no cambian)."""
+        self._sumar(self.contribucion(i), -1)
+        self._contribuciones.pop(i, None)
+        for col, valor in ((0, q), (1, x), (2, y)):
+            if valor is not None:
+                self.Q[i, col] = valor
+        self._sumar(self.contribucion(i), +1)
+        self._despues_de_editar()
+
+    def mover(self, i, x=None, y=None):
+        self.actualizar(i, x=x, y=y)
+
+    def agregar(self, q, x, y, z=0.0):
+        """Agrega una carga al final y devuelve su índice."""
+        fila = [q, x, y, z][:self.Q.shape[1]]
+        self.Q = np.vstack([self.Q, fila])
+        i = self.Q.shape[0] - 1
+        self._sumar(self.contribucion(i), +1)
+        self._despues_de_editar()
+        return i
+
+    def quitar(self, i):
+        """Quita la carga i (los índices de las cargas siguientes bajan en uno)."""
+        self._sumar(self.contribucion(i), -1)
+        self.Q = np.delete(self.Q, i, axis=0)
+        self._contribuciones = OrderedDict((j - (j > i), c) for j, c in self._contribuciones.items() if j != i)
+        self._despues_de_editar()
+
+
+def deslizar_carga(malla, i, posiciones, eje='x'):
+    """Barrido de parámetros: mueve la carga i por `posiciones` sobre un eje y devuelve
+    (posición, Ex, Ey, V) en cada paso. Los arreglos son los de la malla (se sobreescriben
+    en el paso siguiente): copiarlos si hay que conservarlos."""
+    for p in posiciones:
+        malla.mover(i, **{eje: p})
+        yield p, malla.Ex, malla.Ey, malla.V